@@ -1,6 +1,7 @@
 """
 Authentication utilities for TunService website
 """
+from .api_client import AuthApiClient, AuthApiError, is_auth_api_available
 from .basic_auth import login
 
-__all__ = ['login']
+__all__ = ['login', 'AuthApiClient', 'AuthApiError', 'is_auth_api_available']
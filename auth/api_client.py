@@ -0,0 +1,155 @@
+import base64
+import logging
+import time
+
+from playwright.sync_api import (
+    APIRequestContext,
+    APIResponse,
+    BrowserContext,
+    Playwright,
+)
+
+from config.auth_config import (
+    AUTH_API_LOGIN,
+    AUTH_API_LOGIN_CODE,
+    AUTH_API_REGISTER,
+    BASE_URL,
+    OTP_CODE,
+    PASSWORD,
+    USERNAME,
+)
+from config.timeouts import Timeouts
+from utils.rate_limiter import get_auth_rate_limiter
+
+# Statuses meaning the endpoint does not exist on this stand (not a failure of one call)
+UNAVAILABLE_STATUSES = (404, 405)
+
+# Set after the first 404/405 - the rest of the session goes straight to UI fallback
+_unavailable_reason: str | None = None
+
+
+class AuthApiError(Exception):
+    """Raised when auth API returns unexpected status"""
+
+
+def is_auth_api_available() -> bool:
+    """False once any auth endpoint answered 404/405 in this session"""
+    return _unavailable_reason is None
+
+
+def _disable_auth_api(reason: str) -> None:
+    global _unavailable_reason
+
+    if _unavailable_reason is None:
+        _unavailable_reason = reason
+        logging.warning(f"Auth API disabled for the rest of the session: {reason}")
+
+
+class AuthApiClient:
+    """Headless registration and login through /api-v1/auth/ endpoints"""
+
+    MAX_RETRIES = 3
+
+    def __init__(self, request_context: APIRequestContext):
+        self.request = request_context
+
+    @classmethod
+    def from_playwright(cls, playwright: Playwright, extra_http_headers: dict | None = None) -> "AuthApiClient":
+        """Create client with its own APIRequestContext (cookies are kept inside it)"""
+        credentials = f"{USERNAME}:{PASSWORD}"
+        encoded_credentials = base64.b64encode(credentials.encode()).decode()
+
+        headers = {"Authorization": f"Basic {encoded_credentials}"}
+        headers.update(extra_http_headers or {})
+
+        request_context = playwright.request.new_context(
+            base_url=BASE_URL.rstrip("/"),
+            extra_http_headers=headers,
+            timeout=Timeouts.Api.AUTH_RESPONSE,
+        )
+        return cls(request_context)
+
+    @staticmethod
+    def register_payload(email: str) -> dict:
+        """Body the registration form sends to AUTH_API_REGISTER"""
+        return {"email": email}
+
+    @staticmethod
+    def login_payload(email: str) -> dict:
+        """Body the login form sends to AUTH_API_LOGIN"""
+        return {"email": email}
+
+    @staticmethod
+    def login_code_payload(email: str, code: str) -> dict:
+        """Body the OTP form sends to AUTH_API_LOGIN_CODE"""
+        return {"email": email, "code": code}
+
+    def _post(self, endpoint: str, data: dict) -> APIResponse:
+        """POST JSON through shared rate limiter, retrying on HTTP 429 with Retry-After header"""
+        if _unavailable_reason:
+            raise AuthApiError(f"Auth API is disabled: {_unavailable_reason}")
+
+        response = None
+        rate_limiter = get_auth_rate_limiter()
+
+        for attempt in range(self.MAX_RETRIES):
+            rate_limiter.acquire()
+            response = self.request.post(endpoint, data=data)
+
+            if response.status != 429 or attempt == self.MAX_RETRIES - 1:
+                break
+
+            retry_after = response.headers.get("retry-after", "")
+            delay = float(retry_after) if retry_after.isdigit() else 2 ** attempt
+            logging.warning(f"HTTP 429 from {endpoint}, retrying in {delay}s (attempt {attempt + 1})")
+            time.sleep(delay)
+
+        return response
+
+    def _check_response(self, response: APIResponse, action: str) -> None:
+        if response.status in UNAVAILABLE_STATUSES:
+            _disable_auth_api(f"HTTP {response.status} {response.url}")
+
+        if not response.ok:
+            raise AuthApiError(f"{action} failed: HTTP {response.status} {response.url} - {response.text()[:500]}")
+
+    def register(self, email: str) -> None:
+        """Request registration for email - server sends OTP code"""
+        response = self._post(AUTH_API_REGISTER, self.register_payload(email))
+        self._check_response(response, f"Registration of {email}")
+
+    def request_login(self, email: str) -> None:
+        """Request login for existing email - server sends OTP code"""
+        response = self._post(AUTH_API_LOGIN, self.login_payload(email))
+        self._check_response(response, f"Login request for {email}")
+
+    def submit_code(self, email: str, code: str = OTP_CODE) -> dict:
+        """Submit OTP code - server sets session cookies on success"""
+        response = self._post(AUTH_API_LOGIN_CODE, self.login_code_payload(email, code))
+        self._check_response(response, f"OTP submission for {email}")
+
+        try:
+            return response.json()
+
+        except Exception:
+            return {}
+
+    def register_and_login(self, email: str) -> None:
+        self.register(email)
+        self.submit_code(email)
+
+    def login(self, email: str) -> None:
+        self.request_login(email)
+        self.submit_code(email)
+
+    def apply_to_context(self, context: BrowserContext) -> None:
+        """Copy session cookies obtained through API into the browser context"""
+        cookies = self.request.storage_state().get("cookies", [])
+
+        if not cookies:
+            raise AuthApiError("Auth API did not set any session cookies")
+
+        context.add_cookies(cookies)
+
+    def dispose(self) -> None:
+        self.request.dispose()
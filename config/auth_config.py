@@ -11,6 +11,14 @@ BASE_URL = os.getenv("BASE_URL")
 # Authentication endpoints (if needed)
 LOGIN_URL = os.getenv("LOGIN_URL", "/app/login")
 
+# Auth API endpoints used to register/login users without UI
+AUTH_API_REGISTER = os.getenv("AUTH_API_REGISTER", "/api-v1/auth/register")
+AUTH_API_LOGIN = os.getenv("AUTH_API_LOGIN", "/api-v1/auth/login")
+AUTH_API_LOGIN_CODE = os.getenv("AUTH_API_LOGIN_CODE", "/api-v1/auth/login-code")
+
+# Register/login users for authenticated fixtures through API instead of UI forms
+AUTH_VIA_API = os.getenv("AUTH_VIA_API", "true").lower() == "true"
+
 # OTP code for testing
 OTP_CODE = os.getenv("OTP_CODE")
 
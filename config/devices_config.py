@@ -2,6 +2,8 @@ from typing import Any, Dict
 
 from playwright.sync_api import Playwright
 
+from config.viewports import VIEWPORTS
+
 DEVICE_NAMES = {
     "desktop": "Desktop Chrome",
     "mobile": "iPhone 15 Pro Max",
@@ -31,6 +33,17 @@ def get_device_config(playwright: Playwright, device_name: str) -> Dict[str, Any
     return playwright.devices[device_name]
 
 
+def get_known_viewport(device_name: str) -> Dict[str, int] | None:
+    """Viewport of aliased device without starting Playwright (None for other device names)"""
+    device_name_lower = device_name.lower()
+
+    for device_type, aliases in DEVICE_ALIASES.items():
+        if device_name_lower in aliases or device_name == DEVICE_NAMES[device_type]:
+            return VIEWPORTS[device_type]
+
+    return None
+
+
 def list_available_devices(playwright: Playwright) -> Dict[str, list]:
     devices = {
         "desktop": [],
@@ -85,6 +85,12 @@ class Timeouts:
         STANDARD = 4500  # Standard animation (page transition) - used in page objects
         LONG = 8000  # Long animation (complex transitions) - used in page objects
         VERY_LONG = 10000  # Very long animation (heavy UI updates) - used in page objects
+        # wait_short/medium/standard/long return once DOM was quiet this long (values above are upper bounds)
+        QUIET_WINDOW = 300
+
+    # Pixel tests
+    class Visual:
+        STABILIZE = 5000  # Fonts, image decode and pending app requests before capture (upper bound)
 
     # Modal windows timeouts
     class Modal:
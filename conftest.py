@@ -2,6 +2,7 @@
 # Pytest will automatically discover all fixtures from imported modules
 # Imports may show "unused" warnings, but this is normal - pytest uses them for fixture discovery
 
+import json
 import logging
 import os
 from functools import lru_cache
@@ -13,7 +14,21 @@ from _pytest.junitxml import xml_key
 from dotenv import load_dotenv
 from playwright.sync_api import sync_playwright
 from pytest_metadata.plugin import metadata_key
-from config.devices_config import DEVICE_NAMES, get_device_config
+from config.devices_config import DEVICE_NAMES, get_device_config, get_known_viewport
+from utils.attachment_store import attach_content, attach_content_file, pop_dedup_stats
+from utils.attachment_writer import (
+    start_attachment_writer,
+    stop_attachment_writer,
+    write_artifact,
+)
+from utils.baseline_update import format_summary, pop_baseline_updates, save_summary
+from utils.har_cache import stop_har
+from utils.page_activity import pop_idle_latencies
+from utils.rate_limiter import get_auth_rate_limiter
+from utils.request_blocker import get_request_blocker
+from utils.screenshot_buffer import clear_screenshot_buffer, flush_screenshot_buffer
+from utils.screenshot_policy import start_test_policy
+from utils.snapshot_manifest import save_snapshot_manifests
 
 
 pytest_plugins = ["pytest_playwright_visual_snapshot"]
@@ -23,6 +38,12 @@ pytest_plugins = ["pytest_playwright_visual_snapshot"]
 load_dotenv()
 
 
+from fixtures.async_browser import (  # noqa: F401, E402
+    async_browser,
+    async_context,
+    async_loop,
+    async_playwright_instance,
+)
 from fixtures.auth import (  # noqa: F401, E402
     auth_user_existing,
     auth_user_new_for_app_page,
@@ -35,17 +56,20 @@ from fixtures.auth import (  # noqa: F401, E402
     authenticated_user_zero_balance,
     authenticated_user_zero_balance_with_purchase_attempt,
 )
+from fixtures.auth_cache import auth_state_cache  # noqa: F401, E402
 from fixtures.browser import (  # noqa: F401, E402
     browser,
     context,
+    context_pool,
     device_name,
+    is_headless,
     page,
     playwright_instance,
 )
+from fixtures.browser_server import start_browser_servers  # noqa: E402
 from fixtures.catalog import (  # noqa: F401, E402
     catalog_brand_page,
     catalog_ecu_page,
-    catalog_ecu_page_param,
     catalog_engine_page,
     catalog_engine_page_param,
     catalog_stock_card_page,
@@ -62,10 +86,15 @@ from fixtures.pages import (  # noqa: F401, E402
     pricing_page,
     registration_page,
 )
+from fixtures.user_pool import (  # noqa: F401, E402
+    start_user_pool_provisioning,
+    user_pool,
+)
 from fixtures.visual import (  # noqa: F401, E402
     assert_snapshot_lenient,
     assert_snapshot_strict,
     assert_snapshot_with_threshold,
+    shutdown_comparison_pool,
 )
 
 NOT_SPECIFIED = "Not specified"
@@ -104,6 +133,11 @@ def _get_device_browser_info(config_browser: str = None) -> dict:
 @lru_cache(maxsize=10)
 def _get_viewport_info(device: str) -> str:
     """Get viewport information for device label (cached)"""
+    # Known devices are resolved without starting another Playwright driver
+    viewport = get_known_viewport(device)
+    if viewport:
+        return f"{viewport['width']}x{viewport['height']}"
+
     try:
         with sync_playwright() as p:
             device_config = get_device_config(p, device)
@@ -189,6 +223,151 @@ def pytest_sessionstart(session):
     except ImportError:
         pass
 
+    # Register run in shared auth rate limiter (workers and concurrent runs share the bucket),
+    # state and metrics are reset only when no other run is live
+    if not hasattr(session.config, "workerinput"):
+        get_auth_rate_limiter().start_session()
+
+    # Register pooled users in background while workers start their browsers
+    session.config._user_pool_thread = start_user_pool_provisioning(session.config)
+
+    # Launch shared browser servers before workers start, workers connect to them (BROWSER_SERVER=true)
+    session.config._browser_servers = start_browser_servers(
+        session.config, _get_browser_from_config(session.config), is_headless()
+    )
+
+    # Write Allure attachments from background threads (ATTACHMENT_WRITER=true)
+    start_attachment_writer()
+
+
+def pytest_sessionfinish(session):
+    """Wait for user pool provisioning and queued attachments, leave rate limiter, stop shared browser servers"""
+    provisioning_thread = getattr(session.config, "_user_pool_thread", None)
+    if provisioning_thread:
+        provisioning_thread.join(timeout=30)
+
+    if not hasattr(session.config, "workerinput"):
+        get_auth_rate_limiter().end_session()
+
+    browser_servers = getattr(session.config, "_browser_servers", None)
+    if browser_servers:
+        browser_servers.stop()
+
+    request_blocker = get_request_blocker()
+    if request_blocker:
+        request_blocker.save_sizes()
+
+    save_snapshot_manifests()
+    shutdown_comparison_pool()
+
+    writer_stats = stop_attachment_writer()
+    if writer_stats:
+        logging.info(
+            f"Attachment writer: {writer_stats['written']} files, {writer_stats['written_bytes'] / 1024 / 1024:.1f} MB, "
+            f"failed: {writer_stats['failed']}, test thread waited for queue: {writer_stats['blocked_time']:.2f}s"
+        )
+
+
+def _write_blocked_requests_summary(terminalreporter):
+    """Sum request-blocking savings reported by tests (works for xdist workers too)"""
+    blocked_requests = 0
+    bytes_saved = 0
+
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            properties = dict(getattr(report, "user_properties", []) or [])
+            blocked_requests += properties.get("blocked_requests", 0)
+            bytes_saved += properties.get("blocked_bytes_saved", 0)
+
+    if not blocked_requests:
+        return
+
+    terminalreporter.write_sep("-", "request blocking")
+    terminalreporter.write_line(
+        f"blocked requests: {blocked_requests}, bytes saved (known sizes): {bytes_saved / 1024 / 1024:.2f} MB"
+    )
+
+
+def _write_network_idle_summary(terminalreporter, top: int = 10):
+    """Slowest app network idle steps across all tests"""
+    steps = {}
+
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            properties = dict(getattr(report, "user_properties", []) or [])
+            for wait in properties.get("network_idle_waits", []):
+                steps.setdefault(wait["step"], []).append(wait["elapsed_ms"])
+
+    if not steps:
+        return
+
+    terminalreporter.write_sep("-", "app network idle latency (slowest steps)")
+    slowest = sorted(steps.items(), key=lambda item: sum(item[1]), reverse=True)[:top]
+    for step, values in slowest:
+        terminalreporter.write_line(
+            f"{step}: calls: {len(values)}, total: {sum(values) / 1000:.1f}s, "
+            f"avg: {sum(values) / len(values):.0f}ms, max: {max(values)}ms"
+        )
+
+
+def _write_attachment_dedup_summary(terminalreporter):
+    """Sum attachments deduplicated by content hash (works for xdist workers too)"""
+    duplicates = 0
+    bytes_saved = 0
+
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            properties = dict(getattr(report, "user_properties", []) or [])
+            duplicates += properties.get("attachment_duplicates", 0)
+            bytes_saved += properties.get("attachment_bytes_saved", 0)
+
+    if not duplicates:
+        return
+
+    terminalreporter.write_sep("-", "attachment deduplication")
+    terminalreporter.write_line(
+        f"duplicate attachments: {duplicates}, bytes saved: {bytes_saved / 1024 / 1024:.2f} MB"
+    )
+
+
+def _write_baseline_update_summary(terminalreporter):
+    """References created or changed by --update-snapshots across all workers, saved for parallel runs"""
+    updates = [
+        update
+        for reports in terminalreporter.stats.values()
+        for report in reports
+        for update in dict(getattr(report, "user_properties", []) or []).get("baseline_updates", [])
+    ]
+    if not updates:
+        return
+
+    run_name = f"{os.getenv('BROWSER', 'chromium')}-{os.getenv('DEVICE') or 'desktop'}"
+    summary_file = save_summary(Path("reports"), run_name, updates)
+
+    terminalreporter.write_sep("-", f"baseline updates ({run_name})")
+    for line in format_summary(updates):
+        terminalreporter.write_line(line)
+    terminalreporter.write_line(f"saved to {summary_file}")
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report auth rate limiter waits, request-blocking savings, attachment dedup, network idle latency and baseline updates"""
+    _write_blocked_requests_summary(terminalreporter)
+    _write_attachment_dedup_summary(terminalreporter)
+    _write_baseline_update_summary(terminalreporter)
+    _write_network_idle_summary(terminalreporter)
+
+    metrics = get_auth_rate_limiter().get_metrics()
+    if not metrics["acquired"]:
+        return
+
+    terminalreporter.write_sep("-", "auth rate limiter")
+    terminalreporter.write_line(
+        f"acquired: {metrics['acquired']}, waited: {metrics['waited']}, "
+        f"total wait: {metrics['total_wait']:.2f}s, avg wait: {metrics['avg_wait']:.2f}s, "
+        f"max wait: {metrics['max_wait']:.2f}s"
+    )
+
 
 def _add_allure_labels(info: dict):
     """Add Allure dynamic labels"""
@@ -229,8 +408,67 @@ def _add_xml_properties(item, info: dict):
         pass
 
 
+def _is_pixel_test(item) -> bool:
+    return (
+        "pixel" in str(item.fspath)
+        or "pixel" in item.nodeid
+        or item.get_closest_marker("pixel") is not None
+        or item.get_closest_marker("pixel_test") is not None
+    )
+
+
+def _report_blocked_requests(item, rep):
+    """Attach request-blocking savings of the test to Allure and report user properties"""
+    request_blocker = get_request_blocker()
+    if not request_blocker or not request_blocker.active:
+        return
+
+    stats = request_blocker.get_stats()
+    rep.user_properties.append(("blocked_requests", stats["blocked_requests"]))
+    rep.user_properties.append(("blocked_bytes_saved", stats["bytes_saved"]))
+
+    if stats["blocked_requests"]:
+        allure.attach(
+            json.dumps(stats, indent=2),
+            name="Blocked requests",
+            attachment_type=allure.attachment_type.JSON
+        )
+
+
+def _report_attachment_dedup(rep):
+    """Report attachments stored once by content hash since the previous report (test phase)"""
+    stats = pop_dedup_stats()
+    if stats["duplicates"]:
+        rep.user_properties.append(("attachment_duplicates", stats["duplicates"]))
+        rep.user_properties.append(("attachment_bytes_saved", stats["bytes_saved"]))
+
+
+def _report_baseline_updates(rep):
+    """Report references written by the test in update mode"""
+    updates = pop_baseline_updates()
+    if updates:
+        rep.user_properties.append(("baseline_updates", updates))
+
+
+def _report_network_idle_latencies(rep):
+    """Attach per-step app network idle latencies of the test phase to Allure and report user properties"""
+    latencies = pop_idle_latencies()
+    if not latencies:
+        return
+
+    for latency in latencies:
+        latency["phase"] = rep.when
+
+    rep.user_properties.append(("network_idle_waits", latencies))
+    allure.attach(
+        json.dumps(latencies, indent=2),
+        name=f"Network idle latency ({rep.when})",
+        attachment_type=allure.attachment_type.JSON
+    )
+
+
 def _start_trace_if_enabled(item):
-    """Start tracing if enabled"""
+    """Start tracing if enabled (pooled contexts start their chunk in the `context` fixture)"""
     if os.getenv("TRACE_ON_FAILURE", "true").lower() == "true":
         browser_context = item.funcargs.get("context")
         if browser_context:
@@ -251,6 +489,15 @@ def pytest_runtest_setup(item):
     _add_xml_properties(item, info)
     _start_trace_if_enabled(item)
 
+    # Pixel tests need all resources to render as in production
+    request_blocker = get_request_blocker()
+    if request_blocker:
+        request_blocker.start_test(active=not _is_pixel_test(item))
+
+    screenshots_marker = item.get_closest_marker("screenshots")
+    start_test_policy(screenshots_marker.kwargs if screenshots_marker else None)
+    clear_screenshot_buffer()
+
 
 
 
@@ -264,8 +511,8 @@ def _capture_page_artifacts(browser_page, test_name: str, failed_screenshots_dir
             try:
                 screenshot_bytes = browser_page.screenshot(full_page=True, timeout=5000)
                 screenshot_path = failed_screenshots_dir / f"{test_name}.png"
-                screenshot_path.write_bytes(screenshot_bytes)
-                allure.attach(
+                write_artifact(screenshot_path, screenshot_bytes)
+                attach_content(
                     screenshot_bytes,
                     name="Screenshot on failure",
                     attachment_type=allure.attachment_type.PNG
@@ -280,7 +527,7 @@ def _capture_page_artifacts(browser_page, test_name: str, failed_screenshots_dir
         with allure.step("HTML on failure"):
             try:
                 html_content = browser_page.content()
-                allure.attach(
+                attach_content(
                     html_content,
                     name="Page HTML on failure",
                     attachment_type=allure.attachment_type.HTML
@@ -335,15 +582,32 @@ def _save_trace_on_failure(item, info: dict, test_name: str):
     trace_dir.mkdir(parents=True, exist_ok=True)
     trace_filename = trace_dir / f"{test_name}.zip"
     browser_context.tracing.stop_chunk(path=str(trace_filename))
+    item._trace_chunk_started = False
 
     if trace_filename.exists():
-        allure.attach.file(
+        attach_content_file(
             str(trace_filename),
             name="Playwright Trace",
             attachment_type=allure.attachment_type.ZIP
         )
 
 
+def _flush_step_screenshots():
+    """Attach step screenshots kept in memory by attach_screenshot (SCREENSHOT_BUFFER)"""
+    try:
+        flush_screenshot_buffer()
+
+    except Exception as e:
+        logging.warning(f"Failed to attach buffered screenshots: {e}")
+
+
+def pytest_runtest_teardown(item):
+    """Save HAR recorded by the test and remove HAR replay routes so they don't leak into next tests"""
+    browser_page = item.funcargs.get("page")
+    if browser_page:
+        stop_har(browser_page)
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Generate test report with device/browser info and handle failures"""
@@ -393,6 +657,13 @@ def pytest_runtest_makereport(item, call):
             if not hasattr(rep, 'message') or not rep.message:
                 rep.message = lines[0].strip() if lines else None
 
+    # Waits in fixture setup and teardown are reported with their own phase
+    _report_network_idle_latencies(rep)
+
+    if rep.when == "call":
+        _report_blocked_requests(item, rep)
+        _report_baseline_updates(rep)
+
     trace_on_failure = os.getenv("TRACE_ON_FAILURE", "true").lower() == "true"
 
     # Stop trace chunk if test passed
@@ -400,6 +671,10 @@ def pytest_runtest_makereport(item, call):
         browser_context = item.funcargs.get("context")
         if browser_context and getattr(item, "_trace_chunk_started", False):
             browser_context.tracing.stop_chunk()
+            item._trace_chunk_started = False
+
+    if rep.failed:
+        _flush_step_screenshots()
 
     # Handle test failures and teardown errors
     if (rep.when == "call" and rep.failed) or (rep.when == "teardown" and rep.failed):
@@ -407,7 +682,7 @@ def pytest_runtest_makereport(item, call):
         failed_screenshots_dir.mkdir(parents=True, exist_ok=True)
 
         test_name = item.nodeid.replace("::", "_").replace("/", "_").replace(".py", "")
-        is_pixel_test = "pixel" in str(item.fspath) or "pixel" in item.nodeid
+        is_pixel_test = _is_pixel_test(item)
 
         # Handle pixel test failures (including teardown failures from pytest-playwright-visual-snapshot)
         if is_pixel_test:
@@ -445,6 +720,8 @@ def pytest_runtest_makereport(item, call):
         if trace_on_failure:
             _save_trace_on_failure(item, info, test_name)
 
+    _report_attachment_dedup(rep)
+
 
 try:
     @pytest.hookimpl(optionalhook=True)
@@ -0,0 +1,116 @@
+"""
+Async Playwright fixtures for running independent read-only checks concurrently inside one worker.
+
+Sync Playwright leaves its event loop marked as running on the main thread, so async Playwright
+can't share it (Runner.run() cannot be called from a running event loop). Async objects live on
+an event loop in a dedicated thread instead - tests stay sync and run coroutines on it with
+`async_loop.run(...)`, checks are gathered with `pages.async_base_page.gather_checks`.
+"""
+
+import asyncio
+import threading
+from typing import Awaitable
+
+import pytest
+from playwright.async_api import async_playwright, expect
+
+from config.auth_config import BASE_URL
+from config.timeouts import Timeouts
+from fixtures.browser import (
+    _get_browser_type_from_config,
+    get_browser_launcher,
+    get_context_options,
+    is_headless,
+    language_cookie,
+)
+from fixtures.browser_server import get_ws_endpoint
+from utils.page_activity import ACTIVITY_TRACKER_SCRIPT
+from utils.request_blocker import get_request_blocker
+
+
+class AsyncLoopThread:
+    """Event loop running forever in a daemon thread, coroutines are submitted from the test thread"""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="async-playwright", daemon=True)
+        self._thread.start()
+
+    def run(self, coroutine: Awaitable, timeout: float | None = None):
+        """Run coroutine on the loop thread and wait for its result (exceptions are re-raised here)"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def close(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=10)
+        self.loop.close()
+
+
+@pytest.fixture(scope="session")
+def async_loop():
+    """Event loop thread shared by all async Playwright objects of the worker"""
+    loop_thread = AsyncLoopThread()
+    yield loop_thread
+    loop_thread.close()
+
+
+@pytest.fixture(scope="session")
+def async_playwright_instance(async_loop):
+    """Async Playwright instance fixture"""
+    playwright = async_loop.run(async_playwright().start())
+    yield playwright
+    async_loop.run(playwright.stop())
+
+
+@pytest.fixture(scope="session")
+def async_browser(async_loop, async_playwright_instance, request):
+    """Async browser - connects to shared browser server if available (BROWSER_SERVER=true)"""
+    browser_type = _get_browser_type_from_config(request)
+    launcher = get_browser_launcher(async_playwright_instance, browser_type)
+    ws_endpoint = get_ws_endpoint(browser_type)
+
+    if ws_endpoint:
+        browser = async_loop.run(launcher.connect(ws_endpoint))
+
+    else:
+        browser = async_loop.run(launcher.launch(headless=is_headless()))
+
+    yield browser
+    async_loop.run(browser.close())
+
+
+async def _create_async_context(browser, device_config: dict, headers: dict):
+    context = await browser.new_context(**device_config)
+    await context.set_extra_http_headers(headers)
+    context._base_http_headers = headers.copy()
+    await context.add_init_script(ACTIVITY_TRACKER_SCRIPT)
+
+    context.set_default_timeout(Timeouts.BASE_PAGE_LOAD)
+    context.set_default_navigation_timeout(Timeouts.BASE_PAGE_LOAD)
+
+    # Same blocking profile as the sync context (BLOCK_REQUESTS=true), switched per test by pytest_runtest_setup
+    request_blocker = get_request_blocker()
+    if request_blocker:
+        await request_blocker.attach_async(context)
+
+    if BASE_URL:
+        await context.add_cookies([language_cookie()])
+
+    return context
+
+
+@pytest.fixture
+def async_context(async_loop, async_browser, async_playwright_instance, device_name, request):
+    """
+    Fresh async context configured like the sync `context` fixture.
+
+    Open as many pages as needed with `async_loop.run(async_context.new_page())` and drive them concurrently.
+    """
+    browser_type = _get_browser_type_from_config(request)
+    device_config, headers, _ = get_context_options(async_playwright_instance, device_name, browser_type)
+
+    context = async_loop.run(_create_async_context(async_browser, device_config, headers))
+    expect.set_options(timeout=Timeouts.BASE_ELEMENT_VISIBLE)
+
+    yield context
+    async_loop.run(context.close())
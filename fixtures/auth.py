@@ -1,18 +1,31 @@
 import logging
 import re
+from pathlib import Path
 
 import allure
 import pytest
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import Page, Playwright, expect
 
-from config.auth_config import BASE_URL, OTP_CODE
+from auth.api_client import AuthApiError, is_auth_api_available
+from config.auth_config import AUTH_VIA_API, BASE_URL, OTP_CODE
 from config.timeouts import Timeouts
+from fixtures.auth_cache import (
+    AuthStateCache,
+    is_auth_cache_enabled,
+    is_logged_in,
+    restore_storage_state,
+)
 from fixtures.auth_factory import UserRegistrationFactory
+from fixtures.context_pool import page_scope
+from fixtures.user_pool import UserPool
 from locators.login_locators import LoginLocators
 from pages.base_page import BasePage
 from pages.upload_page import UploadPage
+from utils.rate_limiter import get_auth_rate_limiter
 
 LOGOUT_BUTTON_TEXT = "Выйти"
+EXISTING_USER_EMAIL = "test953+50000++c10++d20@test.com"
 
 
 def parse_user_info_from_email(email: str) -> dict:
@@ -127,9 +140,129 @@ def _set_language_cookie(page: Page):
         logging.warning(f"Failed to set language cookie: {e}")
 
 
+def _register_user(
+    page: Page,
+    playwright: Playwright,
+    user_type: str,
+    logout_after: bool = True,
+    use_after_register_click: bool = False
+) -> str:
+    """Register user through auth API, fall back to registration UI if API is disabled or fails"""
+    if AUTH_VIA_API and is_auth_api_available():
+        try:
+            with allure.step(f"Register user via API: {user_type}"):
+                return UserRegistrationFactory.register_user_via_api(page, playwright, user_type=user_type)
+
+        except (AuthApiError, PlaywrightError) as e:
+            logging.warning(f"API registration failed, falling back to UI registration: {e}")
+
+    return UserRegistrationFactory.register_user(
+        page,
+        user_type=user_type,
+        logout_after=logout_after,
+        use_after_register_click=use_after_register_click
+    )
+
+
+def _obtain_user(
+    page: Page,
+    playwright: Playwright,
+    user_pool: UserPool | None,
+    user_type: str,
+    consume: bool,
+    logout_after: bool = True,
+    use_after_register_click: bool = False
+) -> str:
+    """Lease pre-registered user from the pool, register a new one if pool is empty or disabled"""
+    user = user_pool.lease(user_type) if user_pool else None
+
+    if user:
+        with allure.step(f"Restore pooled user session: {user_type}"):
+            restore_storage_state(page, Path(user.state_path))
+            _set_language_cookie(page)
+            is_valid = is_logged_in(page, LOGOUT_BUTTON_TEXT)
+
+        # Account will be changed by the test (or session is dead) - never lease it again
+        if consume or not is_valid:
+            user_pool.consume(user)
+
+        if is_valid:
+            return user.email
+
+        logging.warning(f"Pooled '{user_type}' user session is not valid, registering a new user")
+
+    return _register_user(
+        page,
+        playwright,
+        user_type,
+        logout_after=logout_after,
+        use_after_register_click=use_after_register_click
+    )
+
+
+def _login_user_with_cache(
+    page: Page,
+    playwright: Playwright,
+    request,
+    auth_state_cache: AuthStateCache,
+    user_pool: UserPool | None,
+    user_type: str,
+    logout_after: bool = True,
+    use_after_register_click: bool = False
+) -> str:
+    """Restore cached session for user type or obtain a new user and cache its state"""
+    use_cache = is_auth_cache_enabled(request)
+
+    if use_cache:
+        cached = auth_state_cache.get(user_type)
+
+        if cached:
+            email, state_path = cached
+
+            with allure.step(f"Restore cached session for user type: {user_type}"):
+                restore_storage_state(page, state_path)
+                _set_language_cookie(page)
+
+                if is_logged_in(page, LOGOUT_BUTTON_TEXT):
+                    return email
+
+            logging.warning(f"Cached session for '{user_type}' expired, registering a new user")
+            auth_state_cache.invalidate(user_type)
+
+    email = _obtain_user(
+        page,
+        playwright,
+        user_pool,
+        user_type,
+        consume=not use_cache,
+        logout_after=logout_after,
+        use_after_register_click=use_after_register_click
+    )
+
+    if use_cache:
+        auth_state_cache.save(page, user_type, email)
+
+    return email
+
+
+def _logout_user(page: Page, request) -> None:
+    """Logout after test, keeping server session alive if it is cached for other tests"""
+    try:
+        if not is_auth_cache_enabled(request):
+            page.goto(f"{BASE_URL}/app")
+            base_page = BasePage(page)
+            base_page.check_and_logout(LOGOUT_BUTTON_TEXT)
+
+    except Exception as e:
+        logging.debug(f"Failed to logout during teardown (continuing): {e}")
+
+    finally:
+        page.context.clear_cookies()
+
+
 @pytest.fixture(scope="function")
 @allure.title("Register new premium user and login, navigate to /app")
-def authenticated_user_new(page: Page):
+def authenticated_user_new(page: Page, playwright_instance, request, auth_state_cache, user_pool):
     # Use existing page instead of creating new one to avoid blank tabs
     page.set_default_timeout(Timeouts.BASE_PAGE_LOAD)
     page.set_default_navigation_timeout(Timeouts.BASE_PAGE_LOAD)
@@ -140,25 +273,18 @@ def authenticated_user_new(page: Page):
     # Re-set language cookie after clearing
     _set_language_cookie(page)
 
-    email = UserRegistrationFactory.register_user(page, user_type="premium", logout_after=True)
+    email = _login_user_with_cache(page, playwright_instance, request, auth_state_cache, user_pool, "premium", logout_after=True)
     attach_user_info_to_allure(email)
     store_user_info_in_playwright(page, email)
     yield page
 
     # Teardown
-    try:
-        page.goto(f"{BASE_URL}/app")
-        base_page = BasePage(page)
-        base_page.check_and_logout(LOGOUT_BUTTON_TEXT)
-    except Exception as e:
-        logging.debug(f"Failed to logout during teardown (continuing): {e}")
-    finally:
-        page.context.clear_cookies()
+    _logout_user(page, request)
 
 
 @pytest.fixture(scope="function")
 @allure.title("Register new user with balance and login, navigate to /app")
-def authenticated_user_with_balance(page: Page):
+def authenticated_user_with_balance(page: Page, playwright_instance, request, auth_state_cache, user_pool):
     # Use existing page instead of creating new one to avoid blank tabs
     page.set_default_timeout(Timeouts.BASE_PAGE_LOAD)
     page.set_default_navigation_timeout(Timeouts.BASE_PAGE_LOAD)
@@ -169,9 +295,13 @@ def authenticated_user_with_balance(page: Page):
     # Re-set language cookie after clearing
     _set_language_cookie(page)
 
-    email = UserRegistrationFactory.register_user(
+    email = _login_user_with_cache(
         page,
-        user_type="with_balance",
+        playwright_instance,
+        request,
+        auth_state_cache,
+        user_pool,
+        "with_balance",
         logout_after=True,
         use_after_register_click=True
     )
@@ -180,19 +310,12 @@ def authenticated_user_with_balance(page: Page):
     yield page
 
     # Teardown
-    try:
-        page.goto(f"{BASE_URL}/app")
-        base_page = BasePage(page)
-        base_page.check_and_logout(LOGOUT_BUTTON_TEXT)
-    except Exception as e:
-        logging.debug(f"Failed to logout during teardown (continuing): {e}")
-    finally:
-        page.context.clear_cookies()
+    _logout_user(page, request)
 
 
 @pytest.fixture(scope="function")
 @allure.title("Register new user with zero balance and login, navigate to /app")
-def authenticated_user_zero_balance(page: Page):
+def authenticated_user_zero_balance(page: Page, playwright_instance, request, auth_state_cache, user_pool):
     # Use existing page instead of creating new one to avoid blank tabs
     page.set_default_timeout(Timeouts.BASE_PAGE_LOAD)
     page.set_default_navigation_timeout(Timeouts.BASE_PAGE_LOAD)
@@ -203,7 +326,7 @@ def authenticated_user_zero_balance(page: Page):
     # Re-set language cookie after clearing
     _set_language_cookie(page)
 
-    email = UserRegistrationFactory.register_user(page, user_type="zero_balance", logout_after=False)
+    email = _login_user_with_cache(page, playwright_instance, request, auth_state_cache, user_pool, "zero_balance", logout_after=False)
     attach_user_info_to_allure(email)
     store_user_info_in_playwright(page, email)
     yield page
@@ -211,32 +334,18 @@ def authenticated_user_zero_balance(page: Page):
 
 
 
-@pytest.fixture(scope="session")
-@allure.title("Login with existing user and navigate to /app - runs once for all tests")
-def auth_user_existing(page: Page):
+def _login_existing_user_via_ui(page: Page, email: str) -> None:
+    """Login existing user through login form and OTP fields"""
     base_page = BasePage(page)
 
-    with allure.step("Navigate to /app page"):
-        app_url = f"{BASE_URL}/app"
-        page.goto(app_url)
-        base_page.wait_for_network_idle()
-
-    with allure.step("Check if user is already logged in"):
-        logout_btn = page.get_by_text(LOGOUT_BUTTON_TEXT)
-        if logout_btn.count() > 0:
-            email = "test953+50000++c10++d20@test.com"
-            attach_user_info_to_allure(email)
-            store_user_info_in_playwright(page, email)
-            return page
-
     with allure.step("Navigate to login page"):
         login_url = f"{BASE_URL}/app/login"
         page.goto(login_url)
-        base_page.wait_for_network_idle()
+        base_page.wait_for_network_idle(step="login_existing_user_via_ui_open")
 
     with allure.step("Fill login form"):
-        email = "test953+50000++c10++d20@test.com"
         locators = LoginLocators()
+        rate_limiter = get_auth_rate_limiter()
 
         email_input = page.locator(locators.username_field).first
         expect(email_input).to_be_visible()
@@ -247,11 +356,12 @@ def auth_user_existing(page: Page):
         login_btn = page.locator(locators.login_button).first
         expect(login_btn).to_be_visible()
 
-        base_page.wait_for_network_idle()
+        base_page.wait_for_network_idle(step="login_existing_user_via_ui_before_submit")
+        rate_limiter.acquire()
         login_btn.click()
 
     with allure.step("Wait for OTP fields to appear"):
-        base_page.wait_for_network_idle()
+        base_page.wait_for_network_idle(step="login_existing_user_via_ui_otp")
         otp_pin_1 = page.locator(locators.otp_pin_1).first
         expect(otp_pin_1).to_be_visible(timeout=Timeouts.Registration.OTP_FIELDS_VISIBLE)
 
@@ -265,35 +375,52 @@ def auth_user_existing(page: Page):
         ]
         base_page.fill_otp_fields(OTP_CODE, pin_fields)
 
-    with allure.step("Submit OTP and handle retries"):
-        # Retry logic for HTTP 429
-        max_retries = 1
+    with allure.step("Submit OTP"):
+        with page.expect_response(
+            lambda resp: "/api-v1/auth/login-code" in resp.url,
+            timeout=Timeouts.Registration.OTP_SUBMIT_RESPONSE
+        ) as resp_info:
+            rate_limiter.acquire()
+            page.locator(locators.otp_send_button).first.click()
 
-        for attempt in range(max_retries):
-            with page.expect_response(
-                lambda resp: "/api-v1/auth/login-code" in resp.url,
-                timeout=Timeouts.Registration.OTP_SUBMIT_RESPONSE
-            ) as resp_info:
-                page.locator(locators.otp_send_button).first.click()
+        response = resp_info.value
+        assert response.status == 200, f"Expected status 200, got {response.status}"
 
-            response = resp_info.value
+    with allure.step("Navigate to /app and verify login"):
+        base_page.navigate_to_app_and_verify(BASE_URL, LOGOUT_BUTTON_TEXT)
 
-            if response.status == 200:
-                break
 
-            elif response.status == 429 and attempt < max_retries - 1:
-                # Need guaranteed minimum wait time before retry to respect rate limit
-                page.wait_for_timeout(Timeouts.BASE_PAGE_LOAD)
-                # Re-fill OTP and retry
-                base_page.fill_otp_fields(OTP_CODE, pin_fields)
+@pytest.fixture(scope=page_scope)
+@allure.title("Login with existing user and navigate to /app - runs once for all tests")
+def auth_user_existing(page: Page, playwright_instance):
+    base_page = BasePage(page)
+    email = EXISTING_USER_EMAIL
 
-            else:
-                break
+    with allure.step("Navigate to /app page"):
+        app_url = f"{BASE_URL}/app"
+        page.goto(app_url)
+        base_page.wait_for_network_idle(step="auth_user_existing")
 
-        assert response.status == 200, f"Expected status 200, got {response.status}"
+    with allure.step("Check if user is already logged in"):
+        logout_btn = page.get_by_text(LOGOUT_BUTTON_TEXT)
+        if logout_btn.count() > 0:
+            attach_user_info_to_allure(email)
+            store_user_info_in_playwright(page, email)
+            return page
 
-    with allure.step("Navigate to /app and verify login"):
-        base_page.navigate_to_app_and_verify(BASE_URL, LOGOUT_BUTTON_TEXT)
+    logged_in = False
+
+    if AUTH_VIA_API and is_auth_api_available():
+        try:
+            with allure.step("Login existing user via API"):
+                UserRegistrationFactory.login_user_via_api(page, playwright_instance, email)
+                logged_in = True
+
+        except (AuthApiError, PlaywrightError) as e:
+            logging.warning(f"API login failed, falling back to UI login: {e}")
+
+    if not logged_in:
+        _login_existing_user_via_ui(page, email)
 
     with allure.step("Store user information"):
         attach_user_info_to_allure(email)
@@ -301,10 +428,9 @@ def auth_user_existing(page: Page):
         return page
 
 
-
 @pytest.fixture(scope="function")
 @allure.title("Register new user with zero balance, login, and attempt purchase (should fail due to insufficient funds)")
-def authenticated_user_zero_balance_with_purchase_attempt(page: Page):
+def authenticated_user_zero_balance_with_purchase_attempt(page: Page, playwright_instance, user_pool):
     # Use existing page instead of creating new one to avoid blank tabs
     page.set_default_timeout(Timeouts.BASE_PAGE_LOAD)
     page.set_default_navigation_timeout(Timeouts.BASE_PAGE_LOAD)
@@ -324,7 +450,7 @@ def authenticated_user_zero_balance_with_purchase_attempt(page: Page):
     except Exception as e:
         logging.debug(f"Failed to logout before zero balance test (continuing): {e}")
 
-    email = UserRegistrationFactory.register_user(page, user_type="zero_balance", logout_after=True)
+    email = _obtain_user(page, playwright_instance, user_pool, "zero_balance", consume=True, logout_after=True)
     attach_user_info_to_allure(email)
     store_user_info_in_playwright(page, email)
 
@@ -354,7 +480,7 @@ def authenticated_user_zero_balance_with_purchase_attempt(page: Page):
 
 @pytest.fixture(scope="function")
 @allure.title("Register new user with balance and discount, login, navigate to /app")
-def authenticated_user_with_balance_and_discount(page: Page):
+def authenticated_user_with_balance_and_discount(page: Page, playwright_instance, request, auth_state_cache, user_pool):
     # Use existing page instead of creating new one to avoid blank tabs
     page.set_default_timeout(Timeouts.BASE_PAGE_LOAD)
     page.set_default_navigation_timeout(Timeouts.BASE_PAGE_LOAD)
@@ -366,26 +492,17 @@ def authenticated_user_with_balance_and_discount(page: Page):
     # Re-set language cookie after clearing
     _set_language_cookie(page)
 
-    email = UserRegistrationFactory.register_user(page, user_type="with_balance_and_discount", logout_after=True)
+    email = _login_user_with_cache(page, playwright_instance, request, auth_state_cache, user_pool, "with_balance_and_discount", logout_after=True)
     attach_user_info_to_allure(email)
     store_user_info_in_playwright(page, email)
     yield page
 
-    try:
-        page.goto(f"{BASE_URL}/app")
-        base_page = BasePage(page)
-        base_page.check_and_logout(LOGOUT_BUTTON_TEXT)
-
-    except Exception as e:
-        logging.debug(f"Failed to logout during teardown (continuing): {e}")
-
-    finally:
-        page.context.clear_cookies()
+    _logout_user(page, request)
 
 
 @pytest.fixture(scope="function")
 @allure.title("Register new user with zero balance but 50% cashback, login, navigate to /app")
-def authenticated_user_without_balance_but_cashback(page: Page):
+def authenticated_user_without_balance_but_cashback(page: Page, playwright_instance, request, auth_state_cache, user_pool):
     # Use existing page instead of creating new one to avoid blank tabs
     page.set_default_timeout(Timeouts.BASE_PAGE_LOAD)
     page.set_default_navigation_timeout(Timeouts.BASE_PAGE_LOAD)
@@ -397,7 +514,7 @@ def authenticated_user_without_balance_but_cashback(page: Page):
     # Re-set language cookie after clearing
     _set_language_cookie(page)
 
-    email = UserRegistrationFactory.register_user(page, user_type="without_balance_but_cashback", logout_after=False)
+    email = _login_user_with_cache(page, playwright_instance, request, auth_state_cache, user_pool, "without_balance_but_cashback", logout_after=False)
     attach_user_info_to_allure(email)
     store_user_info_in_playwright(page, email)
 
@@ -407,7 +524,7 @@ def authenticated_user_without_balance_but_cashback(page: Page):
 
 @pytest.fixture(scope="function")
 @allure.title("Register new user with zero balance but discount, login, navigate to /app")
-def authenticated_user_without_balance_but_discount(page: Page):
+def authenticated_user_without_balance_but_discount(page: Page, playwright_instance, request, auth_state_cache, user_pool):
     # Use existing page instead of creating new one to avoid blank tabs
     page.set_default_timeout(Timeouts.BASE_PAGE_LOAD)
     page.set_default_navigation_timeout(Timeouts.BASE_PAGE_LOAD)
@@ -419,7 +536,7 @@ def authenticated_user_without_balance_but_discount(page: Page):
     # Re-set language cookie after clearing
     _set_language_cookie(page)
 
-    email = UserRegistrationFactory.register_user(page, user_type="without_balance_but_discount", logout_after=False)
+    email = _login_user_with_cache(page, playwright_instance, request, auth_state_cache, user_pool, "without_balance_but_discount", logout_after=False)
     attach_user_info_to_allure(email)
     store_user_info_in_playwright(page, email)
 
@@ -429,7 +546,7 @@ def authenticated_user_without_balance_but_discount(page: Page):
 
 @pytest.fixture(scope="function")
 @allure.title("Register new user with zero balance but 50% cashback and discount, login, navigate to /app")
-def authenticated_user_without_balance_but_cashback_and_discount(page: Page):
+def authenticated_user_without_balance_but_cashback_and_discount(page: Page, playwright_instance, request, auth_state_cache, user_pool):
     # Use existing page instead of creating new one to avoid blank tabs
     page.set_default_timeout(Timeouts.BASE_PAGE_LOAD)
     page.set_default_navigation_timeout(Timeouts.BASE_PAGE_LOAD)
@@ -441,16 +558,16 @@ def authenticated_user_without_balance_but_cashback_and_discount(page: Page):
     # Re-set language cookie after clearing
     _set_language_cookie(page)
 
-    email = UserRegistrationFactory.register_user(page, user_type="without_balance_but_cashback_and_discount", logout_after=False)
+    email = _login_user_with_cache(page, playwright_instance, request, auth_state_cache, user_pool, "without_balance_but_cashback_and_discount", logout_after=False)
     attach_user_info_to_allure(email)
     store_user_info_in_playwright(page, email)
     yield page
     page.context.clear_cookies()
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture(scope=page_scope)
 @allure.title("Register new user and navigate to /app page for app page tests")
-def auth_user_new_for_app_page(page: Page):
+def auth_user_new_for_app_page(page: Page, playwright_instance, request, auth_state_cache, user_pool):
     # Use existing page instead of creating new one to avoid blank tabs
     page.set_default_timeout(Timeouts.BASE_PAGE_LOAD)
     page.set_default_navigation_timeout(Timeouts.BASE_PAGE_LOAD)
@@ -464,7 +581,7 @@ def auth_user_new_for_app_page(page: Page):
 
     base_page = BasePage(page)
 
-    email = UserRegistrationFactory.register_user(page, user_type="premium", logout_after=True)
+    email = _login_user_with_cache(page, playwright_instance, request, auth_state_cache, user_pool, "premium", logout_after=True)
     attach_user_info_to_allure(email)
     store_user_info_in_playwright(page, email)
 
@@ -474,12 +591,4 @@ def auth_user_new_for_app_page(page: Page):
 
     yield page
 
-    try:
-        page.goto(f"{BASE_URL}/app")
-        base_page.check_and_logout(LOGOUT_BUTTON_TEXT)
-
-    except Exception as e:
-        logging.debug(f"Failed to logout during teardown (continuing): {e}")
-
-    finally:
-        page.context.clear_cookies()
+    _logout_user(page, request)
@@ -0,0 +1,123 @@
+"""Per-worker cache of authenticated storage states keyed by user type"""
+
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import Page
+
+from config.auth_config import BASE_URL
+from config.timeouts import Timeouts
+
+FRESH_USER_MARKER = "fresh_user"
+LOGOUT_BUTTON_TEXT = "Выйти"
+
+
+def is_auth_cache_enabled(request) -> bool:
+    """
+    Check if the auth cache may be used for the requesting test.
+
+    Disabled globally with AUTH_CACHE=false, or per test with @pytest.mark.fresh_user
+    (tests that mutate the account: purchases, balance or cashback changes).
+    """
+    if os.getenv("AUTH_CACHE", "true").lower() != "true":
+        return False
+
+    return request.node.get_closest_marker(FRESH_USER_MARKER) is None
+
+
+class AuthStateCache:
+    """Stores Playwright storage_state per user_type, once per xdist worker"""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self._emails: dict[str, str] = {}
+
+    def state_path(self, user_type: str) -> Path:
+        return self.cache_dir / f"{user_type}.json"
+
+    def get(self, user_type: str) -> tuple[str, Path] | None:
+        """Return (email, storage_state path) for cached user type, or None"""
+        email = self._emails.get(user_type)
+        state_path = self.state_path(user_type)
+
+        if email is None or not state_path.exists():
+            return None
+
+        return email, state_path
+
+    def save(self, page: Page, user_type: str, email: str) -> Path:
+        """Save storage_state of the page context for the user type"""
+        state_path = self.state_path(user_type)
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+
+        page.context.storage_state(path=str(state_path))
+        self._emails[user_type] = email
+
+        return state_path
+
+    def invalidate(self, user_type: str) -> None:
+        self._emails.pop(user_type, None)
+        self.state_path(user_type).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        self._emails.clear()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+def restore_storage_state(page: Page, state_path: Path) -> None:
+    """Replace cookies and localStorage of the page context with saved storage_state"""
+    storage_state = json.loads(state_path.read_text(encoding="utf-8"))
+
+    context = page.context
+    context.clear_cookies()
+    context.add_cookies(storage_state.get("cookies", []))
+
+    for origin in storage_state.get("origins", []):
+        local_storage = origin.get("localStorage") or []
+
+        if not local_storage:
+            continue
+
+        # localStorage can only be written from a page on the same origin
+        page.goto(origin["origin"], wait_until="domcontentloaded")
+        page.evaluate("""
+            (items) => {
+                localStorage.clear();
+                for (const {name, value} of items) {
+                    localStorage.setItem(name, value);
+                }
+            }
+        """, local_storage)
+
+
+def is_logged_in(page: Page, logout_button_text: str = LOGOUT_BUTTON_TEXT) -> bool:
+    """Open /app and check the session is still valid"""
+    try:
+        page.goto(f"{BASE_URL}/app", wait_until="domcontentloaded")
+        page.get_by_text(logout_button_text).first.wait_for(
+            state="attached",
+            timeout=Timeouts.BASE_ELEMENT_VISIBLE
+        )
+        return True
+
+    except Exception as e:
+        logging.debug(f"Cached session is not valid anymore: {e}")
+        return False
+
+
+@pytest.fixture(scope="session")
+def auth_state_cache():
+    """Auth state cache for current worker - users are registered once per user_type"""
+    base_dir = Path(os.getenv("AUTH_CACHE_DIR", "reports/.auth"))
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+    cache = AuthStateCache(base_dir / worker_id)
+    cache.clear()
+
+    yield cache
+
+    cache.clear()
@@ -1,12 +1,13 @@
 import os
-import time
 
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Page, Playwright, expect
 
+from auth.api_client import AuthApiClient
 from config.auth_config import BASE_URL, OTP_CODE
 from config.timeouts import Timeouts
 from locators.registration_locators import RegistrationLocators
 from pages.base_page import BasePage
+from utils.rate_limiter import get_auth_rate_limiter
 from utils.user_generator import (
     generate_premium_user,
     generate_user_with_balance,
@@ -17,10 +18,6 @@ from utils.user_generator import (
     generate_user_without_balance_but_discount,
 )
 
-# Global lock for registration delays to prevent HTTP 429
-_last_registration_time = 0
-_registration_lock = False
-
 
 class UserRegistrationFactory:
     """Factory for registering users with different parameters"""
@@ -61,6 +58,64 @@ class UserRegistrationFactory:
         base_page.check_and_logout("Выйти")
 
 
+    @staticmethod
+    def generate_email(user_type: str = "premium") -> str:
+        """Generate user email with worker_id for uniqueness in parallel execution"""
+        try:
+            worker_id = os.environ.get('PYTEST_XDIST_WORKER', 'gw0')
+            worker_num = int(worker_id.replace('gw', '')) if worker_id.startswith('gw') else 0
+
+        except (ValueError, AttributeError):
+            worker_num = 0
+
+        generator = UserRegistrationFactory.USER_GENERATORS.get(user_type, generate_premium_user)
+
+        # Add worker number to email for uniqueness
+        email = generator()
+
+        if worker_num > 0:
+            email = email.replace('@test.com', f'+w{worker_num}@test.com')
+
+        return email
+
+    @staticmethod
+    def register_user_via_api(page: Page, playwright: Playwright, user_type: str = "premium") -> str:
+        """
+        Registers a new user through auth API and injects session cookies into page context
+
+        Args:
+            page: Playwright page object
+            playwright: Playwright instance (used to create APIRequestContext)
+            user_type: Тип пользователя (premium, zero_balance, with_balance)
+
+        Returns:
+            Email зарегистрированного пользователя
+        """
+        email = UserRegistrationFactory.generate_email(user_type)
+
+        UserRegistrationFactory.login_user_via_api(page, playwright, email, register=True)
+
+        return email
+
+    @staticmethod
+    def login_user_via_api(page: Page, playwright: Playwright, email: str, register: bool = False) -> None:
+        """Login (or register) user through auth API and open /app with the session"""
+        api_client = AuthApiClient.from_playwright(playwright)
+
+        try:
+            if register:
+                api_client.register_and_login(email)
+
+            else:
+                api_client.login(email)
+
+            api_client.apply_to_context(page.context)
+
+        finally:
+            api_client.dispose()
+
+        page.goto(f"{BASE_URL}/app", wait_until="domcontentloaded")
+
     @staticmethod
     def register_user(
         page: Page,
@@ -84,30 +139,7 @@ class UserRegistrationFactory:
         if logout_after:
             UserRegistrationFactory.ensure_logged_out(page, BASE_URL)
 
-        # Add delay between registrations to prevent HTTP 429
-        global _last_registration_time
-        current_time = time.time()
-        time_since_last = current_time - _last_registration_time
-        min_delay = 1.0  # Minimum 1 second between registrations
-        if time_since_last < min_delay:
-            time.sleep(min_delay - time_since_last)
-        _last_registration_time = time.time()
-
-        # Generate user email with worker_id for uniqueness in parallel execution
-        try:
-            worker_id = os.environ.get('PYTEST_XDIST_WORKER', 'gw0')
-            worker_num = int(worker_id.replace('gw', '')) if worker_id.startswith('gw') else 0
-
-        except (ValueError, AttributeError):
-            worker_num = 0
-
-        generator = UserRegistrationFactory.USER_GENERATORS.get(user_type, generate_premium_user)
-
-        # Add worker number to email for uniqueness
-        email = generator()
-
-        if worker_num > 0:
-            email = email.replace('@test.com', f'+w{worker_num}@test.com')
+        email = UserRegistrationFactory.generate_email(user_type)
 
         # Navigate to registration
         register_url = f"{BASE_URL}/app/register"
@@ -145,7 +177,11 @@ class UserRegistrationFactory:
         expect(register_btn).to_be_visible()
         expect(register_btn).to_be_enabled(timeout=Timeouts.Registration.REGISTER_BUTTON_ENABLED)
 
+        # Shared token bucket across workers prevents HTTP 429 from auth endpoints
+        rate_limiter = get_auth_rate_limiter()
+
         if use_after_register_click:
+            rate_limiter.acquire()
             register_btn.click()
 
             # Wait for server to process registration - need guaranteed minimum wait time
@@ -154,10 +190,11 @@ class UserRegistrationFactory:
         else:
             # Wait for email validation to complete before clicking register
             page.wait_for_timeout(500)
+            rate_limiter.acquire()
             register_btn.click()
 
         # Wait for page to process registration and show OTP form
-        base_page.wait_for_network_idle(timeout=Timeouts.BASE_NETWORK_IDLE)
+        base_page.wait_for_network_idle(step="register_user", timeout=Timeouts.BASE_NETWORK_IDLE)
 
         # Wait for OTP title to appear first (more reliable indicator than container)
         otp_title = page.locator(reg_locators.otp_title).first
@@ -183,6 +220,7 @@ class UserRegistrationFactory:
 
         # Submit OTP
         otp_send_button = page.locator(reg_locators.otp_send_button).first
+        rate_limiter.acquire()
         otp_send_button.click()
 
         # Wait for login to complete - need guaranteed minimum wait time
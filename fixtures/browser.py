@@ -9,6 +9,10 @@ from playwright.sync_api import expect, sync_playwright
 from config.auth_config import PASSWORD, USERNAME, BASE_URL
 from config.devices_config import DEVICE_NAMES, get_device_config
 from config.timeouts import Timeouts
+from fixtures.browser_server import get_ws_endpoint
+from fixtures.context_pool import ContextPool, get_context_pool_size, is_context_pool_enabled, page_scope
+from utils.page_activity import install_activity_tracker
+from utils.request_blocker import get_request_blocker
 
 
 @pytest.fixture(scope="session")
@@ -39,32 +43,46 @@ def _get_browser_type_from_config(request=None):
     return browser_type
 
 
-@pytest.fixture(scope="session")
-def browser(playwright_instance, request):
+def is_headless() -> bool:
     # Default to headless in CI environments (GitHub Actions, GitLab CI, etc.)
     # or if HEADLESS env var is explicitly set
     is_ci = os.getenv("CI", "false").lower() == "true"
     headless_env = os.getenv("HEADLESS", "").lower()
 
     if headless_env:
-        is_headless = headless_env == "true"
+        return headless_env == "true"
 
-    else:
-        # In CI, default to headless; locally, default to headed for debugging
-        is_headless = is_ci
+    # In CI, default to headless; locally, default to headed for debugging
+    return is_ci
 
-    browser_type = _get_browser_type_from_config(request)
 
+def get_browser_launcher(playwright_instance, browser_type: str):
+    """BrowserType for sync or async Playwright instance"""
     if browser_type == "firefox":
-        browser = playwright_instance.firefox.launch(headless=is_headless)
+        return playwright_instance.firefox
 
     elif browser_type == "webkit":
-        browser = playwright_instance.webkit.launch(headless=is_headless)
+        return playwright_instance.webkit
+
+    return playwright_instance.chromium
+
+
+@pytest.fixture(scope="session")
+def browser(playwright_instance, request):
+    browser_type = _get_browser_type_from_config(request)
+    launcher = get_browser_launcher(playwright_instance, browser_type)
+
+    # Connect to shared browser server started by controller (BROWSER_SERVER=true)
+    ws_endpoint = get_ws_endpoint(browser_type)
+
+    if ws_endpoint:
+        browser = launcher.connect(ws_endpoint)
 
     else:
-        browser = playwright_instance.chromium.launch(headless=is_headless)
+        browser = launcher.launch(headless=is_headless())
 
     yield browser
+    # For connected browser this only disconnects - server keeps running for other workers
     browser.close()
 
 
@@ -83,13 +101,35 @@ def device_name():
     return device if device else "desktop"
 
 
-@pytest.fixture(scope="session")
-def context(browser, playwright_instance, device_name, request):
-    """Browser context fixture with device emulation and optional tracing"""
+def language_cookie() -> dict:
+    """Russian language cookie - tests run in Russian locale by default in CI"""
+    return {
+        "name": "i18n_redirected",
+        "value": "ru",
+        "domain": BASE_URL.replace("http://", "").replace("https://", "").split("/")[0],
+        "path": "/"
+    }
+
+
+def _set_language_cookie(context):
+    context.add_cookies([language_cookie()])
+
+
+def _is_tracing_enabled() -> bool:
+    enable_tracing = os.getenv("ENABLE_TRACING", "false").lower() == "true"
+    trace_on_failure = os.getenv("TRACE_ON_FAILURE", "true").lower() == "true"
+    return enable_tracing or trace_on_failure
+
+
+def get_context_options(playwright_instance, device_name, browser_type) -> tuple[dict, dict, str]:
+    """
+    Context settings shared by sync and async fixtures.
+
+    Returns device emulation config, extra HTTP headers (test labels and Basic auth) and trace title.
+    """
     device_config = get_device_config(playwright_instance, device_name)
     device_display_name = DEVICE_NAMES.get(device_name, device_name).replace("_", " ")
 
-    browser_type = _get_browser_type_from_config(request)
     browser_display_names = {
         "chromium": "Chromium",
         "firefox": "Firefox",
@@ -101,8 +141,6 @@ def context(browser, playwright_instance, device_name, request):
     viewport = device_config.get("viewport", {})
     viewport_info = f"{viewport.get('width', '?')}x{viewport.get('height', '?')}"
 
-    context = browser.new_context(**device_config)
-
     # Apply basic authentication for all pages in this context
     credentials = f"{USERNAME}:{PASSWORD}"
     encoded_credentials = base64.b64encode(credentials.encode()).decode()
@@ -114,14 +152,97 @@ def context(browser, playwright_instance, device_name, request):
         "Authorization": f"Basic {encoded_credentials}",
     }
 
+    trace_title = f"{device_display_name} - {browser_display_name} ({viewport_info})"
+    return device_config, headers, trace_title
+
+
+def create_context(browser, playwright_instance, device_name, browser_type):
+    """New context with device emulation, test headers, Basic auth and language cookie"""
+    device_config, headers, trace_title = get_context_options(playwright_instance, device_name, browser_type)
+
+    context = browser.new_context(**device_config)
     context.set_extra_http_headers(headers)
 
     # Store headers in context for later use (to preserve Authorization when updating headers)
     context._base_http_headers = headers.copy()
 
-    enable_tracing = os.getenv("ENABLE_TRACING", "false").lower() == "true"
-    trace_on_failure = os.getenv("TRACE_ON_FAILURE", "true").lower() == "true"
-    enable_tracing = enable_tracing or trace_on_failure
+    if _is_tracing_enabled():
+        context.tracing.start(
+            screenshots=True,
+            snapshots=True,
+            sources=True,
+            title=trace_title
+        )
+
+    # Pending fetch/XHR counter used by stability waits (BasePage.wait_for_stable)
+    install_activity_tracker(context)
+
+    # Non-essential requests are blocked only while functional tests run (BLOCK_REQUESTS=true)
+    request_blocker = get_request_blocker()
+    if request_blocker:
+        request_blocker.attach(context)
+
+    # Cookie needs to be set after context is created but before pages are used
+    try:
+        if BASE_URL:
+            _set_language_cookie(context)
+
+    except Exception as e:
+        # If cookie setting fails, log warning but don't fail tests
+        logging.warning(f"Failed to set language cookie: {e}")
+
+    return context
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser, playwright_instance, device_name, request):
+    """Contexts warming up in the background for per-test isolation (CONTEXT_POOL, default on), None otherwise"""
+    if not is_context_pool_enabled():
+        yield None
+        return
+
+    browser_type = _get_browser_type_from_config(request)
+    pool = ContextPool(
+        lambda: create_context(browser, playwright_instance, device_name, browser_type),
+        size=get_context_pool_size(),
+    )
+    pool.fill()
+
+    yield pool
+
+    pool.close()
+    if pool.waits:
+        logging.info(f"Context pool: {pool.waits} tests waited for context warm-up")
+
+
+@pytest.fixture(scope=page_scope)
+def context(browser, playwright_instance, device_name, request, context_pool):
+    """Browser context fixture with device emulation and optional tracing"""
+    if context_pool:
+        pooled_context = context_pool.acquire()
+
+        # Pooled context is taken after pytest_runtest_setup, so the test's trace chunk is started
+        # here, then stopped or saved on failure by pytest_runtest_makereport like for the shared context
+        trace_on_failure = os.getenv("TRACE_ON_FAILURE", "true").lower() == "true"
+        if trace_on_failure:
+            pooled_context.tracing.start_chunk()
+            request.node._trace_chunk_started = True
+
+        yield pooled_context
+
+        if _is_tracing_enabled():
+            request.node._trace_chunk_started = False
+            try:
+                pooled_context.tracing.stop()
+
+            except Exception as e:
+                logging.debug(f"Failed to stop tracing of pooled context: {e}")
+
+        context_pool.release(pooled_context)
+        return
+
+    browser_type = _get_browser_type_from_config(request)
+    context = create_context(browser, playwright_instance, device_name, browser_type)
 
     base_trace_dir = os.getenv("TRACE_DIR", "reports/trace")
     worker_id = os.environ.get("PYTEST_XDIST_WORKER", "")
@@ -133,34 +254,9 @@ def context(browser, playwright_instance, device_name, request):
         trace_dir = Path(base_trace_dir) / device_name / browser_type
     trace_filename = trace_dir / "trace.zip"
 
+    enable_tracing = _is_tracing_enabled()
     if enable_tracing:
         trace_dir.mkdir(parents=True, exist_ok=True)
-        context.tracing.start(
-            screenshots=True,
-            snapshots=True,
-            sources=True,
-            title=f"{device_display_name} - {browser_display_name} ({viewport_info})"
-        )
-
-    # Set language cookie to Russian for all tests
-    # This ensures tests run in Russian locale by default in CI
-    # Cookie needs to be set after context is created but before pages are used
-    try:
-        if BASE_URL:
-            # Create a temporary page to set cookies (required by Playwright)
-            temp_page = context.new_page()
-            temp_page.goto(f"{BASE_URL}/", wait_until="domcontentloaded", timeout=5000)
-            context.add_cookies([{
-                "name": "i18n_redirected",
-                "value": "ru",
-                "domain": BASE_URL.replace("http://", "").replace("https://", "").split("/")[0],
-                "path": "/"
-            }])
-            temp_page.close()
-
-    except Exception as e:
-        # If cookie setting fails, log warning but don't fail tests
-        print(f"Warning: Failed to set language cookie: {e}")
 
     yield context
 
@@ -175,25 +271,26 @@ def context(browser, playwright_instance, device_name, request):
     context.close()
 
 
-@pytest.fixture(scope="session")
-def page(context):
-    """Page fixture - opens once per test session"""
-    page = context.new_page()
+@pytest.fixture(scope=page_scope)
+def page(context, context_pool):
+    """Page fixture - opens once per test session, or per test with the context pool"""
+    # Pooled context already has an open page with language cookie set
+    page = context.pages[0] if context_pool and context.pages else context.new_page()
     page.set_default_timeout(Timeouts.BASE_PAGE_LOAD)
     page.set_default_navigation_timeout(Timeouts.BASE_PAGE_LOAD)
     expect.set_options(timeout=Timeouts.BASE_ELEMENT_VISIBLE)
 
+    # Page is closed with the pooled context
+    if context_pool:
+        yield page
+        return
+
     # Ensure language cookie is set (in case it was cleared)
     # Navigate to site to set cookie
     try:
         if BASE_URL:
             page.goto(f"{BASE_URL}/", wait_until="domcontentloaded", timeout=5000)
-            context.add_cookies([{
-                "name": "i18n_redirected",
-                "value": "ru",
-                "domain": BASE_URL.replace("http://", "").replace("https://", "").split("/")[0],
-                "path": "/"
-            }])
+            _set_language_cookie(context)
 
     except Exception as e:
         logging.warning(f"Failed to set language cookie: {e}")
@@ -0,0 +1,108 @@
+"""Shared browser servers: controller launches them once, xdist workers connect over websocket"""
+
+import json
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SERVERS_DIR = Path(os.getenv("BROWSER_SERVER_DIR", "reports/.browser_servers"))
+ENDPOINTS_FILE = SERVERS_DIR / "endpoints.json"
+
+
+def is_browser_server_enabled() -> bool:
+    """Optional mode, enabled with BROWSER_SERVER=true"""
+    return os.getenv("BROWSER_SERVER", "false").lower() == "true"
+
+
+def _get_servers_count() -> int:
+    """BROWSER_SERVER_COUNT or one browser server per 4 CPU cores"""
+    default_count = max(1, (os.cpu_count() or 1) // 4)
+    return int(os.getenv("BROWSER_SERVER_COUNT", str(default_count)))
+
+
+class BrowserServerPool:
+    """Browser servers started with `playwright launch-server` (Python API has no launch_server)"""
+
+    def __init__(self, browser_type: str, headless: bool):
+        self.browser_type = browser_type
+        self.headless = headless
+        self.processes: list[subprocess.Popen] = []
+
+    def start(self, count: int) -> list[str]:
+        """Launch servers in parallel and publish their ws endpoints for workers"""
+        SERVERS_DIR.mkdir(parents=True, exist_ok=True)
+        config_path = SERVERS_DIR / f"{self.browser_type}-config.json"
+        config_path.write_text(json.dumps({"headless": self.headless}), encoding="utf-8")
+
+        for _ in range(count):
+            self.processes.append(subprocess.Popen(
+                [sys.executable, "-m", "playwright", "launch-server",
+                 "--browser", self.browser_type, "--config", str(config_path)],
+                stdout=subprocess.PIPE,
+                text=True,
+            ))
+
+        endpoints = []
+        for process in self.processes:
+            # Server prints its ws endpoint as the only stdout line once the browser is ready
+            line = process.stdout.readline().strip()
+
+            if line.startswith("ws://"):
+                endpoints.append(line)
+            else:
+                logging.warning(f"Browser server did not report ws endpoint (exit code {process.poll()})")
+
+        ENDPOINTS_FILE.write_text(
+            json.dumps({"browser_type": self.browser_type, "endpoints": endpoints}),
+            encoding="utf-8"
+        )
+        logging.info(f"Started {len(endpoints)} {self.browser_type} browser server(s)")
+        return endpoints
+
+    def stop(self) -> None:
+        for process in self.processes:
+            process.terminate()
+
+        for process in self.processes:
+            try:
+                process.wait(timeout=10)
+
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+        self.processes.clear()
+        ENDPOINTS_FILE.unlink(missing_ok=True)
+
+
+def start_browser_servers(config, browser_type: str, headless: bool) -> BrowserServerPool | None:
+    """Start browser servers in controller process (not in xdist workers)"""
+    if hasattr(config, "workerinput") or not is_browser_server_enabled():
+        return None
+
+    pool = BrowserServerPool(browser_type, headless)
+    pool.start(_get_servers_count())
+    return pool
+
+
+def get_ws_endpoint(browser_type: str) -> str | None:
+    """Pick browser server for current worker (round-robin by worker number)"""
+    if not is_browser_server_enabled() or not ENDPOINTS_FILE.exists():
+        return None
+
+    data = json.loads(ENDPOINTS_FILE.read_text(encoding="utf-8"))
+    endpoints = data.get("endpoints", [])
+
+    if data.get("browser_type") != browser_type or not endpoints:
+        return None
+
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+
+    try:
+        worker_num = int(worker_id.replace("gw", ""))
+
+    except ValueError:
+        worker_num = 0
+
+    return endpoints[worker_num % len(endpoints)]
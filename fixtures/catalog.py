@@ -1,11 +1,25 @@
 import pytest
 
 from config.auth_config import BASE_URL
+from fixtures.context_pool import page_scope
 from locators.catalog_locators import CatalogLocators
 from pages.catalog_page import CatalogPage
 
+ECU_PAGE_PATHS = [
+    "car/bmw-mini/diesel",
+    "car/bmw-mini/petrol",
+    "car/bmw-mini/gearbox",
+    "car/mercedes/diesel",
+    "car/mercedes/petrol",
+    "car/vag-cars-porsche-audi/diesel",
+    "car/vag-cars-porsche-audi/petrol",
+    "car/vag-cars-porsche-audi/gearbox",
+    "car/ford/diesel",
+    "car/ford/petrol",
+]
 
-@pytest.fixture(scope="session")
+
+@pytest.fixture(scope=page_scope)
 def catalog_brand_page(page):
     """Catalog brand page fixture (shows brand links like BMW, Audi, etc.)"""
     catalog_page = CatalogPage(page)
@@ -13,7 +27,7 @@ def catalog_brand_page(page):
     return catalog_page
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture(scope=page_scope)
 def catalog_engine_page(page):
     """Catalog engine page fixture (shows engine types for a specific brand)"""
     catalog_page = CatalogPage(page)
@@ -21,7 +35,7 @@ def catalog_engine_page(page):
     return catalog_page
 
 
-@pytest.fixture(scope="session", params=[
+@pytest.fixture(scope=page_scope, params=[
     "car/bmw-mini",
     "car/mercedes",
     "car/vag-cars-porsche-audi",
@@ -36,7 +50,7 @@ def catalog_engine_page_param(page, request):
     return catalog_page
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture(scope=page_scope)
 def catalog_ecu_page(page):
     """Catalog ECU/block selection page fixture"""
     catalog_page = CatalogPage(page)
@@ -44,26 +58,7 @@ def catalog_ecu_page(page):
     return catalog_page
 
 
-@pytest.fixture(scope="session", params=[
-    "car/bmw-mini/diesel",
-    "car/bmw-mini/petrol",
-    "car/bmw-mini/gearbox",
-    "car/mercedes/diesel",
-    "car/mercedes/petrol",
-    "car/vag-cars-porsche-audi/diesel",
-    "car/vag-cars-porsche-audi/petrol",
-    "car/vag-cars-porsche-audi/gearbox",
-    "car/ford/diesel",
-    "car/ford/petrol",
-])
-def catalog_ecu_page_param(page, request):
-    """Catalog ECU/block selection page fixture with parametrization for different brands and engine types"""
-    catalog_page = CatalogPage(page)
-    catalog_page.navigate_to_ecu_page(request.param)
-    return catalog_page
-
-
-@pytest.fixture(scope="session")
+@pytest.fixture(scope=page_scope)
 def catalog_stock_page(page):
     """Catalog stock list page fixture"""
     catalog_page = CatalogPage(page)
@@ -71,7 +66,7 @@ def catalog_stock_page(page):
     return catalog_page
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture(scope=page_scope)
 def catalog_stock_card_page(page):
     """Catalog stock card page fixture (opened stock item)"""
     catalog_page = CatalogPage(page)
@@ -79,7 +74,7 @@ def catalog_stock_card_page(page):
     return catalog_page
 
 
-@pytest.fixture(scope="session", params=[
+@pytest.fixture(scope=page_scope, params=[
     "car/bmw-mini/diesel/bosch-edc15",
     "car/bmw-mini/petrol/bosch-bms46me7m5",
     "car/bmw-mini/gearbox/zf-8hp45hp70hp76",
@@ -124,7 +119,7 @@ def catalog_stock_card_page_param(page, request):
     return catalog_page, stock_list_path
 
 
-@pytest.fixture(scope="session", params=[
+@pytest.fixture(scope=page_scope, params=[
     "car/bmw-mini/diesel/bosch-edc15",
     "car/bmw-mini/petrol/bosch-bms46me7m5",
     "car/bmw-mini/gearbox/zf-8hp45hp70hp76",
@@ -143,7 +138,7 @@ def catalog_stock_page_param(page, request):
     return catalog_page
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture(scope=page_scope)
 def get_all_brands_from_catalog(page):
     """Fixture to dynamically get all brand links from catalog/car page"""
     catalog_page = CatalogPage(page)
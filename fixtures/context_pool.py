@@ -0,0 +1,157 @@
+"""
+Pool of pre-configured browser contexts warmed up in the background, so every test starts from a clean
+context without waiting for its creation.
+
+Sync Playwright objects are bound to the thread that created them, so contexts can't be created in
+another thread. They are created on the test thread in greenlets started by the Playwright event loop:
+a warm-up advances whenever the test waits for the browser (navigation, clicks, expect), closing a used
+context runs the same way. Only a test taking a context that is still warming up waits for the rest.
+"""
+
+import asyncio
+import logging
+import os
+from collections import deque
+from typing import Any, Callable
+
+from greenlet import greenlet
+from playwright.sync_api import BrowserContext
+
+
+def is_context_pool_enabled() -> bool:
+    """Enabled by default, CONTEXT_POOL=false goes back to one shared context and tab per session"""
+    return os.getenv("CONTEXT_POOL", "true").lower() == "true"
+
+
+def get_context_pool_size() -> int:
+    """CONTEXT_POOL_SIZE contexts kept warming up ahead of tests (default 2)"""
+    return max(int(os.getenv("CONTEXT_POOL_SIZE", "2")), 1)
+
+
+def page_scope(fixture_name: str, config) -> str:
+    """
+    Dynamic scope for `context`, `page` and page object fixtures built on them.
+
+    Function scope with the context pool (every test takes its own context),
+    session scope without it (one shared tab).
+    """
+    return "function" if is_context_pool_enabled() else "session"
+
+
+def _get_playwright_loop() -> asyncio.AbstractEventLoop | None:
+    # Sync Playwright leaves its event loop marked as running on the test thread
+    try:
+        return asyncio.get_running_loop()
+
+    except RuntimeError:
+        return None
+
+
+class BackgroundCall:
+    """
+    Sync Playwright calls run in a greenlet on the test thread.
+
+    The greenlet is started by the Playwright event loop and switches back to it on every wait,
+    so it advances while the test itself waits for the browser. result() drives it to the end.
+    """
+
+    def __init__(self, func: Callable[[], Any]):
+        self._func = func
+        self._greenlet = greenlet(self._run)
+        self._value = None
+        self._error: Exception | None = None
+
+        loop = _get_playwright_loop()
+        if loop:
+            loop.call_soon(self._start)
+
+    def _run(self) -> None:
+        try:
+            self._value = self._func()
+
+        except Exception as e:
+            self._error = e
+
+    def _start(self) -> None:
+        # Not started by result() yet
+        if not self._greenlet and not self._greenlet.dead:
+            self._greenlet.switch()
+
+    @property
+    def done(self) -> bool:
+        return self._greenlet.dead
+
+    def result(self) -> Any:
+        """Value of the call, waiting (and driving the event loop) until it finishes"""
+        # Other greenlets' callbacks may switch back here early, so switch until the call is over
+        while not self._greenlet.dead:
+            self._greenlet.switch()
+
+        if self._error:
+            raise self._error
+
+        return self._value
+
+
+class ContextPool:
+    """
+    Keeps `size` contexts warming up, each with one open page.
+
+    acquire() takes the oldest one and starts warming up its replacement, release() closes
+    the used context in the background.
+    """
+
+    def __init__(self, factory: Callable[[], BrowserContext], size: int):
+        self.factory = factory
+        self.size = max(size, 1)
+        self.warming: deque[BackgroundCall] = deque()
+        self.closing: list[BackgroundCall] = []
+        self.waits = 0
+
+    def _create(self) -> BrowserContext:
+        context = self.factory()
+        context.new_page()
+        return context
+
+    def fill(self) -> None:
+        while len(self.warming) < self.size:
+            self.warming.append(BackgroundCall(self._create))
+
+    def acquire(self) -> BrowserContext:
+        """Take the oldest warmed up context, waiting for the rest of its warm-up if needed"""
+        if not self.warming:
+            self.fill()
+
+        call = self.warming.popleft()
+        if not call.done:
+            self.waits += 1
+            logging.debug(f"Context pool: waiting for context warm-up (waits: {self.waits})")
+
+        try:
+            return call.result()
+
+        finally:
+            self.fill()
+
+    def release(self, context: BrowserContext) -> None:
+        """Close used context in the background"""
+        self.closing = [call for call in self.closing if not call.done]
+        self.closing.append(BackgroundCall(context.close))
+
+    def close(self) -> None:
+        """Finish background work and close contexts that were never taken"""
+        for call in self.closing:
+            try:
+                call.result()
+
+            except Exception as e:
+                logging.debug(f"Failed to close pooled context: {e}")
+
+        while self.warming:
+            try:
+                self.warming.popleft().result().close()
+
+            except Exception as e:
+                logging.debug(f"Failed to close pooled context: {e}")
+
+        self.closing.clear()
@@ -1,5 +1,6 @@
 import pytest
 
+from fixtures.context_pool import page_scope
 from pages.catalog_page import CatalogPage
 from pages.contacts_page import ContactsPage
 from pages.home_page import HomePage
@@ -12,45 +13,45 @@ from pages.registration_page import RegistrationPage
 def home_page(page):
     home_page = HomePage(page)
     home_page.navigate_to_main()
-    home_page.wait_for_network_idle()
+    home_page.wait_for_network_idle(step="home_page")
     return home_page
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture(scope=page_scope)
 def catalog_page(page):
     catalog_page = CatalogPage(page)
     catalog_page.navigate_to_catalog()
-    catalog_page.wait_for_network_idle()
+    catalog_page.wait_for_network_idle(step="catalog_page")
     return catalog_page
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture(scope=page_scope)
 def pricing_page(page):
     pricing_page = PricingPage(page)
     pricing_page.navigate_to_pricing()
-    pricing_page.wait_for_network_idle()
+    pricing_page.wait_for_network_idle(step="pricing_page")
     return pricing_page
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture(scope=page_scope)
 def login_page(page):
     login_page = LoginPage(page)
     login_page.navigate_to_login()
-    login_page.wait_for_network_idle()
+    login_page.wait_for_network_idle(step="login_page")
     return login_page
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture(scope=page_scope)
 def registration_page(page):
     registration_page = RegistrationPage(page)
     registration_page.navigate_to_registration()
-    registration_page.wait_for_network_idle()
+    registration_page.wait_for_network_idle(step="registration_page")
     return registration_page
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture(scope=page_scope)
 def contacts_page(page):
     contacts_page = ContactsPage(page)
     contacts_page.navigate_to_contacts()
-    contacts_page.wait_for_network_idle()
+    contacts_page.wait_for_network_idle(step="contacts_page")
     return contacts_page
@@ -0,0 +1,223 @@
+"""Pool of users registered once per run and leased to xdist workers"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import sync_playwright
+
+from auth.api_client import AuthApiClient, AuthApiError, is_auth_api_available
+from config.auth_config import AUTH_VIA_API
+from fixtures.auth_factory import UserRegistrationFactory
+from utils.file_lock import file_lock
+
+POOL_DIR = Path(os.getenv("USER_POOL_DIR", "reports/.user_pool"))
+POOL_WAIT_TIMEOUT = float(os.getenv("USER_POOL_WAIT_TIMEOUT", "120"))
+POOL_POLL_INTERVAL = 0.5
+
+
+@dataclass
+class PooledUser:
+    user_type: str
+    email: str
+    state_path: str
+    leased_by: str | None = None
+    consumed: bool = False
+
+
+class UserPool:
+    """
+    Lock-protected JSON pool file shared by all workers.
+
+    Users are leased exclusively. Leased users are either returned with release()
+    (their session is still valid) or stay consumed if the test changed the account.
+    """
+
+    def __init__(self, pool_dir: Path = POOL_DIR, worker_id: str = "main"):
+        self.pool_dir = pool_dir
+        self.worker_id = worker_id
+        self.pool_file = pool_dir / "pool.json"
+        self.lock_file = pool_dir / "pool.lock"
+
+    def _read(self) -> dict:
+        if not self.pool_file.exists():
+            return {"ready": True, "users": []}
+
+        return json.loads(self.pool_file.read_text(encoding="utf-8"))
+
+    def _write(self, data: dict) -> None:
+        tmp_file = self.pool_file.with_suffix(".tmp")
+        tmp_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        tmp_file.replace(self.pool_file)
+
+    def reset(self) -> None:
+        """Start new pool - leasing waits until mark_ready() is called"""
+        with file_lock(self.lock_file):
+            for state_file in self.pool_dir.glob("*.state.json"):
+                state_file.unlink(missing_ok=True)
+            self._write({"ready": False, "users": []})
+
+    def add(self, user: PooledUser) -> None:
+        with file_lock(self.lock_file):
+            data = self._read()
+            data["users"].append(asdict(user))
+            self._write(data)
+
+    def mark_ready(self) -> None:
+        with file_lock(self.lock_file):
+            data = self._read()
+            data["ready"] = True
+            self._write(data)
+
+    def lease(self, user_type: str, timeout: float = POOL_WAIT_TIMEOUT) -> PooledUser | None:
+        """Lease free user of given type, waiting for provisioning if needed"""
+        deadline = time.time() + timeout
+
+        while True:
+            with file_lock(self.lock_file):
+                data = self._read()
+
+                for user in data["users"]:
+                    if user["user_type"] == user_type and user["leased_by"] is None and not user["consumed"]:
+                        user["leased_by"] = self.worker_id
+                        self._write(data)
+                        return PooledUser(**user)
+
+                if data["ready"]:
+                    return None
+
+            if time.time() >= deadline:
+                logging.warning(f"Timed out waiting for pooled '{user_type}' user")
+                return None
+
+            time.sleep(POOL_POLL_INTERVAL)
+
+    def _update(self, email: str, **fields) -> None:
+        with file_lock(self.lock_file):
+            data = self._read()
+
+            for user in data["users"]:
+                if user["email"] == email:
+                    user.update(fields)
+
+            self._write(data)
+
+    def release(self, user: PooledUser) -> None:
+        """Return user to the pool - session is still valid"""
+        self._update(user.email, leased_by=None)
+
+    def consume(self, user: PooledUser) -> None:
+        """Never lease this user again - account state was changed by a test"""
+        self._update(user.email, consumed=True)
+
+    def release_all(self) -> None:
+        """Return all users leased by this worker"""
+        with file_lock(self.lock_file):
+            data = self._read()
+
+            for user in data["users"]:
+                if user["leased_by"] == self.worker_id and not user["consumed"]:
+                    user["leased_by"] = None
+
+            self._write(data)
+
+
+def _get_workers_count(config) -> int:
+    # xdist workers run with numprocesses=None - the controller passes the count to them
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput and "workercount" in workerinput:
+        return max(int(workerinput["workercount"]), 1)
+
+    worker_count = os.getenv("PYTEST_XDIST_WORKER_COUNT", "")
+    if worker_count.isdigit():
+        return max(int(worker_count), 1)
+
+    numprocesses = getattr(config.option, "numprocesses", None)
+
+    if isinstance(numprocesses, int):
+        return max(numprocesses, 1)
+
+    if numprocesses in ("auto", "logical"):
+        return os.cpu_count() or 1
+
+    return 1
+
+
+def is_user_pool_enabled(config) -> bool:
+    """USER_POOL=true/false, by default enabled only for xdist runs with several workers"""
+    setting = os.getenv("USER_POOL", "auto").lower()
+
+    if setting == "auto":
+        return AUTH_VIA_API and _get_workers_count(config) > 1
+
+    return setting == "true"
+
+
+def provision_users(pool: UserPool, user_types: list[str], size: int) -> None:
+    """Register `size` users of every type through auth API and add them to the pool"""
+    try:
+        with sync_playwright() as playwright:
+            # Round-robin over types so every type gets its first user as early as possible
+            for _ in range(size):
+                for user_type in user_types:
+                    if not is_auth_api_available():
+                        return
+
+                    email = UserRegistrationFactory.generate_email(user_type)
+                    api_client = AuthApiClient.from_playwright(playwright)
+
+                    try:
+                        api_client.register_and_login(email)
+                        state_path = pool.pool_dir / f"{email}.state.json"
+                        api_client.request.storage_state(path=str(state_path))
+                        pool.add(PooledUser(user_type=user_type, email=email, state_path=str(state_path)))
+
+                    except (AuthApiError, PlaywrightError) as e:
+                        logging.warning(f"Failed to provision '{user_type}' user: {e}")
+
+                    finally:
+                        api_client.dispose()
+
+    finally:
+        pool.mark_ready()
+
+
+def start_user_pool_provisioning(config) -> threading.Thread | None:
+    """Start provisioning in background so it runs in parallel with worker and browser start"""
+    if hasattr(config, "workerinput") or not is_user_pool_enabled(config):
+        return None
+
+    size = int(os.getenv("USER_POOL_SIZE", str(_get_workers_count(config))))
+    user_types = list(UserRegistrationFactory.USER_GENERATORS)
+
+    pool = UserPool()
+    pool.reset()
+
+    thread = threading.Thread(
+        target=provision_users,
+        args=(pool, user_types, size),
+        name="user-pool-provisioning",
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+@pytest.fixture(scope="session")
+def user_pool(request):
+    """User pool for current worker, None if pool is disabled"""
+    if not is_user_pool_enabled(request.config):
+        yield None
+        return
+
+    pool = UserPool(worker_id=os.environ.get("PYTEST_XDIST_WORKER", "main"))
+
+    yield pool
+
+    pool.release_all()
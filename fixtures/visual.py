@@ -1,13 +1,142 @@
 """Visual regression testing fixtures and utilities for pytest-playwright-visual-snapshot"""
 
 import logging
+import multiprocessing
 import os
 import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
 
 import allure
 import pytest
+from playwright.sync_api import Locator, Page
 
+from config.viewports import VIEWPORTS
 from utils.allure_helpers import attach_visual_snapshot_comparison
+from utils.baseline_update import record_baseline_update, write_reference
+from utils.snapshot_manifest import get_snapshot_manifest
+from utils.stabilize import stabilize, unstabilize
+from utils.viewport_emulation import ViewportEmulation, supports_viewport_emulation
+from utils.visual_diff import SnapshotJob, compare_snapshot
+
+SNAPSHOT_MISMATCH_MESSAGE = "[playwright-visual-snapshot] Snapshots DO NOT match!"
+
+
+def _is_numpy_engine_enabled() -> bool:
+    """VISUAL_DIFF_ENGINE=plugin compares with pytest-playwright-visual-snapshot (pixelmatch)"""
+    return os.getenv("VISUAL_DIFF_ENGINE", "numpy").lower() == "numpy"
+
+
+def _is_deferred_comparison_enabled() -> bool:
+    """VISUAL_DIFF_DEFERRED=true compares in a process pool while the test goes on"""
+    return os.getenv("VISUAL_DIFF_DEFERRED", "false").lower() == "true"
+
+
+def _is_ci_write_back_enabled() -> bool:
+    """On GitHub Actions mismatching captures overwrite references like the plugin does (references/ artifact)"""
+    return bool(os.getenv("GITHUB_ACTIONS"))
+
+
+def _is_region_clip_enabled() -> bool:
+    """
+    PIXEL_REGION_CLIP=true captures a Locator as a full page clip of its document box (regions taller
+    than the viewport fit too). Default is locator.screenshot() - the way references were captured.
+    """
+    return os.getenv("PIXEL_REGION_CLIP", "false").lower() == "true"
+
+
+def _get_pixel_viewports() -> list[str]:
+    """
+    PIXEL_VIEWPORTS=all or comma separated VIEWPORTS names (desktop,mobile,tablet).
+
+    Page and Locator snapshots are then captured in every listed viewport from the same page state.
+    Empty (default) captures the DEVICE viewport only.
+    """
+    value = os.getenv("PIXEL_VIEWPORTS", "").strip().lower()
+    if not value:
+        return []
+
+    viewports = list(VIEWPORTS) if value == "all" else [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in viewports if name not in VIEWPORTS]
+    if unknown:
+        raise ValueError(f"Unknown PIXEL_VIEWPORTS {', '.join(unknown)}. Available: {', '.join(VIEWPORTS)}")
+
+    return viewports
+
+
+DEFERRED_SNAPSHOTS_KEY = pytest.StashKey[list[tuple[Future, SnapshotJob]]]()
+
+_comparison_pool: ProcessPoolExecutor | None = None
+
+
+def _get_comparison_pool_size() -> int:
+    """VISUAL_DIFF_WORKERS, default CPU count shared between xdist workers (at least 1 each)"""
+    workers = int(os.getenv("VISUAL_DIFF_WORKERS", "0"))
+    if workers:
+        return workers
+
+    xdist_workers = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+    return max(1, (os.cpu_count() or 1) // xdist_workers)
+
+
+def _get_comparison_pool() -> ProcessPoolExecutor:
+    """Process pool for deferred comparisons, one per xdist worker"""
+    global _comparison_pool
+
+    if _comparison_pool is None:
+        _comparison_pool = ProcessPoolExecutor(
+            max_workers=_get_comparison_pool_size(),
+            # Forking a process with running Playwright threads is unsafe
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    return _comparison_pool
+
+
+def shutdown_comparison_pool() -> None:
+    global _comparison_pool
+
+    if _comparison_pool is not None:
+        _comparison_pool.shutdown(wait=True, cancel_futures=True)
+        _comparison_pool = None
+
+
+def _check_deferred_snapshots(request) -> None:
+    """Wait for comparisons submitted by the test and fail it (in teardown, like the plugin) on mismatch"""
+    comparisons = request.node.stash.get(DEFERRED_SNAPSHOTS_KEY, [])
+    if not comparisons:
+        return
+
+    request.node.stash[DEFERRED_SNAPSHOTS_KEY] = []
+    test_name = request.node.nodeid
+    module_name = _extract_module_name(test_name)
+    failures = []
+
+    for future, job in comparisons:
+        try:
+            result = future.result()
+            if result.passed:
+                continue
+
+            failures.append(result.message)
+
+        except ValueError as e:
+            failures.append(str(e))
+
+        except Exception as e:
+            failures.append(f"{SNAPSHOT_MISMATCH_MESSAGE} comparison failed: {e}")
+            continue
+
+        _write_back_reference_on_ci(job)
+
+        # Comparison step has already passed - failure artifacts go into a teardown step of their own
+        with allure.step(f"Visual comparison failed: {job.name}"):
+            _attach_current_screenshot(job.actual_bytes)
+            attach_visual_snapshot_comparison(test_name, module_name, job.name, is_failed=True)
+
+    if failures:
+        pytest.fail("\n".join(failures))
 
 
 def _get_browser_name() -> str:
@@ -35,7 +164,7 @@ def _generate_snapshot_name_from_test(test_name: str) -> str:
     return test_name.split("[")[0]
 
 
-def _build_snapshot_name(title: str) -> str:
+def _build_snapshot_name(title: str, viewport: str | None = None) -> str:
     """
     Build snapshot name in format: {browser}-{viewport}-{title}.png
 
@@ -44,7 +173,7 @@ def _build_snapshot_name(title: str) -> str:
         webkit-desktop-test_footer.png
     """
     browser = _get_browser_name()
-    viewport = _get_viewport_name()
+    viewport = viewport or _get_viewport_name()
 
     # Clean up title
     clean_title = title
@@ -80,18 +209,11 @@ def _extract_module_name(test_name: str) -> str:
     return module_name
 
 
-def _get_screenshot_bytes(screenshot) -> bytes | None:
-    """Extract screenshot bytes from screenshot object."""
-    if isinstance(screenshot, bytes):
-        return screenshot
-
-    try:
-        if hasattr(screenshot, 'screenshot'):
-            return screenshot.screenshot()
-    except Exception as e:
-        logging.debug(f"Failed to get screenshot bytes from object: {e}")
-
-    return None
+@dataclass
+class SnapshotCapture:
+    """Screenshot taken once for Allure attachment, comparison and reference update"""
+    data: bytes
+    masks: list[tuple[int, int, int, int]] = field(default_factory=list)
 
 
 def _attach_current_screenshot(screenshot_bytes: bytes | None) -> None:
@@ -104,17 +226,196 @@ def _attach_current_screenshot(screenshot_bytes: bytes | None) -> None:
         )
 
 
-def _handle_snapshot_assertion(assert_snapshot_func, screenshot, name: str, threshold, fail_fast, mask_elements,
-                              test_name: str, module_name: str):
+def _get_region_box(locator: Locator) -> dict:
+    """Element box in document coordinates"""
+    return locator.evaluate(
+        "e => { const r = e.getBoundingClientRect(); return {x: r.x + window.scrollX, y: r.y + window.scrollY, width: r.width, height: r.height}; }"
+    )
+
+
+def _get_region_clip(locator: Locator) -> dict:
+    """Element box in document coordinates for a full page clip (regions taller than viewport fit too)"""
+    locator.scroll_into_view_if_needed()
+    return _get_region_box(locator)
+
+
+def _get_mask_rectangles(page, mask_elements, clip: dict | None) -> list[tuple[int, int, int, int]]:
+    """Masked elements as rectangles in screenshot coordinates (clip origin in document coordinates, None - viewport)"""
+    viewport = page.evaluate("() => ({x: window.scrollX, y: window.scrollY, scale: window.devicePixelRatio})")
+    origin = clip or viewport
+    scale = viewport["scale"]
+
+    rectangles = []
+    for selector in mask_elements:
+        for box in page.locator(selector).evaluate_all(
+            "elements => elements.map(e => { const r = e.getBoundingClientRect(); return {x: r.x + window.scrollX, y: r.y + window.scrollY, width: r.width, height: r.height}; })"
+        ):
+            x = box["x"] - origin["x"]
+            y = box["y"] - origin["y"]
+            rectangles.append((int(x * scale), int(y * scale), int(box["width"] * scale) + 1, int(box["height"] * scale) + 1))
+
+    return rectangles
+
+
+def _capture_snapshot(screenshot, mask_elements, full_page: bool = False) -> SnapshotCapture:
+    """
+    Capture Page (viewport, whole document with full_page) or Locator (locator.screenshot(), its box as
+    full page clip with PIXEL_REGION_CLIP) once, masked elements painted over the way the plugin does.
+    Bytes are used as given.
+    """
+    if isinstance(screenshot, bytes):
+        return SnapshotCapture(screenshot)
+
+    page = screenshot.page if isinstance(screenshot, Locator) else screenshot
+    mask = [page.locator(selector) for selector in mask_elements or []]
+
+    if isinstance(screenshot, Locator) and not _is_region_clip_enabled():
+        data = screenshot.screenshot(animations="disabled", type="png", mask=mask)
+        masks = _get_mask_rectangles(page, mask_elements, _get_region_box(screenshot)) if mask_elements else []
+        return SnapshotCapture(data, masks)
+
+    clip = _get_region_clip(screenshot) if isinstance(screenshot, Locator) else None
+    full_page = full_page or clip is not None
+
+    data = page.screenshot(animations="disabled", type="png", mask=mask, full_page=full_page, clip=clip)
+    origin = clip or ({"x": 0, "y": 0} if full_page else None)
+    masks = _get_mask_rectangles(page, mask_elements, origin) if mask_elements else []
+
+    return SnapshotCapture(data, masks)
+
+
+def _unstabilize_after_capture(screenshot, request) -> None:
+    """Drop stabilize() style once captured, page of bytes captures is taken from test fixtures"""
+    if isinstance(screenshot, Locator):
+        page = screenshot.page
+    elif isinstance(screenshot, Page):
+        page = screenshot
+    else:
+        page = next((value for value in request.node.funcargs.values() if isinstance(value, Page)), None)
+
+    if page is not None and not page.is_closed():
+        unstabilize(page)
+
+
+def _get_reference_file(config, test_name: str, name: str) -> Path:
+    """references/{module}/{test}/{name} - the path the plugin uses"""
+    return (
+        Path(config.getini("playwright_visual_snapshots_path") or "references")
+        / Path(test_name.split("::")[0]).stem / _generate_snapshot_name_from_test(test_name) / name
+    )
+
+
+def _is_updating_snapshots(request) -> bool:
+    return bool(request.config.getoption("update_snapshots", default=False))
+
+
+def _write_reference_file(reference_file: Path, data: bytes) -> None:
+    """Write capture as the new reference (atomically, only when content changed) and record the update"""
+    update = write_reference(reference_file, data)
+    record_baseline_update(update)
+
+    if update.status != "unchanged":
+        get_snapshot_manifest(reference_file.parents[2]).record(reference_file, data)
+        logging.info(f"Reference {update.status}: {reference_file}")
+
+
+def _update_reference_with_numpy(request, capture: SnapshotCapture, name: str, test_name: str) -> None:
+    _write_reference_file(_get_reference_file(request.config, test_name, name), capture.data)
+
+
+def _write_back_reference_on_ci(job: SnapshotJob) -> None:
+    """Mismatching capture replaces the reference on CI, expected_ failure image keeps the old one"""
+    if _is_ci_write_back_enabled():
+        _write_reference_file(job.expected_file, job.actual_bytes)
+
+
+def _compare_snapshot_with_numpy(request, capture: SnapshotCapture, name: str, threshold, test_name: str) -> bool:
+    """
+    Compare screenshot with reference using utils/visual_diff.
+
+    Returns False when the reference is missing - the plugin creates it.
+    Raises AssertionError and saves diff/actual/expected into snapshot failures dir on mismatch,
+    ValueError on size mismatch without playwright_visual_ignore_size_diff. On CI the capture then
+    replaces the reference.
+    """
+    config = request.config
+    module_file = Path(test_name.split("::")[0]).stem
+    expected_file = _get_reference_file(config, test_name, name)
+    if not expected_file.exists():
+        return False
+
+    actual_bytes = capture.data
+    expected_bytes = expected_file.read_bytes()
+
+    # Byte-identical capture - nothing to decode
+    if actual_bytes == expected_bytes:
+        return True
+
+    # Reference dimensions and pHash are only needed for the pHash pre-filter
+    phash_fail_distance = os.getenv("VISUAL_DIFF_PHASH_FAIL_DISTANCE")
+    reference = {}
+    if phash_fail_distance:
+        manifest = get_snapshot_manifest(expected_file.parents[2])
+        reference = manifest.get_entry(expected_file, expected_bytes, with_phash=True)
+    job = SnapshotJob(
+        name=name,
+        actual_bytes=actual_bytes,
+        expected_file=expected_file,
+        failures_dir=(
+            Path(config.getini("playwright_visual_snapshot_failures_path") or "snapshot_failures")
+            / module_file / request.node.name
+        ),
+        threshold=threshold if threshold is not None else 0.1,
+        channel_tolerance=int(os.getenv("VISUAL_DIFF_CHANNEL_TOLERANCE", "0")),
+        antialiasing=os.getenv("VISUAL_DIFF_ANTIALIASING", "true").lower() == "true",
+        masks=capture.masks,
+        ignore_size_diff=bool(config.getini("playwright_visual_ignore_size_diff")),
+        reference_size=(reference["width"], reference["height"]) if reference else None,
+        reference_phash=reference.get("phash"),
+        phash_fail_distance=int(phash_fail_distance) if phash_fail_distance else None,
+    )
+
+    if _is_deferred_comparison_enabled():
+        # Browser goes on with the test, result is checked in assert fixture teardown
+        request.node.stash.setdefault(DEFERRED_SNAPSHOTS_KEY, []).append(
+            (_get_comparison_pool().submit(compare_snapshot, job, SNAPSHOT_MISMATCH_MESSAGE), job)
+        )
+        return True
+
+    try:
+        result = compare_snapshot(job, SNAPSHOT_MISMATCH_MESSAGE)
+
+    except ValueError:
+        _write_back_reference_on_ci(job)
+        raise
+
+    if not result.passed:
+        _write_back_reference_on_ci(job)
+        raise AssertionError(result.message)
+
+    return True
+
+
+def _handle_snapshot_assertion(assert_snapshot_func, capture: SnapshotCapture, name: str, threshold, fail_fast,
+                              test_name: str, module_name: str, request=None):
     """Handle snapshot assertion with error handling and Allure attachments."""
     try:
-        result = assert_snapshot_func(
-            screenshot,
-            name=name,
-            threshold=threshold,
-            fail_fast=fail_fast,
-            mask_elements=mask_elements
-        )
+        if request and _is_numpy_engine_enabled() and _is_updating_snapshots(request):
+            _update_reference_with_numpy(request, capture, name, test_name)
+            result = None
+
+        elif request and _is_numpy_engine_enabled() and _compare_snapshot_with_numpy(
+                request, capture, name, threshold, test_name):
+            result = None
+
+        else:
+            # Masks are already painted into captured bytes
+            result = assert_snapshot_func(
+                capture.data,
+                name=name,
+                threshold=threshold,
+                fail_fast=fail_fast
+            )
 
         attach_visual_snapshot_comparison(
             test_name,
@@ -136,10 +437,31 @@ def _handle_snapshot_assertion(assert_snapshot_func, screenshot, name: str, thre
         raise
 
 
+def _assert_in_viewports(screenshot, viewports: list[str], assert_in_viewport, request) -> None:
+    """Resize, stabilize and compare snapshot in every viewport, then fail with all mismatches"""
+    page = screenshot.page if isinstance(screenshot, Locator) else screenshot
+    region = screenshot if isinstance(screenshot, Locator) else None
+    failures = []
+
+    with ViewportEmulation(page, request.getfixturevalue("playwright_instance"), _get_viewport_name()) as emulation:
+        for viewport in viewports:
+            emulation.apply(viewport)
+            stabilize(page, region)
+
+            try:
+                assert_in_viewport(viewport)
+
+            except AssertionError as e:
+                failures.append(str(e))
+
+    if failures:
+        raise AssertionError("\n".join(failures))
+
+
 def _add_allure_support(assert_snapshot_func, request, threshold_value=None):
     """Helper function to add Allure attachments to any assert_snapshot fixture."""
 
-    def _assert_with_allure(screenshot, name=None, threshold=None, fail_fast=False, mask_elements=None):
+    def _assert_with_allure(screenshot, name=None, threshold=None, fail_fast=False, mask_elements=None, full_page=False):
         if threshold is None and threshold_value is not None:
             threshold = threshold_value
 
@@ -148,26 +470,44 @@ def _add_allure_support(assert_snapshot_func, request, threshold_value=None):
         if name is None:
             name = _generate_snapshot_name_from_test(test_name)
 
-        # Build snapshot name with browser-viewport-title format
-        name = _build_snapshot_name(name)
-
         module_name = _extract_module_name(test_name)
 
-        with allure.step(f"Visual comparison: {name}"):
-            screenshot_bytes = _get_screenshot_bytes(screenshot)
-            _attach_current_screenshot(screenshot_bytes)
-
-            return _handle_snapshot_assertion(
-                assert_snapshot_func,
-                screenshot,
-                name,
-                threshold,
-                fail_fast,
-                mask_elements,
-                test_name,
-                module_name
+        def _assert_in_viewport(viewport=None):
+            # Build snapshot name with browser-viewport-title format
+            snapshot_name = _build_snapshot_name(name, viewport)
+
+            with allure.step(f"Visual comparison: {snapshot_name}"):
+                capture = _capture_snapshot(screenshot, mask_elements, full_page)
+                _unstabilize_after_capture(screenshot, request)
+                _attach_current_screenshot(capture.data)
+
+                return _handle_snapshot_assertion(
+                    assert_snapshot_func,
+                    capture,
+                    snapshot_name,
+                    threshold,
+                    fail_fast,
+                    test_name,
+                    module_name,
+                    request
+                )
+
+        viewports = _get_pixel_viewports()
+        if viewports and isinstance(screenshot, bytes):
+            # Captured bytes can't be retaken in another viewport
+            logging.warning(
+                f"PIXEL_VIEWPORTS: {test_name} passes screenshot bytes - comparing DEVICE viewport only, "
+                "pass the Page (full_page=True) to capture every viewport"
             )
 
+        elif viewports:
+            if supports_viewport_emulation(screenshot.page if isinstance(screenshot, Locator) else screenshot):
+                return _assert_in_viewports(screenshot, viewports, _assert_in_viewport, request)
+
+            logging.warning("PIXEL_VIEWPORTS needs Chromium - comparing DEVICE viewport only")
+
+        return _assert_in_viewport()
+
     return _assert_with_allure
 
 
@@ -189,7 +529,7 @@ def assert_snapshot_with_threshold(assert_snapshot, request):
                 threshold=0.15  # 15% pixel difference allowed
             )
     """
-    def _assert(screenshot, name=None, threshold=0.1, fail_fast=False, mask_elements=None):
+    def _assert(screenshot, name=None, threshold=0.1, fail_fast=False, mask_elements=None, full_page=False):
         """
         Assert screenshot matches baseline snapshot with Allure attachments.
 
@@ -199,13 +539,15 @@ def assert_snapshot_with_threshold(assert_snapshot, request):
             threshold: Allowed pixel difference (0.0-1.0). Default 0.1 (10%)
             fail_fast: Fail immediately on first pixel difference
             mask_elements: List of CSS selectors to mask during screenshot
+            full_page: Capture whole scrollable Page instead of its viewport
 
         Returns:
             None if match, raises AssertionError if mismatch
         """
-        return _add_allure_support(assert_snapshot, request)(screenshot, name, threshold, fail_fast, mask_elements)
+        return _add_allure_support(assert_snapshot, request)(screenshot, name, threshold, fail_fast, mask_elements, full_page)
 
-    return _assert
+    yield _assert
+    _check_deferred_snapshots(request)
 
 
 @pytest.fixture
@@ -216,14 +558,17 @@ def assert_snapshot_strict(assert_snapshot, request):
 
     Snapshot naming format: {browser}-{viewport}-{title}.png
     """
-    def _assert(screenshot, name=None, threshold=None, fail_fast=False, mask_elements=None):
+    def _assert(screenshot, name=None, threshold=None, fail_fast=False, mask_elements=None, full_page=False):
         # Use strict threshold if not overridden
         if threshold is None:
             threshold = 0.05
 
-        return _add_allure_support(assert_snapshot, request, threshold_value=0.05)(screenshot, name, threshold, fail_fast, mask_elements)
+        return _add_allure_support(assert_snapshot, request, threshold_value=0.05)(
+            screenshot, name, threshold, fail_fast, mask_elements, full_page
+        )
 
-    return _assert
+    yield _assert
+    _check_deferred_snapshots(request)
 
 
 @pytest.fixture
@@ -234,11 +579,14 @@ def assert_snapshot_lenient(assert_snapshot, request):
 
     Snapshot naming format: {browser}-{viewport}-{title}.png
     """
-    def _assert(screenshot, name=None, threshold=None, fail_fast=False, mask_elements=None):
+    def _assert(screenshot, name=None, threshold=None, fail_fast=False, mask_elements=None, full_page=False):
         # Use lenient threshold if not overridden
         if threshold is None:
             threshold = 0.2
 
-        return _add_allure_support(assert_snapshot, request, threshold_value=0.2)(screenshot, name, threshold, fail_fast, mask_elements)
+        return _add_allure_support(assert_snapshot, request, threshold_value=0.2)(
+            screenshot, name, threshold, fail_fast, mask_elements, full_page
+        )
 
-    return _assert
+    yield _assert
+    _check_deferred_snapshots(request)
@@ -24,7 +24,7 @@ class AppPage(BasePage):
         app_url = f"{BASE_URL}/app"
         self.page.goto(app_url, wait_until="domcontentloaded")
         # Wait for network idle to ensure all resources (images, CSS) are loaded - critical for pixel tests
-        self.wait_for_network_idle()
+        self.wait_for_network_idle(step="navigate_to_app")
         attach_screenshot(self.page, "App page loaded")
 
     @allure.step("Check if header elements are visible and logo is clickable")
@@ -0,0 +1,255 @@
+import asyncio
+import logging
+import os
+from typing import Awaitable
+
+import allure
+from playwright.async_api import Page, expect
+
+from config.timeouts import Timeouts
+from pages.base_page import _ELEMENT_RECORD_JS
+from utils import har_cache
+from utils.page_activity import QUIESCENCE_SCRIPT, is_stability_wait_enabled, wait_for_app_idle_async
+
+
+async def _gather(checks: dict[str, Awaitable], concurrency: int | None) -> list:
+    semaphore = asyncio.Semaphore(concurrency or len(checks) or 1)
+
+    async def run_limited(check: Awaitable):
+        async with semaphore:
+            return await check
+
+    return await asyncio.gather(*(run_limited(check) for check in checks.values()), return_exceptions=True)
+
+
+def gather_checks(async_loop, checks: dict[str, Awaitable], concurrency: int | None = None) -> dict:
+    """
+    Run independent checks concurrently on the async loop thread and report them to Allure one by one.
+
+    Allure keeps one step stack per thread, so steps opened inside concurrent tasks would nest
+    into each other or get lost on the loop thread. Checks therefore don't open steps - each one
+    gets its own step here, on the test thread, after all of them finished. All failures are
+    collected and raised as one AssertionError.
+
+    Args:
+        async_loop: `async_loop` fixture the checks' pages belong to
+        checks: Check name -> coroutine. Coroutine may return (result, screenshot_bytes or None)
+        concurrency: Max checks running at the same time (all at once by default)
+
+    Returns:
+        Check name -> result for passed checks
+    """
+    results = async_loop.run(_gather(checks, concurrency))
+
+    passed = {}
+    failures = []
+    for name, result in zip(checks, results):
+        with allure.step(name):
+            if isinstance(result, BaseException):
+                failures.append(f"{name}: {result}")
+                continue
+
+            value, screenshot = result if isinstance(result, tuple) else (result, None)
+            if screenshot:
+                allure.attach(screenshot, name=name, attachment_type=allure.attachment_type.PNG)
+            passed[name] = value
+
+    if failures:
+        raise AssertionError(f"{len(failures)} of {len(checks)} checks failed:\n" + "\n".join(failures))
+
+    return passed
+
+
+class AsyncBasePage:
+    """
+    Async counterpart of BasePage for concurrent read-only checks.
+
+    Methods mirror BasePage, but don't open Allure steps or attach screenshots
+    (see gather_checks) - use screenshot() and return the bytes instead.
+    """
+
+    def __init__(self, page: Page, locators=None):
+
+        self.page = page
+        self.locators = locators
+
+    async def wait_for_page_load(self, state: str = "domcontentloaded", timeout: int = None):
+        timeout = timeout or Timeouts.BASE_PAGE_LOAD
+        try:
+            await self.page.wait_for_load_state(state, timeout=timeout)
+
+        except Exception as e:
+            if state == "networkidle":
+
+                try:
+                    logging.warning(f"Failed to wait for load state '{state}', falling back to 'load': {e}")
+                    await self.page.wait_for_load_state("load", timeout=timeout // 2)
+
+                except Exception as e2:
+                    logging.warning(f"Failed to wait for load state 'load' as fallback: {e2}")
+
+    async def use_har(self, key: str) -> None:
+        """Same as BasePage.use_har - keys are shared, so sync and async pages replay the same HAR"""
+        await har_cache.use_har_async(self.page, key)
+
+    async def close(self) -> None:
+        """Save HAR recorded by the page and close it"""
+        await har_cache.stop_har_async(self.page)
+        await self.page.close()
+
+    async def navigate_to(self, url: str, step: str = "navigate_to"):
+        await self.page.goto(url, wait_until="domcontentloaded")
+        await self.wait_for_network_idle(step=step)
+
+    async def check_page_elements(self, selectors: list):
+        for selector in selectors:
+            await expect(self.page.locator(selector)).to_be_visible()
+
+    async def screenshot(self, full_page: bool = True) -> bytes | None:
+        try:
+            return await self.page.screenshot(full_page=full_page)
+
+        except Exception as e:
+            logging.warning(f"Failed to capture screenshot: {e}")
+            return None
+
+    async def extract(self, selector_spec: str | dict[str, str]) -> list[dict] | dict[str, list[dict]]:
+        """Same as BasePage.extract - all matched elements in one round trip"""
+        if isinstance(selector_spec, str):
+            return await self.page.locator(selector_spec).evaluate_all(
+                f"elements => elements.map({_ELEMENT_RECORD_JS})"
+            )
+
+        return await self.page.evaluate(f"""
+            (spec) => {{
+                const toRecord = {_ELEMENT_RECORD_JS};
+                return Object.fromEntries(Object.entries(spec).map(
+                    ([name, selector]) => [name, Array.from(document.querySelectorAll(selector), toRecord)]
+                ));
+            }}
+        """, selector_spec)
+
+    async def get_element_color(self, selector: str) -> str:
+        return await self.page.evaluate("""
+            (selector) => {
+                const element = document.querySelector(selector);
+                if (!element) return null;
+                return window.getComputedStyle(element).color;
+            }
+        """, selector)
+
+    async def get_element_background_color(self, selector: str) -> str:
+        return await self.page.evaluate("""
+            (selector) => {
+                const element = document.querySelector(selector);
+                if (!element) return null;
+                return window.getComputedStyle(element).backgroundColor;
+            }
+        """, selector)
+
+    async def get_element_position(self, selector: str) -> dict:
+        return await self.page.evaluate("""
+            (selector) => {
+                const element = document.querySelector(selector);
+                if (!element) return null;
+                const rect = element.getBoundingClientRect();
+                return {x: rect.x, y: rect.y, width: rect.width, height: rect.height,
+                        top: rect.top, left: rect.left, bottom: rect.bottom, right: rect.right};
+            }
+        """, selector)
+
+    async def is_element_visible(self, selector: str) -> bool:
+        return await self.page.locator(selector).is_visible()
+
+    async def is_element_in_viewport(self, selector: str) -> bool:
+        return await self.page.evaluate("""
+            (selector) => {
+                const element = document.querySelector(selector);
+                if (!element) return false;
+                const rect = element.getBoundingClientRect();
+                return rect.top >= 0 && rect.left >= 0 &&
+                       rect.bottom <= (window.innerHeight || document.documentElement.clientHeight) &&
+                       rect.right <= (window.innerWidth || document.documentElement.clientWidth);
+            }
+        """, selector)
+
+    def _is_mobile_device(self) -> bool:
+        """Same rules as BasePage._is_mobile_device (viewport_size is sync in async API too)"""
+        viewport = self.page.viewport_size
+
+        if viewport and viewport["width"] <= 1024:
+            return True
+
+        device = os.getenv("DEVICE", "desktop").lower()
+        return device in ["mobile", "tablet", "ipad"]
+
+    async def assert_visible_or_exists_on_mobile(self, locator, message: str = "Element should be visible"):
+        if self._is_mobile_device():
+            assert await locator.count() > 0, message
+
+        else:
+            await expect(locator.first).to_be_visible(timeout=Timeouts.BASE_ELEMENT_VISIBLE)
+
+    async def wait_for_stable(self, selector: str | None = None, timeout: int = None) -> bool:
+        """Same as BasePage.wait_for_stable"""
+        timeout = timeout or Timeouts.Animation.STANDARD
+
+        if not is_stability_wait_enabled():
+            await self.page.wait_for_timeout(timeout)
+            return True
+
+        try:
+            result = await self.page.evaluate(
+                QUIESCENCE_SCRIPT,
+                {"selector": selector, "quietMs": Timeouts.Animation.QUIET_WINDOW, "timeoutMs": timeout}
+            )
+            return result["settled"]
+
+        except Exception as e:
+            logging.debug(f"DOM quiescence wait interrupted (waiting for domcontentloaded): {e}")
+            await self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+            return False
+
+    async def wait_short(self, selector: str | None = None):
+        await self.wait_for_stable(selector, Timeouts.Animation.SHORT)
+
+    async def wait_medium(self, selector: str | None = None):
+        await self.wait_for_stable(selector, Timeouts.Animation.MEDIUM)
+
+    async def wait_standard(self, selector: str | None = None):
+        await self.wait_for_stable(selector, Timeouts.Animation.STANDARD)
+
+    async def wait_long(self, selector: str | None = None):
+        await self.wait_for_stable(selector, Timeouts.Animation.LONG)
+
+    async def wait_for_network_idle(self, timeout: int = None, step: str = None):
+        """
+        Same as BasePage.wait_for_network_idle: load state, then in-flight app requests drained,
+        idle latency recorded per step. Pages without activity tracker use Playwright networkidle.
+        """
+        timeout = timeout or Timeouts.BASE_NETWORK_IDLE
+        step = step or f"{type(self).__name__}.wait_for_network_idle"
+
+        try:
+            await self.page.wait_for_load_state("load", timeout=Timeouts.BASE_PAGE_LOAD)
+
+        except Exception as e:
+            logging.warning(f"Failed to wait for load state before app idle wait: {e}")
+
+        result = await wait_for_app_idle_async(self.page, timeout, step)
+        if result["tracked"]:
+            if not result["idle"]:
+                logging.warning(f"App requests still in flight after {timeout}ms ({step}): {result.get('pending')}")
+            return
+
+        try:
+            await self.page.wait_for_load_state("networkidle", timeout=timeout)
+
+        except Exception as e:
+            logging.warning(f"Failed to wait for networkidle, falling back to load state: {e}")
+            await self.page.wait_for_load_state("load", timeout=Timeouts.BASE_PAGE_LOAD)
+
+    async def reload_page(self, wait_until: str = "domcontentloaded", timeout: int = None) -> None:
+        timeout = timeout or Timeouts.BASE_PAGE_LOAD
+        await self.page.reload(wait_until=wait_until, timeout=timeout)
+        await self.wait_for_page_load()
@@ -0,0 +1,116 @@
+from playwright.async_api import Page, expect
+
+from config.auth_config import BASE_URL
+from config.timeouts import Timeouts
+from locators.catalog_locators import CatalogLocators
+from pages.async_base_page import AsyncBasePage
+
+# Child catalog paths, stock item targets and page state of a catalog level in one evaluation.
+# Stock items are clickable li elements - their target is null unless they contain a link.
+_CATALOG_LEVEL_JS = """
+({linkSelector, stockSelector, productCardSelector}) => {
+    const toPath = value => new URL(value, location.href).pathname.replace(/\\/$/, "");
+    const currentPath = toPath(location.href);
+
+    const children = new Set();
+    for (const link of document.querySelectorAll(linkSelector)) {
+        const href = link.getAttribute("href");
+        if (!href) continue;
+        const path = toPath(href);
+        if (path.startsWith(currentPath + "/")) children.add(path);
+    }
+
+    const stocks = Array.from(document.querySelectorAll(stockSelector)).map(item => {
+        const target = item.matches("a[href]") ? item : item.querySelector("a[href], [itemprop='url'][content]");
+        return target ? toPath(target.getAttribute("href") || target.getAttribute("content")) : null;
+    });
+
+    return {
+        path: currentPath,
+        title: document.title,
+        children: Array.from(children),
+        stocks,
+        hasProductCard: !!document.querySelector(productCardSelector),
+    };
+}
+"""
+
+
+class AsyncCatalogPage(AsyncBasePage):
+    """Async catalog page for checking several catalog pages concurrently"""
+
+    def __init__(self, page: Page):
+        super().__init__(page, CatalogLocators())
+        self.page = page
+
+    async def navigate_to_catalog_path(self, path: str):
+        if not BASE_URL:
+            raise ValueError("BASE_URL is not set. Please configure BASE_URL in environment variables.")
+
+        await self.use_har(f"catalog/{path}")
+        await self.navigate_to(f"{BASE_URL}/catalog/{path}", step="navigate_to_catalog_path")
+
+    @staticmethod
+    def is_error_title(title: str) -> bool:
+        return "error" in title.lower() or "404" in title
+
+    async def _read_current_level(self) -> dict:
+        return await self.page.evaluate(_CATALOG_LEVEL_JS, {
+            "linkSelector": ", ".join([self.locators.brand_links, self.locators.engine_links, self.locators.ecu_links]),
+            "stockSelector": self.locators.stock_link,
+            "productCardSelector": self.locators.product_card,
+        })
+
+    async def read_level(self, path: str) -> dict:
+        """
+        Open catalog path and read it in one evaluation.
+
+        Returns {"path", "title", "children": [child catalog paths], "stocks": [stock target path or None],
+        "hasProductCard": bool}
+        """
+        await self.use_har(path.strip("/"))
+        await self.navigate_to(f"{BASE_URL}{path}", step="read_catalog_level")
+        return await self._read_current_level()
+
+    async def open_stock_card(self, list_path: str, index: int) -> dict:
+        """Click stock item without link on stock list page, returns stock card read like read_level"""
+        await self.use_har(list_path.strip("/"))
+        await self.navigate_to(f"{BASE_URL}{list_path}", step="open_stock_list")
+        list_url = self.page.url
+
+        await self.page.locator(self.locators.stock_link).nth(index).click(timeout=Timeouts.BASE_ELEMENT_VISIBLE)
+        await self.page.wait_for_url(lambda url: url != list_url, timeout=Timeouts.BASE_PAGE_LOAD)
+        await self.wait_for_network_idle(step="open_stock_card")
+
+        return await self._read_current_level()
+
+    async def check_ecu_page(self, path: str) -> tuple[int, bytes | None]:
+        """Same checks as test_ecu_page_complete. Returns ECU links count and page screenshot"""
+        await self.navigate_to_catalog_path(path)
+
+        ecu_links = self.page.locator(self.locators.ecu_links)
+        await expect(ecu_links.first).to_be_visible(timeout=Timeouts.ShortWaits.SHORT_PAUSE)
+
+        # Links and names are read in one evaluation instead of per-link round trips
+        records = await self.extract({"links": self.locators.ecu_links, "names": self.locators.ecu_names})
+        assert len(records["links"]) > 0, f"ECU page {path} should have links"
+
+        for i, link in enumerate(records["links"]):
+            assert link["visible"], f"ECU link {i} on {path} should be visible"
+
+            href = link["attributes"].get("href")
+            class_attr = link["attributes"].get("class", "")
+
+            if href:
+                assert href.startswith("/catalog/"), f"ECU link {i} on {path} should start with /catalog/"
+            else:
+                assert "cursor-pointer" in class_attr or "catalog-link" in class_attr, \
+                    f"ECU link {i} on {path} should be clickable"
+
+        assert len(records["names"]) > 0, f"ECU page {path} should have names"
+
+        for i, name in enumerate(records["names"][:3]):
+            text = name["text"]
+            assert (text is not None and len(text.strip()) > 0), f"ECU {i} on {path} should have text"
+
+        return len(records["links"]), await self.screenshot()
@@ -6,12 +6,36 @@ import os
 
 from config.auth_config import BASE_URL
 from config.timeouts import Timeouts
+from utils import har_cache
 from utils.allure_helpers import attach_element_screenshot, attach_screenshot
+from utils.page_activity import (
+    is_stability_wait_enabled,
+    wait_for_app_idle,
+    wait_for_dom_quiescence,
+)
 from utils.playwright_helpers import scroll_to_make_visible
 
 LOGOUT_BUTTON_TEXT = "Выйти"
 
 
+# Converts element into record for BasePage.extract (visibility follows Playwright rules:
+# non-empty bounding box and not visibility:hidden)
+_ELEMENT_RECORD_JS = """
+(element, index) => {
+    const rect = element.getBoundingClientRect();
+    const style = window.getComputedStyle(element);
+    return {
+        index,
+        text: element.textContent,
+        attributes: Object.fromEntries(Array.from(element.attributes, attr => [attr.name, attr.value])),
+        box: {x: rect.x, y: rect.y, width: rect.width, height: rect.height},
+        visible: rect.width > 0 && rect.height > 0 && style.visibility !== "hidden",
+        disabled: element.disabled === true || element.getAttribute("aria-disabled") === "true",
+    };
+}
+"""
+
+
 class BasePage:
 
     def __init__(self, page: Page, locators=None):
@@ -52,11 +76,15 @@ class BasePage:
             response = self.page.wait_for_event('response', predicate=url_pattern, timeout=timeout)
             return response
 
+    def use_har(self, key: str) -> None:
+        """Record or replay HAR for the next navigation of a read-only page (HAR_MODE=record/replay)"""
+        har_cache.use_har(self.page, key)
+
     @allure.step("Navigate to URL: {url} | auth={auth}")
-    def navigate_to(self, url: str, auth: bool = True):
+    def navigate_to(self, url: str, auth: bool = True, step: str = "navigate_to"):
         self.page.goto(url, wait_until="domcontentloaded")
         # Wait for network idle to ensure all resources (images, CSS) are loaded - critical for pixel tests
-        self.wait_for_network_idle()
+        self.wait_for_network_idle(step=step)
 
     @allure.step("Check visibility of elements: {selectors}")
     def check_page_elements(self, selectors: list):
@@ -69,6 +97,30 @@ class BasePage:
     def take_screenshot(self, name: str = "screenshot"):
         self.page.screenshot(path=f"screenshots/{name}.png")
 
+    def extract(self, selector_spec: str | dict[str, str]) -> list[dict] | dict[str, list[dict]]:
+        """
+        Read all matched elements in one round trip.
+
+        Each record has index, text (textContent), attributes, box, visible and disabled.
+
+        Args:
+            selector_spec: Playwright selector - returns list of records (locator.evaluate_all),
+                or dict name -> CSS selector - returns dict name -> records from a single evaluation
+        """
+        if isinstance(selector_spec, str):
+            return self.page.locator(selector_spec).evaluate_all(
+                f"elements => elements.map({_ELEMENT_RECORD_JS})"
+            )
+
+        return self.page.evaluate(f"""
+            (spec) => {{
+                const toRecord = {_ELEMENT_RECORD_JS};
+                return Object.fromEntries(Object.entries(spec).map(
+                    ([name, selector]) => [name, Array.from(document.querySelectorAll(selector), toRecord)]
+                ));
+            }}
+        """, selector_spec)
+
     @allure.step("Get element color for selector: {selector}")
     def get_element_color(self, selector: str) -> str:
         return self.page.evaluate("""
@@ -356,13 +408,13 @@ class BasePage:
 
     @allure.step("Check and logout if logged in")
     def check_and_logout(self, logout_button_text: str = LOGOUT_BUTTON_TEXT) -> None:
-        self.wait_for_network_idle()
+        self.wait_for_network_idle(step="check_and_logout_before_click")
 
         logout_btn = self.page.get_by_text(logout_button_text)
 
         if logout_btn.count() > 0:
             logout_btn.first.click(force=True)
-            self.wait_for_network_idle()
+            self.wait_for_network_idle(step="check_and_logout_after_click")
 
     @allure.step("Navigate to /app page and verify user is logged in")
     def navigate_to_app_and_verify(self, base_url: str, logout_button_text: str = LOGOUT_BUTTON_TEXT, timeout: int = None) -> None:
@@ -380,21 +432,57 @@ class BasePage:
         logout_btn = self.page.get_by_text(logout_button_text)
         expect(logout_btn).to_be_visible(timeout=timeout)
 
-    def wait_short(self):
-        self.page.wait_for_timeout(Timeouts.Animation.SHORT)
+    def wait_for_stable(self, selector: str | None = None, timeout: int = None) -> bool:
+        """
+        Wait until region stops changing: no DOM mutations, running CSS animations/transitions
+        or pending fetch/XHR for Timeouts.Animation.QUIET_WINDOW. Timeout is the upper bound.
+        Returns False if region didn't settle in time.
+        """
+        timeout = timeout or Timeouts.Animation.STANDARD
+
+        if not is_stability_wait_enabled():
+            self.page.wait_for_timeout(timeout)
+            return True
+
+        result = wait_for_dom_quiescence(self.page, selector, Timeouts.Animation.QUIET_WINDOW, timeout)
+        if not result["settled"]:
+            logging.debug(f"Region '{selector or 'document'}' did not settle within {timeout}ms")
+
+        return result["settled"]
+
+    def wait_short(self, selector: str | None = None):
+        self.wait_for_stable(selector, Timeouts.Animation.SHORT)
 
-    def wait_medium(self):
-        self.page.wait_for_timeout(Timeouts.Animation.MEDIUM)
+    def wait_medium(self, selector: str | None = None):
+        self.wait_for_stable(selector, Timeouts.Animation.MEDIUM)
 
-    def wait_standard(self):
-        self.page.wait_for_timeout(Timeouts.Animation.STANDARD)
+    def wait_standard(self, selector: str | None = None):
+        self.wait_for_stable(selector, Timeouts.Animation.STANDARD)
 
-    def wait_long(self):
-        self.page.wait_for_timeout(Timeouts.Animation.LONG)
+    def wait_long(self, selector: str | None = None):
+        self.wait_for_stable(selector, Timeouts.Animation.LONG)
 
-    def wait_for_network_idle(self, timeout: int = None):
-        """Wait for network idle state, fallback to load state if networkidle times out"""
+    def wait_for_network_idle(self, timeout: int = None, step: str = None):
+        """
+        Wait for load state and for in-flight app requests (APP_REQUEST_PATTERNS, /api-v1/ by default)
+        to drain. Long-polling and third-party traffic is ignored, idle latency is recorded per step.
+
+        Pages without activity tracker use Playwright networkidle with fallback to load state.
+        """
         timeout = timeout or Timeouts.BASE_NETWORK_IDLE
+        step = step or f"{type(self).__name__}.wait_for_network_idle"
+
+        try:
+            self.page.wait_for_load_state("load", timeout=Timeouts.BASE_PAGE_LOAD)
+
+        except Exception as e:
+            logging.warning(f"Failed to wait for load state before app idle wait: {e}")
+
+        result = wait_for_app_idle(self.page, timeout, step)
+        if result["tracked"]:
+            if not result["idle"]:
+                logging.warning(f"App requests still in flight after {timeout}ms ({step}): {result.get('pending')}")
+            return
 
         try:
             self.page.wait_for_load_state("networkidle", timeout=timeout)
@@ -26,14 +26,7 @@ class BaseUploadPage(BasePage):
         expect(file_input).to_be_attached(timeout=Timeouts.Upload.FILE_INPUT_ATTACHED)
 
         file_input.set_input_files(str(file_path))
-        self.page.wait_for_timeout(500)
-
-        try:
-            self.page.wait_for_load_state("networkidle", timeout=Timeouts.BASE_NETWORK_IDLE)
-
-        except Exception as e:
-            logging.warning(f"Failed to wait for networkidle after file upload, falling back to load state: {e}")
-            self.page.wait_for_load_state("load", timeout=Timeouts.BASE_PAGE_LOAD)
+        self.wait_for_network_idle(step="upload_file")
 
         try:
             uploaded_file_name = self.page.locator(self.locators.uploaded_file_name)
@@ -111,13 +104,7 @@ class BaseUploadPage(BasePage):
         if wait_time > 0:
             self.page.wait_for_timeout(wait_time * 1000)
 
-        try:
-            self.page.wait_for_load_state("networkidle", timeout=Timeouts.BASE_NETWORK_IDLE)
-
-        except Exception as e:
-
-            logging.warning(f"Failed to wait for networkidle after search, falling back to load state: {e}")
-            self.page.wait_for_load_state("load", timeout=Timeouts.BASE_PAGE_LOAD)
+        self.wait_for_network_idle(step="search_solutions")
 
         solutions_text = self.page.get_by_text("Найденные решения Если нужного вам решения не нашлось, напишите нам в чат или на")
 
@@ -142,13 +129,11 @@ class BaseUploadPage(BasePage):
 
     @allure.step("Get available solutions list")
     def get_available_solutions(self) -> list[str]:
-        solutions_found = self.page.locator(self.locators.order_table_row)
-        solutions_list = []
-
-        for i in range(solutions_found.count()):
-            solution_text = solutions_found.nth(i).text_content()
-            if solution_text:
-                solutions_list.append(solution_text.strip())
+        solutions_list = [
+            row["text"].strip()
+            for row in self.extract(self.locators.order_table_row)
+            if row["text"]
+        ]
 
         attach_screenshot(self.page, "Solutions list retrieved")
         return solutions_list
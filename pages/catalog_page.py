@@ -19,7 +19,8 @@ class CatalogPage(BasePage):
         if not BASE_URL:
             raise ValueError("BASE_URL is not set. Please configure BASE_URL in environment variables.")
 
-        self.navigate_to(f"{BASE_URL}/catalog")
+        self.use_har("catalog")
+        self.navigate_to(f"{BASE_URL}/catalog", step="navigate_to_catalog")
         attach_screenshot(self.page, "Catalog page loaded")
 
     @allure.step("Check if catalog page elements are visible")
@@ -48,7 +49,8 @@ class CatalogPage(BasePage):
     def navigate_to_brand_page(self, brand_path: str = "car/bmw-mini"):
         if not BASE_URL:
             raise ValueError("BASE_URL is not set. Please configure BASE_URL in environment variables.")
-        self.navigate_to(f"{BASE_URL}/catalog/{brand_path}")
+        self.use_har(f"catalog/{brand_path}")
+        self.navigate_to(f"{BASE_URL}/catalog/{brand_path}", step="navigate_to_brand_page")
         attach_screenshot(self.page, "Brand page loaded")
 
     @allure.step("Navigate to engine page for brand path: {brand_path} in catalog")
@@ -56,7 +58,8 @@ class CatalogPage(BasePage):
         if not BASE_URL:
             raise ValueError("BASE_URL is not set. Please configure BASE_URL in environment variables.")
 
-        self.navigate_to(f"{BASE_URL}/catalog/{brand_path}")
+        self.use_har(f"catalog/{brand_path}")
+        self.navigate_to(f"{BASE_URL}/catalog/{brand_path}", step="navigate_to_engine_page")
         attach_screenshot(self.page, "Engine page loaded")
 
     @allure.step("Navigate to ECU page: {path}")
@@ -65,7 +68,8 @@ class CatalogPage(BasePage):
         if not BASE_URL:
             raise ValueError("BASE_URL is not set. Please configure BASE_URL in environment variables.")
 
-        self.navigate_to(f"{BASE_URL}/catalog/{path}")
+        self.use_har(f"catalog/{path}")
+        self.navigate_to(f"{BASE_URL}/catalog/{path}", step="navigate_to_ecu_page")
         attach_screenshot(self.page, "ECU page loaded")
 
     @allure.step("Navigate to stock page: {path}")
@@ -74,7 +78,8 @@ class CatalogPage(BasePage):
         if not BASE_URL:
             raise ValueError("BASE_URL is not set. Please configure BASE_URL in environment variables.")
 
-        self.navigate_to(f"{BASE_URL}/catalog/{path}")
+        self.use_har(f"catalog/{path}")
+        self.navigate_to(f"{BASE_URL}/catalog/{path}", step="navigate_to_stock_page")
         attach_screenshot(self.page, "Stock page loaded")
 
     @allure.step("Get stock items count on stock list page")
@@ -20,9 +20,10 @@ class ContactsPage(BasePage):
         if not BASE_URL:
             raise ValueError("BASE_URL is not set. Please configure BASE_URL in environment variables.")
 
+        self.use_har("contacts")
         self.page.goto(f"{BASE_URL}/contacts", wait_until="domcontentloaded")
         # Wait for network idle to ensure all resources (images, CSS) are loaded - critical for pixel tests
-        self.wait_for_network_idle()
+        self.wait_for_network_idle(step="navigate_to_contacts")
 
         attach_screenshot(self.page, "Contacts page loaded")
 
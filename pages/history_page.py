@@ -10,6 +10,41 @@ from locators.history_locators import HistoryLocators
 from pages.base_page import BasePage
 from utils.allure_helpers import attach_screenshot
 
+# Row record: visible, cells (td texts) and first time/price/task element text (None if absent)
+_HISTORY_ROWS_JS = """
+(rows, selectors) => {
+    const isVisible = element => {
+        const rect = element.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && window.getComputedStyle(element).visibility !== "hidden";
+    };
+    const firstText = (row, selector) => {
+        const element = row.querySelector(selector);
+        return element ? element.textContent : null;
+    };
+    return rows.map(row => ({
+        visible: isVisible(row),
+        cells: Array.from(row.querySelectorAll("td"), cell => cell.textContent),
+        time: firstText(row, selectors.time),
+        price: firstText(row, selectors.price),
+        task: firstText(row, selectors.task),
+    }));
+}
+"""
+
+# Button record: index of the row containing the button and its visibility
+_ROW_BUTTONS_JS = """
+(buttons, rowSelector) => {
+    const rows = Array.from(document.querySelectorAll(rowSelector));
+    return buttons.map(button => {
+        const rect = button.getBoundingClientRect();
+        return {
+            row: rows.findIndex(row => row.contains(button)),
+            visible: rect.width > 0 && rect.height > 0 && window.getComputedStyle(button).visibility !== "hidden",
+        };
+    });
+}
+"""
+
 
 class HistoryPage(BasePage):
     """History page of TunService website"""
@@ -185,14 +220,9 @@ class HistoryPage(BasePage):
             if aria_label and aria_label.startswith("Page "):
                 return self._parse_page_number(aria_label.replace("Page ", ""))
 
-        page_numbers = self.page.locator(self.locators.pagination_page_number)
-        count = page_numbers.count()
-        for i in range(count):
-            page_btn = page_numbers.nth(i)
-
-            if page_btn.get_attribute("aria-current") == "page":
-                page_text = page_btn.text_content()
-                return self._parse_page_number(page_text)
+        for page_btn in self.extract(self.locators.pagination_page_number):
+            if page_btn["attributes"].get("aria-current") == "page":
+                return self._parse_page_number(page_btn["text"])
 
         return None
 
@@ -217,14 +247,10 @@ class HistoryPage(BasePage):
 
     def _get_max_page_from_buttons(self) -> int:
         """Get maximum page number from pagination buttons"""
-        page_numbers = self.page.locator(self.locators.pagination_page_number)
         max_page = 1
 
-        count = page_numbers.count()
-        for i in range(count):
-            page_btn = page_numbers.nth(i)
-            page_text = page_btn.text_content()
-            page_num = self._parse_page_number(page_text)
+        for page_btn in self.extract(self.locators.pagination_page_number):
+            page_num = self._parse_page_number(page_btn["text"])
 
             if page_num is not None:
                 max_page = max(max_page, page_num)
@@ -341,91 +367,106 @@ class HistoryPage(BasePage):
 
         attach_screenshot(self.page, "Pagination navigation verified")
 
-    def _check_row_buttons(self, row):
-        """Check buttons in history row"""
-        download_link = row.locator(self.locators.history_download_link)
+    def _get_rows_data(self) -> list[dict]:
+        """Read every history row (cells, time, price, task, button visibility) in a constant number of evaluations"""
+        history_rows = self.page.locator(self.locators.history_table_row)
+        rows = history_rows.evaluate_all(_HISTORY_ROWS_JS, {
+            "time": self.locators.history_item_time,
+            "price": self.locators.history_item_price,
+            "task": self.locators.history_item_task,
+        })
 
-        if download_link.count() > 0:
-            expect(download_link.first).to_be_visible(timeout=Timeouts.History.DOWNLOAD_LINK_VISIBLE)
+        # Button locators use Playwright text selectors - read them per button type, mapped back to rows
+        buttons = {
+            "Download link": self.locators.history_download_link,
+            "Info button": self.locators.history_item_info_button,
+            "Disable button": self.locators.history_item_disable_button,
+        }
 
-        info_button = row.locator(self.locators.history_item_info_button)
+        for row in rows:
+            row["buttons"] = {}
 
-        if info_button.count() > 0:
-            expect(info_button.first).to_be_visible(timeout=Timeouts.History.DOWNLOAD_LINK_VISIBLE)
+        for button_name, locator in buttons.items():
+            for button in history_rows.locator(locator).evaluate_all(_ROW_BUTTONS_JS, self.locators.history_table_row):
+                if 0 <= button["row"] < len(rows):
+                    # Like row.locator(...).first - only the first match in a row is checked
+                    rows[button["row"]]["buttons"].setdefault(button_name, button["visible"])
 
-        disable_button = row.locator(self.locators.history_item_disable_button)
+        return rows
 
-        if disable_button.count() > 0:
-            expect(disable_button.first).to_be_visible(timeout=Timeouts.History.DTC_BUTTON_VISIBLE)
+    @staticmethod
+    def _validate_row(row: dict, row_index: int) -> list[str]:
+        """Errors found in one history row record"""
+        errors = []
 
-    def _check_row_time(self, row, row_index: int):
-        """Check time in history row"""
-        time_element = row.locator(self.locators.history_item_time)
+        if not row["visible"]:
+            errors.append(f"Row {row_index} should be visible")
 
-        if time_element.count() > 0:
-            time_text = time_element.first.text_content()
+        for button_name, visible in row["buttons"].items():
+            if not visible:
+                errors.append(f"{button_name} should be visible in row {row_index}")
 
-            if time_text and time_text.strip() != "":
-                return
+        has_time = (row["time"] or "").strip() or any(re.search(r'\d{2}:\d{2}', cell or "") for cell in row["cells"])
+        if not has_time:
+            errors.append(f"Time should not be empty in row {row_index}")
 
-        time_cells = row.locator("td")
-        if time_cells.count() > 0:
+        for field_name in ("price", "task"):
+            text = row[field_name]
 
-            for i in range(time_cells.count()):
-                cell_text = time_cells.nth(i).text_content()
+            if text is not None and text.strip() == "":
+                errors.append(f"{field_name.capitalize()} should not be empty in row {row_index}")
 
-                if cell_text and re.search(r'\d{2}:\d{2}', cell_text):
-                    return
+        if row["cells"] and not (row["cells"][0] or "").strip():
+            errors.append(f"Task name should not be empty in row {row_index}")
 
-        assert False, f"Time should not be empty in row {row_index}"
+        return errors
 
-    def _check_row_text_content(self, row, locator, field_name: str, row_index: int):
-        """Check text content in history row element"""
-        element = row.locator(locator)
-
-        if element.count() > 0:
-            text = element.first.text_content()
-            assert text and text.strip() != "", f"{field_name} should not be empty in row {row_index}"
+    @allure.step("Validate history rows on current page")
+    def validate_history_rows(self) -> dict[int, list[str]]:
+        """
+        Check all rows of the current page from one table read.
 
-    @allure.step("Check if history row contains required elements")
-    def check_history_row_elements(self, row_index: int = 0):
+        Returns:
+            Row index -> errors, only rows with errors are included
+        """
         history_rows = self.page.locator(self.locators.history_table_row)
-        count = history_rows.count()
 
-        if count == 0 or row_index >= count:
-            return
+        if history_rows.count() == 0:
+            return {}
+
+        expect(history_rows.first).to_be_visible(timeout=Timeouts.History.FILE_ROW_VISIBLE)
+        # Rows and their buttons render after the first row - read the table once it has settled
+        self.wait_for_stable(self.locators.history_table)
 
-        row = history_rows.nth(row_index)
-        expect(row).to_be_visible(timeout=Timeouts.History.FILE_ROW_VISIBLE)
+        report = {}
+        for row_index, row in enumerate(self._get_rows_data()):
+            errors = self._validate_row(row, row_index)
 
-        self._check_row_buttons(row)
-        self._check_row_time(row, row_index)
-        self._check_row_text_content(row, self.locators.history_item_price, "Price", row_index)
-        self._check_row_text_content(row, self.locators.history_item_task, "Task", row_index)
+            if errors:
+                report[row_index] = errors
 
-        task_name = row.locator("td").first
+        return report
 
-        if task_name.count() > 0:
-            task_name_text = task_name.text_content()
-            assert task_name_text and task_name_text.strip() != "", f"Task name should not be empty in row {row_index}"
+    @staticmethod
+    def _format_rows_report(report: dict[int, list[str]]) -> str:
+        return "\n".join(f"Row {row_index}: {'; '.join(errors)}" for row_index, errors in report.items())
+
+    @allure.step("Check if history row contains required elements")
+    def check_history_row_elements(self, row_index: int = 0):
+        errors = self.validate_history_rows().get(row_index, [])
 
         attach_screenshot(self.page, f"History row {row_index} verified")
+        assert not errors, "; ".join(errors)
 
     @allure.step("Check all history rows on current page")
     def check_all_history_rows_on_page(self):
+        report = self.validate_history_rows()
 
-        with allure.step("Get history rows count"):
-            history_rows = self.page.locator(self.locators.history_table_row)
-            rows_count = history_rows.count()
-
-        if rows_count == 0:
-            return
-
-        for i in range(rows_count):
-            with allure.step(f"Check history row {i + 1}"):
-                self.check_history_row_elements(row_index=i)
+        if report:
+            allure.attach(self._format_rows_report(report), name="History rows errors", attachment_type=allure.attachment_type.TEXT)
 
         attach_screenshot(self.page, "All history rows verified")
+        assert not report, f"History rows have errors:\n{self._format_rows_report(report)}"
 
     @allure.step("Check pagination exists and get total pages count")
     def _check_pagination_and_get_total(self) -> int | None:
@@ -498,14 +539,14 @@ class HistoryPage(BasePage):
 
         with allure.step("Step 1: Click Page 1"):
             self.page.get_by_role("button", name="Page 1").first.click()
-            self.wait_medium()
+            self.wait_medium(self.locators.history_table)
             self.check_all_history_rows_on_page()
 
         if total_pages >= 2:
             with allure.step("Step 2: Click Page 2"):
                 current_before = self.get_current_page_number()
                 self.page.get_by_role("button", name="Page 2").first.click()
-                self.wait_medium()
+                self.wait_medium(self.locators.history_table)
 
                 new_page = self.get_current_page_number()
                 assert new_page == 2, f"Should be on page 2 after clicking, got {new_page} (was on {current_before})"
@@ -514,13 +555,13 @@ class HistoryPage(BasePage):
 
         with allure.step("Step 3: Click Previous Page"):
             self.page.get_by_role("button", name="Previous Page").first.click()
-            self.wait_medium()
+            self.wait_medium(self.locators.history_table)
             self.check_all_history_rows_on_page()
 
         with allure.step("Step 4: Click Next Page"):
             current_before = self.get_current_page_number()
             self.page.get_by_role("button", name="Next Page").first.click()
-            self.wait_medium()
+            self.wait_medium(self.locators.history_table)
 
             new_page = self.get_current_page_number()
 
@@ -531,7 +572,7 @@ class HistoryPage(BasePage):
             with allure.step("Step 5: Click Page 2 again"):
                 current_before = self.get_current_page_number()
                 self.page.get_by_role("button", name="Page 2").first.click()
-                self.wait_medium()
+                self.wait_medium(self.locators.history_table)
 
                 new_page = self.get_current_page_number()
                 assert new_page == 2, f"Should be on page 2 after clicking, got {new_page} (was on {current_before})"
@@ -541,7 +582,7 @@ class HistoryPage(BasePage):
         with allure.step("Step 6: Click First Page"):
             current_before = self.get_current_page_number()
             self.page.get_by_role("button", name="First Page").first.click()
-            self.wait_medium()
+            self.wait_medium(self.locators.history_table)
 
             new_page = self.get_current_page_number()
             assert new_page == 1, f"Should be on page 1 after clicking first, got {new_page} (was on {current_before})"
@@ -551,7 +592,7 @@ class HistoryPage(BasePage):
         with allure.step("Step 7: Click Last Page"):
             current_before = self.get_current_page_number()
             self.page.get_by_role("button", name="Last Page").first.click()
-            self.wait_medium()
+            self.wait_medium(self.locators.history_table)
 
             new_page = self.get_current_page_number()
             assert new_page == total_pages, f"Should be on last page {total_pages} after clicking, got {new_page} (was on {current_before})"
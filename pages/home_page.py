@@ -24,11 +24,12 @@ class HomePage(BasePage):
 
     @allure.step("Navigate to main page")
     def navigate_to_main(self):
+        self.use_har("home")
         self.page.context.clear_cookies()
         self._set_language_cookie()
         self.page.goto(f"{BASE_URL}/", wait_until="domcontentloaded", timeout=Timeouts.BASE_PAGE_LOAD)
         # Wait for network idle to ensure all resources (images, CSS) are loaded - critical for pixel tests
-        self.wait_for_network_idle()
+        self.wait_for_network_idle(step="navigate_to_main")
 
     def _ensure_on_home(self):
         """If redirected to app, try to navigate back to public home page"""
@@ -269,24 +270,16 @@ class HomePage(BasePage):
 
     @allure.step("Get footer links count")
     def get_footer_links_count(self):
-        footer_map_links = self.page.locator(self.link_locators.footer_map).count()
-        footer_contacts_links = self.page.locator(self.link_locators.footer_contacts).count()
-        footer_catalog_links = self.page.locator(self.link_locators.footer_catalog).count()
-        footer_prices_links = self.page.locator(self.link_locators.footer_prices).count()
-        footer_email_links = self.page.locator(self.link_locators.footer_email).count()
-        footer_youtube_links = self.page.locator(self.link_locators.footer_youtube).count()
-        footer_vk_links = self.page.locator(self.link_locators.footer_vk).count()
-        footer_policy_links = self.page.locator(self.link_locators.footer_policy).count()
-        footer_agreement_links = self.page.locator(self.link_locators.footer_agreement).count()
-
-        return {
-            'map': footer_map_links,
-            'contacts': footer_contacts_links,
-            'catalog': footer_catalog_links,
-            'prices': footer_prices_links,
-            'email': footer_email_links,
-            'youtube': footer_youtube_links,
-            'vk': footer_vk_links,
-            'policy': footer_policy_links,
-            'agreement': footer_agreement_links
-        }
+        footer_links = self.extract({
+            'map': self.link_locators.footer_map,
+            'contacts': self.link_locators.footer_contacts,
+            'catalog': self.link_locators.footer_catalog,
+            'prices': self.link_locators.footer_prices,
+            'email': self.link_locators.footer_email,
+            'youtube': self.link_locators.footer_youtube,
+            'vk': self.link_locators.footer_vk,
+            'policy': self.link_locators.footer_policy,
+            'agreement': self.link_locators.footer_agreement
+        })
+
+        return {name: len(links) for name, links in footer_links.items()}
@@ -26,7 +26,7 @@ class LoginPage(BasePage):
     def navigate_to_login(self):
         self.page.goto(f"{BASE_URL}/app/login", wait_until="domcontentloaded")
         # Wait for network idle to ensure all resources (images, CSS) are loaded - critical for pixel tests
-        self.wait_for_network_idle()
+        self.wait_for_network_idle(step="navigate_to_login")
 
         attach_screenshot(self.page, "Login page loaded")
 
@@ -19,7 +19,8 @@ class PricingPage(BasePage):
         if not BASE_URL:
             raise ValueError("BASE_URL is not set. Please configure BASE_URL in environment variables.")
 
-        self.navigate_to(f"{BASE_URL}/price")
+        self.use_har("pricing")
+        self.navigate_to(f"{BASE_URL}/price", step="navigate_to_pricing")
         attach_screenshot(self.page, "Pricing page loaded")
 
     @allure.step("Check that pricing page elements are visible")
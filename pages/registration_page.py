@@ -24,7 +24,7 @@ class RegistrationPage(BasePage):
             raise ValueError("BASE_URL is not set. Please configure BASE_URL in environment variables.")
         self.page.goto(f"{BASE_URL}/app/register", wait_until="domcontentloaded")
         # Wait for network idle to ensure all resources (images, CSS) are loaded - critical for pixel tests
-        self.wait_for_network_idle()
+        self.wait_for_network_idle(step="navigate_to_registration")
         attach_screenshot(self.page, "Registration page loaded")
 
     @allure.step("Check registration page elements are visible")
@@ -21,7 +21,7 @@ class TryUploadPage(BaseUploadPage):
 
         self.page.goto(try_upload_url, wait_until="domcontentloaded")
         # Wait for network idle to ensure all resources (images, CSS) are loaded - critical for pixel tests
-        self.wait_for_network_idle()
+        self.wait_for_network_idle(step="navigate_to_try_upload")
 
         attach_screenshot(self.page, "Try upload page loaded")
 
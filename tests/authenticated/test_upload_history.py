@@ -23,6 +23,7 @@ class TestUploadHistory:
     @pytest.mark.smoke
     @pytest.mark.regression
     @pytest.mark.validation
+    @pytest.mark.fresh_user
     def test_bmw_with_dtc_history_disable(self, authenticated_user_with_balance):
         page = authenticated_user_with_balance
         upload_page = UploadPage(page)
@@ -47,7 +48,7 @@ class TestUploadHistory:
             expect(page.locator(upload_page.locators.download_button)).to_be_visible(
                 timeout=Timeouts.Download.BUTTON_VISIBLE)
 
-            upload_page.wait_for_network_idle()
+            upload_page.wait_for_network_idle(step="apply_order_dtc_history")
             attach_screenshot(page, "After order applied")
 
         with allure.step("Navigate to history page directly"):
@@ -60,7 +61,7 @@ class TestUploadHistory:
             attach_screenshot(page, "History page loaded")
 
         with allure.step("Open info modal for BMW purchase"):
-            upload_page.wait_for_network_idle()
+            upload_page.wait_for_network_idle(step="open_info_modal")
             bmw_file_link = page.locator("a.table-patch-link").filter(has_text=re.compile(r"BMW.*\.bin$"))
 
             expect(bmw_file_link.first).to_be_visible(timeout=Timeouts.PageLoad.DOMCONTENTLOADED_LONG)
@@ -100,10 +101,10 @@ class TestUploadHistory:
             page.get_by_role("button", name="закрыть").click()
             modal_dialog = page.locator("dialog[role='dialog']")
             expect(modal_dialog).not_to_be_visible(timeout=Timeouts.Modal.NOT_VISIBLE)
-            upload_page.wait_for_network_idle()
+            upload_page.wait_for_network_idle(step="close_info_modal")
 
         with allure.step("Click disable DTC button"):
-            upload_page.wait_for_network_idle()
+            upload_page.wait_for_network_idle(step="disable_dtc")
             bmw_file_link = page.locator("a.table-patch-link").filter(has_text=re.compile(r"BMW.*\.bin$")).first
             expect(bmw_file_link).to_be_visible(timeout=Timeouts.PageLoad.DOMCONTENTLOADED_LONG)
 
@@ -141,7 +142,7 @@ class TestUploadHistory:
                 logging.warning(f"Failed to wait for networkidle, falling back to load state: {e}")
                 page.wait_for_load_state("load", timeout=Timeouts.BASE_PAGE_LOAD)
 
-            upload_page.wait_for_network_idle()
+            upload_page.wait_for_network_idle(step="open_history")
             page.wait_for_timeout(500)
 
         with allure.step("Enter error code 244A, verify and apply DTC disable"):
@@ -177,7 +178,7 @@ class TestUploadHistory:
             attach_element_screenshot(apply_button, "Apply button")
 
             apply_button.click()
-            upload_page.wait_for_network_idle()
+            upload_page.wait_for_network_idle(step="apply_dtc_solution")
             attach_screenshot(page, "DTC disabled applied")
 
             download_button = page.get_by_role("button", name="скачать")
@@ -224,7 +225,7 @@ class TestUploadHistory:
                 pass
 
         with allure.step("Verify transaction details and download patched file"):
-            upload_page.wait_for_network_idle()
+            upload_page.wait_for_network_idle(step="transaction_details")
 
             dtc_disabled_row = page.locator("tr[data-test-id='history-row']").filter(has=dtc_disabled_file).first
             expect(dtc_disabled_row).to_be_visible(timeout=Timeouts.History.ROW_VISIBLE)
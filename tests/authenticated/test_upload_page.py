@@ -25,6 +25,7 @@ class TestUploadPageElements:
     @pytest.mark.smoke
     @pytest.mark.regression
     @pytest.mark.validation
+    @pytest.mark.fresh_user
     def test_file_upload_mazda(self, authenticated_user_new):
         vehicle_type = "Car"
         brand = "Mazda"
@@ -66,6 +67,7 @@ class TestUploadPageElements:
     @pytest.mark.upload
     @pytest.mark.regression
     @pytest.mark.validation
+    @pytest.mark.fresh_user
     def test_file_upload_mbsprinter(self, authenticated_user_new):
         vehicle_type = "Car"
         file_name = "MBSprinter"
@@ -103,6 +105,7 @@ class TestUploadPageElements:
     @pytest.mark.upload
     @pytest.mark.regression
     @pytest.mark.validation
+    @pytest.mark.fresh_user
     def test_dtc_off_with_error_codes_bmw(self, authenticated_user_new):
         vehicle_type = "Car"
         file_name = "BMW_255F.bin"
@@ -143,6 +146,7 @@ class TestUploadPageElements:
     @pytest.mark.upload
     @pytest.mark.regression
     @pytest.mark.validation
+    @pytest.mark.fresh_user
     def test_dtc_off_with_error_codes_mercedes(self, authenticated_user_new):
         vehicle_type = "Car"
         file_name = "MBSprinter_31029A.bin"
@@ -183,6 +187,7 @@ class TestUploadPageElements:
     @allure.title("Test file upload, search and price calculation")
     @pytest.mark.upload
     @pytest.mark.validation
+    @pytest.mark.fresh_user
     def test_file_upload_and_price_calculation(self, authenticated_user_new):
         vehicle_type = "Car"
         page = authenticated_user_new
@@ -245,6 +250,7 @@ class TestUploadPageElements:
     @pytest.mark.upload
     @pytest.mark.regression
     @pytest.mark.validation
+    @pytest.mark.fresh_user
     def test_dtc_off_with_error_codes_and_history_check(self, authenticated_user_new):
         vehicle_type = "Car"
         page = authenticated_user_new
@@ -473,6 +479,7 @@ class TestUploadPageElements:
     @pytest.mark.upload
     @pytest.mark.regression
     @pytest.mark.validation
+    @pytest.mark.fresh_user
     def test_upload_with_cashback_usage(self, authenticated_user_new):
         vehicle_type = "Car"
         file_name = "BMW"
@@ -501,7 +508,7 @@ class TestUploadPageElements:
             expect(page.locator(upload_page.locators.download_button)).to_be_visible(
                 timeout=Timeouts.Download.BUTTON_VISIBLE)
 
-            upload_page.wait_for_network_idle()
+            upload_page.wait_for_network_idle(step="apply_order_first_purchase")
             upload_page.dismiss_currency_modal()
 
         with allure.step("First purchase - Verify cashback in profile"):
@@ -544,7 +551,7 @@ class TestUploadPageElements:
 
             upload_page.apply_order(wait_time=0)
             expect(page.locator(upload_page.locators.download_button)).to_be_visible(timeout=Timeouts.Download.BUTTON_VISIBLE)
-            upload_page.wait_for_network_idle()
+            upload_page.wait_for_network_idle(step="apply_order_cashback_purchase")
 
         with allure.step("Second purchase - Verify cashback is used"):
             profile_url = f"{BASE_URL}/app/profile"
@@ -613,6 +620,7 @@ class TestUploadPageElements:
     @allure.title("Test that payment modal no appears when user has zero balance but cashback")
     @pytest.mark.upload
     @pytest.mark.validation
+    @pytest.mark.fresh_user
     def test_zero_balance_with_cashback_payment_modal(self, authenticated_user_without_balance_but_cashback):
         vehicle_type = "Car"
         page = authenticated_user_without_balance_but_cashback
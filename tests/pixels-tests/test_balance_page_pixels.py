@@ -9,6 +9,7 @@ from locators.balance_locators import (
     BalanceLocators,
 )
 from pages.balance_page import BalancePage
+from utils.stabilize import stabilize
 
 
 @allure.epic("Visual Regression")
@@ -42,6 +43,7 @@ class TestBalancePageVisualRegression:
             expect(page_body).to_be_visible(timeout=Timeouts.BASE_ELEMENT_VISIBLE)
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, page_body)
             # Capture screenshot of the full page body
             assert_snapshot_with_threshold(page_body, threshold=0.15)
 
@@ -70,5 +72,6 @@ class TestBalancePageVisualRegression:
             expect(page_body).to_be_visible(timeout=Timeouts.BASE_ELEMENT_VISIBLE)
             # Wait for animations and rendering to complete
             page.wait_for_timeout(3000)
+            stabilize(page, page_body)
             # Capture screenshot of the full page body
             assert_snapshot_with_threshold(page_body, threshold=0.15)
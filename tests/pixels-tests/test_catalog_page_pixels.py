@@ -4,6 +4,7 @@ from playwright.sync_api import expect
 
 from config.auth_config import BASE_URL
 from config.timeouts import Timeouts
+from utils.stabilize import stabilize
 
 
 @allure.epic("Visual Regression")
@@ -26,8 +27,9 @@ class TestCatalogPageVisualRegression:
             # Wait for animations and rendering to complete before full page screenshot
             page.wait_for_load_state("domcontentloaded")
             page.wait_for_timeout(1000)
+            stabilize(page)
             # Capture full page screenshot
-            assert_snapshot_with_threshold(page.screenshot(full_page=True), threshold=0.15)
+            assert_snapshot_with_threshold(page, threshold=0.15, full_page=True)
 
     @allure.title("Brand selection page snapshot (Level 2)")
     @pytest.mark.pixel_test
@@ -42,6 +44,7 @@ class TestCatalogPageVisualRegression:
             expect(panel).to_be_visible(timeout=500)
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, panel)
             assert_snapshot_with_threshold(panel.screenshot(), threshold=0.15)
 
     @allure.title("Engine type selection page snapshot (Level 3)")
@@ -58,8 +61,9 @@ class TestCatalogPageVisualRegression:
             # Wait for animations and rendering to complete before full page screenshot
             page.wait_for_load_state("domcontentloaded")
             page.wait_for_timeout(1000)
+            stabilize(page)
             # Capture full page screenshot
-            assert_snapshot_with_threshold(page.screenshot(full_page=True), threshold=0.15)
+            assert_snapshot_with_threshold(page, threshold=0.15, full_page=True)
 
     @allure.title("ECU selection page snapshot (Level 4)")
     @pytest.mark.pixel_test
@@ -73,8 +77,9 @@ class TestCatalogPageVisualRegression:
             # Wait for animations and rendering to complete before full page screenshot
             page.wait_for_load_state("domcontentloaded")
             page.wait_for_timeout(1000)
+            stabilize(page)
             # Capture full page screenshot
-            assert_snapshot_with_threshold(page.screenshot(full_page=True), threshold=0.15)
+            assert_snapshot_with_threshold(page, threshold=0.15, full_page=True)
 
     @allure.title("Stock list page snapshot (Level 5)")
     @pytest.mark.pixel_test
@@ -88,8 +93,9 @@ class TestCatalogPageVisualRegression:
             # Wait for animations and rendering to complete before full page screenshot
             page.wait_for_load_state("domcontentloaded")
             page.wait_for_timeout(1000)
+            stabilize(page)
             # Capture full page screenshot
-            assert_snapshot_with_threshold(page.screenshot(full_page=True), threshold=0.15)
+            assert_snapshot_with_threshold(page, threshold=0.15, full_page=True)
 
     @allure.title("Product card page snapshot (Level 6)")
     @pytest.mark.pixel_test
@@ -108,4 +114,5 @@ class TestCatalogPageVisualRegression:
             product_card = page.locator(".product-card").first
             expect(product_card).to_be_visible(timeout=Timeouts.BASE_ELEMENT_VISIBLE)
             page.wait_for_timeout(500)
+            stabilize(page, product_card)
             assert_snapshot_with_threshold(product_card.screenshot(), threshold=0.15)
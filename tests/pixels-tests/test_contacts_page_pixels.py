@@ -4,6 +4,7 @@ from playwright.sync_api import expect
 
 from config.auth_config import BASE_URL
 from config.timeouts import Timeouts
+from utils.stabilize import stabilize
 
 
 @allure.epic("Visual Regression")
@@ -25,5 +26,6 @@ class TestContactsPageVisualRegression:
             expect(main_content).to_be_visible(timeout=500)
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, main_content)
             assert_snapshot_with_threshold(main_content.screenshot(), threshold=0.15)
 
@@ -11,6 +11,7 @@ from tests.authenticated.helpers.history_helpers import (
     handle_history_route,
     load_mock_data,
 )
+from utils.stabilize import stabilize
 
 
 @allure.epic("Visual Regression")
@@ -44,6 +45,7 @@ class TestHistoryPageVisualRegression:
             history_table = page.locator(history_page.locators.history_table)
             if history_table.count() > 0:
                 expect(history_table).to_be_visible(timeout=5000)
+            stabilize(page)
             # Mask header_container to avoid dynamic content differences
             assert_snapshot_lenient(page, threshold=1.0, mask_elements=[AppLocators.header_container])
 
@@ -82,6 +84,7 @@ class TestHistoryPageVisualRegression:
                 # Guarantee full page load - wait for table to be stable
                 expect(page.locator(history_page.locators.history_table)).to_be_visible(timeout=30000)
                 page.wait_for_timeout(2000)
+                stabilize(page)
                 # Mask header_container to avoid dynamic content differences
                 assert_snapshot_lenient(page, threshold=0.5, mask_elements=[AppLocators.header_container])
         finally:
@@ -8,6 +8,7 @@ from config.auth_config import BASE_URL
 from config.timeouts import Timeouts
 from locators.home_locators import AboutLocators, HeaderLocators, ServicesLocators
 from utils.playwright_helpers import scroll_to_make_visible
+from utils.stabilize import stabilize
 
 
 def wait_for_page_ready(page) -> None:
@@ -56,6 +57,7 @@ class TestHomePageVisualRegression:
             expect(header).to_be_visible(timeout=500)
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, header)
             assert_snapshot_with_threshold(header, threshold=0.15)
 
     @allure.title("Main content snapshot")
@@ -70,7 +72,8 @@ class TestHomePageVisualRegression:
             # Wait for animations and rendering to complete before full page screenshot
             page.wait_for_load_state("domcontentloaded")
             page.wait_for_timeout(1000)
-            assert_snapshot_with_threshold(page.screenshot(full_page=True), threshold=0.15)
+            stabilize(page)
+            assert_snapshot_with_threshold(page, threshold=0.15, full_page=True)
 
     @allure.title("Footer section snapshot")
     @pytest.mark.pixel_test
@@ -89,6 +92,7 @@ class TestHomePageVisualRegression:
             wait_for_element_ready(page, footer)
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, footer)
             assert_snapshot_with_threshold(footer, threshold=0.15)
 
     @allure.title("Hero section snapshot")
@@ -103,6 +107,7 @@ class TestHomePageVisualRegression:
             expect(hero).to_be_visible(timeout=500)
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, hero)
             assert_snapshot_with_threshold(hero, threshold=0.15)
 
     @allure.title("Cards section snapshot (Power, Systems, Standards)")
@@ -118,6 +123,7 @@ class TestHomePageVisualRegression:
             wait_for_element_ready(page, cards_container)
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, cards_container)
             assert_snapshot_with_threshold(cards_container, threshold=0.15)
 
     @allure.title("About section snapshot (Кто мы?)")
@@ -133,6 +139,7 @@ class TestHomePageVisualRegression:
             wait_for_element_ready(page, about_section)
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, about_section)
             assert_snapshot_with_threshold(about_section, threshold=0.15)
 
     @allure.title("Why section snapshot (Почему мы?)")
@@ -148,6 +155,7 @@ class TestHomePageVisualRegression:
             wait_for_element_ready(page, why_section)
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, why_section)
             assert_snapshot_with_threshold(why_section, threshold=0.15)
 
     @allure.title("Services section snapshot (Diesel + Gasoline)")
@@ -163,4 +171,5 @@ class TestHomePageVisualRegression:
             wait_for_element_ready(page, services_section)
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, services_section)
             assert_snapshot_with_threshold(services_section, threshold=0.15)
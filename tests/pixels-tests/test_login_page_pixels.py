@@ -6,6 +6,7 @@ from config.auth_config import BASE_URL
 from config.timeouts import Timeouts
 from locators.login_locators import LoginLocators
 from utils.playwright_helpers import scroll_to_make_visible
+from utils.stabilize import stabilize
 
 
 @allure.epic("Visual Regression")
@@ -46,6 +47,7 @@ class TestLoginPageVisualRegression:
             expect(form_container).to_be_visible(timeout=300)
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, form_container)
             assert_snapshot_with_threshold(form_container, threshold=0.2)
 
     @allure.title("OTP modal from login snapshot")
@@ -81,6 +83,7 @@ class TestLoginPageVisualRegression:
             expect(otp_form_container).to_be_visible(timeout=300)
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, otp_form_container)
             assert_snapshot_with_threshold(otp_form_container, threshold=0.2, mask_elements=["[role='progressbar']"])
 
     @allure.title("Invalid OTP code error toast snapshot")
@@ -9,6 +9,7 @@ from config.timeouts import Timeouts
 from locators.profile_locators import ProfileLocators
 from pages.profile_page import ProfilePage
 from utils.playwright_helpers import scroll_to_make_visible
+from utils.stabilize import stabilize
 
 
 @allure.epic("Visual Regression")
@@ -41,6 +42,7 @@ class TestProfilePageVisualRegression:
             page.wait_for_timeout(1000)
             page.wait_for_load_state("networkidle", timeout=30000)
             page.wait_for_timeout(1000)
+            stabilize(page, first_block)
             assert_snapshot_lenient(first_block, threshold=0.8, mask_elements=[ProfileLocators.email_value_container])
 
     @allure.title("Discount section snapshot")
@@ -79,6 +81,7 @@ class TestProfilePageVisualRegression:
             expect(discount_block).to_be_visible(timeout=1000)
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, discount_block)
             assert_snapshot_with_threshold(discount_block, threshold=0.2)
 
     @allure.title("Cashback section snapshot")
@@ -117,4 +120,5 @@ class TestProfilePageVisualRegression:
             expect(cashback_block).to_be_visible(timeout=1000)
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, cashback_block)
             assert_snapshot_with_threshold(cashback_block, threshold=0.2)
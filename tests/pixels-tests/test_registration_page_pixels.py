@@ -6,6 +6,7 @@ from config.auth_config import BASE_URL
 from config.timeouts import Timeouts
 from locators.registration_locators import RegistrationLocators
 from utils.playwright_helpers import scroll_to_make_visible
+from utils.stabilize import stabilize
 
 
 @allure.epic("Visual Regression")
@@ -30,6 +31,7 @@ class TestRegistrationPageVisualRegression:
             expect(form).to_be_visible(timeout=300)
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, form)
             assert_snapshot_with_threshold(form, threshold=0.2)
 
     @allure.title("Invalid email error modal snapshot")
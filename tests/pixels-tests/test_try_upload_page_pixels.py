@@ -4,6 +4,7 @@ from playwright.sync_api import expect
 
 from config.timeouts import Timeouts
 from pages.try_upload_page import TryUploadPage
+from utils.stabilize import stabilize
 
 
 @allure.epic("Visual Regression")
@@ -36,6 +37,7 @@ class TestTryUploadPageVisualRegression:
             expect(order_form_area).to_be_visible(timeout=500)
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, order_form_area)
             assert_snapshot_with_threshold(order_form_area.screenshot(), threshold=0.15)
 
     @allure.title("Try upload - No solutions found snapshot")
@@ -65,6 +67,7 @@ class TestTryUploadPageVisualRegression:
             expect(no_solutions_message).to_be_visible(timeout=500)
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, no_solutions_message)
             assert_snapshot_with_threshold(no_solutions_message, threshold=0.2)
 
     @allure.title("Try upload - DTC modal snapshot")
@@ -96,4 +99,5 @@ class TestTryUploadPageVisualRegression:
             expect(dtc_modal).to_be_visible(timeout=500)
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, dtc_modal)
             assert_snapshot_with_threshold(dtc_modal, threshold=0.15)
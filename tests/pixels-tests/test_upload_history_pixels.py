@@ -13,6 +13,7 @@ from tests.authenticated.helpers.history_helpers import (
     handle_history_route,
     load_mock_data,
 )
+from utils.stabilize import stabilize
 
 
 @allure.epic("Visual Regression")
@@ -91,6 +92,7 @@ class TestUploadHistoryVisualRegression:
                 expect(download_button).to_be_visible(timeout=300)
                 # Wait for animations and rendering to complete
                 page.wait_for_timeout(3000)
+                stabilize(page, modal_dialog)
                 assert_snapshot_with_threshold(modal_dialog, threshold=0.15)
         finally:
             page.unroute(f"**{HISTORY_API_ENDPOINT}**")
@@ -159,12 +161,14 @@ class TestUploadHistoryVisualRegression:
                 expect(history_form).to_be_visible(timeout=500)
                 # Wait for animations and rendering to complete
                 page.wait_for_timeout(1000)
+                stabilize(page, history_form)
                 assert_snapshot_with_threshold(history_form, threshold=0.2)
         finally:
             page.unroute(f"**{HISTORY_API_ENDPOINT}**")
 
     @allure.title("DTC disable page snapshot (/remove-dtc)")
     @pytest.mark.pixel_test
+    @pytest.mark.fresh_user
     def test_dtc_disable_page(self, authenticated_user_with_balance, assert_snapshot_lenient):
 
         page = authenticated_user_with_balance
@@ -208,7 +212,7 @@ class TestUploadHistoryVisualRegression:
             expect(error_code_input).to_be_visible(timeout=Timeouts.Upload.ERROR_CODE_INPUT_VISIBLE)
 
             # Wait for network idle to ensure page is fully loaded and stable
-            upload_page.wait_for_network_idle()
+            upload_page.wait_for_network_idle(step="error_code_input")
             page.wait_for_timeout(500)
 
             # Найти форму как ancestor от input поля (как в test_dtc_disable_page_with_errors)
@@ -230,4 +234,5 @@ class TestUploadHistoryVisualRegression:
             # Использовать сам locator вместо screenshot(), чтобы маски работали
             # pytest-playwright-visual-snapshot применяет маски при создании скриншота
             page.wait_for_timeout(500)
+            stabilize(page, history_form)
             assert_snapshot_lenient(history_form, threshold=0.8, mask_elements=mask_selectors)
@@ -7,6 +7,7 @@ from playwright.sync_api import expect
 from config.auth_config import BASE_URL
 from config.timeouts import Timeouts
 from pages.upload_page import UploadPage
+from utils.stabilize import stabilize
 
 
 @allure.epic("Visual Regression")
@@ -65,6 +66,7 @@ class TestUploadPageVisualRegression:
             # Wait for header to be stable after scroll
             expect(header_container).to_be_visible(timeout=1000)
             page.wait_for_timeout(500)
+            stabilize(page)
 
             # Move mouse to task-block to stabilize cursor position and avoid hover effects on other elements
             task_block = page.locator(".task-block").first
@@ -112,6 +114,7 @@ class TestUploadPageVisualRegression:
 
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, order_table)
             assert_snapshot_with_threshold(order_table.screenshot(), threshold=0.15)
 
     @allure.title("Upload page after file upload snapshot")
@@ -131,6 +134,7 @@ class TestUploadPageVisualRegression:
 
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, upload_form)
             assert_snapshot_with_threshold(upload_form, threshold=0.15)
 
 
@@ -177,6 +181,7 @@ class TestUploadPageVisualRegression:
 
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, dtc_codes_tab)
 
             # Screenshot the DTC codes HEX element/tab content
             assert_snapshot_with_threshold(dtc_codes_tab, threshold=0.15)
@@ -223,6 +228,7 @@ class TestUploadPageVisualRegression:
 
             # Wait for animations and rendering to complete
             page.wait_for_timeout(1000)
+            stabilize(page, dtc_codes_tab)
 
             # Screenshot the DTC codes HEX element/tab content
             assert_snapshot_with_threshold(dtc_codes_tab, threshold=0.15)
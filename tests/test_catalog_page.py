@@ -6,13 +6,15 @@ import allure
 import pytest
 from playwright.sync_api import expect
 
-from config.auth_config import BASE_URL
 from config.timeouts import Timeouts
+from fixtures.catalog import ECU_PAGE_PATHS
 from locators.catalog_locators import CatalogLocators
+from pages.async_base_page import gather_checks
+from pages.async_catalog_page import AsyncCatalogPage
+from utils.catalog_crawler import CatalogCrawler
 
 
 
-TIMEOUT = 10000  # milliseconds
 MAX_STOCKS_TO_CHECK = None  # None means check all stocks, or set to number to lim
 locators = CatalogLocators()
 
@@ -97,17 +99,15 @@ class TestCatalogPageLinksFunctionality:
     @pytest.mark.regression
     @pytest.mark.validation
     def test_catalog_links_functionality(self, catalog_page):
-        links = catalog_page.page.locator(locators.catalog_links)
-        link_count = links.count()
-        assert link_count > 0, "Should have at least one catalog link"
+        links = catalog_page.extract(locators.catalog_links)
+        assert len(links) > 0, "Should have at least one catalog link"
 
-        for i in range(min(4, link_count)):  # Check first 4 links
-            link = links.nth(i)
-            assert link.is_visible(), f"Link {i} should be visible"
+        for i, link in enumerate(links[:4]):  # Check first 4 links
+            assert link["visible"], f"Link {i} should be visible"
 
             # Check that link is clickable (may have href or be clickable element)
-            href = link.get_attribute("href")
-            class_attr = link.get_attribute("class") or ""
+            href = link["attributes"].get("href")
+            class_attr = link["attributes"].get("class", "")
 
             # Link should either have href or be clickable (have cursor-pointer class)
             assert (href is not None and href != "") or "cursor-pointer" in class_attr or "catalog-link" in class_attr, \
@@ -171,17 +171,15 @@ class TestCatalogBrandPage:
         page = catalog_brand_page.page
 
         # 1. Brand links presence and clickability validation
-        brand_links = page.locator(locators.brand_links)
-        brand_count = brand_links.count()
-        assert brand_count > 0, "Brand page should have brand links"
+        brand_links = catalog_brand_page.extract(locators.brand_links)
+        assert len(brand_links) > 0, "Brand page should have brand links"
 
-        for i in range(min(5, brand_count)):
-            link = brand_links.nth(i)
-            assert link.is_visible(), f"Brand link {i} should be visible"
+        for i, link in enumerate(brand_links[:5]):
+            assert link["visible"], f"Brand link {i} should be visible"
 
             # Check that link is clickable (may have href or be clickable element)
-            href = link.get_attribute("href")
-            class_attr = link.get_attribute("class") or ""
+            href = link["attributes"].get("href")
+            class_attr = link["attributes"].get("class", "")
 
             # Link should either have href or be clickable (have cursor-pointer or catalog-link class)
             assert (href is not None and href != "") or "cursor-pointer" in class_attr or "catalog-link" in class_attr, \
@@ -211,17 +209,15 @@ class TestCatalogEnginePage:
         page = catalog_engine_page.page
 
         # 1. Engine links presence and clickability validation
-        engine_links = page.locator(locators.engine_links)
-        engine_count = engine_links.count()
-        assert engine_count > 0, "Engine page should have engine links"
+        engine_links = catalog_engine_page.extract(locators.engine_links)
+        assert len(engine_links) > 0, "Engine page should have engine links"
 
-        for i in range(engine_count):
-            link = engine_links.nth(i)
-            assert link.is_visible(), f"Engine link {i} should be visible"
+        for i, link in enumerate(engine_links):
+            assert link["visible"], f"Engine link {i} should be visible"
 
             # Check that link is clickable (may have href or be clickable element)
-            href = link.get_attribute("href")
-            class_attr = link.get_attribute("class") or ""
+            href = link["attributes"].get("href")
+            class_attr = link["attributes"].get("class", "")
 
             # Link should either have href starting with /catalog/ or be clickable
             if href:
@@ -239,7 +235,7 @@ class TestCatalogEnginePage:
         engine_names = page.locator(locators.engine_names)
         assert engine_names.count() > 0, "Engine page should have names"
 
-        actual_names = {engine_names.nth(i).text_content().strip() for i in range(engine_names.count())}
+        actual_names = {name["text"].strip() for name in catalog_engine_page.extract(locators.engine_names)}
         expected_types = {"Diesel engines", "Petrol engines", "Gearbox"}
         assert any(expected in actual_names for expected in expected_types), f"Expected at least one of {expected_types}"
 
@@ -261,17 +257,15 @@ class TestCatalogEnginePageMultipleBrands:
         page = catalog_engine_page_param.page
 
         # 1. Engine links presence and clickability validation
-        engine_links = page.locator(locators.engine_links)
-        engine_count = engine_links.count()
-        assert engine_count > 0, "Engine page should have links"
+        engine_links = catalog_engine_page_param.extract(locators.engine_links)
+        assert len(engine_links) > 0, "Engine page should have links"
 
-        for i in range(engine_count):
-            link = engine_links.nth(i)
-            assert link.is_visible(), f"Engine link {i} should be visible"
+        for i, link in enumerate(engine_links):
+            assert link["visible"], f"Engine link {i} should be visible"
 
             # Check that link is clickable (may have href or be clickable element)
-            href = link.get_attribute("href")
-            class_attr = link.get_attribute("class") or ""
+            href = link["attributes"].get("href")
+            class_attr = link["attributes"].get("class", "")
 
             # Link should either have href starting with /catalog/ or be clickable
             if href:
@@ -308,16 +302,15 @@ class TestCatalogECUPage:
         expect(ecu_links.first).to_be_visible(timeout=Timeouts.ShortWaits.SHORT_PAUSE)
 
         # 1. ECU links presence and href validation
-        ecu_count = ecu_links.count()
-        assert ecu_count > 0, "ECU page should have links"
+        ecu_links_records = catalog_ecu_page.extract(locators.ecu_links)
+        assert len(ecu_links_records) > 0, "ECU page should have links"
 
-        for i in range(ecu_count):
-            link = ecu_links.nth(i)
-            assert link.is_visible(), f"ECU link {i} should be visible"
+        for i, link in enumerate(ecu_links_records):
+            assert link["visible"], f"ECU link {i} should be visible"
 
             # Check that link is clickable (may have href or be clickable element)
-            href = link.get_attribute("href")
-            class_attr = link.get_attribute("class") or ""
+            href = link["attributes"].get("href")
+            class_attr = link["attributes"].get("class", "")
 
             # Link should either have href starting with /catalog/ or be clickable
             if href:
@@ -336,45 +329,26 @@ class TestCatalogECUPage:
             assert (text is not None and len(text.strip()) > 0), f"ECU {i} should have text"
 
 
-class TestCatalogECUPageMultipleBrands:
+class TestCatalogECUPagesConcurrently:
 
-    @allure.title("Complete validation of ECU page for multiple brands")
+    @allure.title("Validation of ECU pages for multiple brands, pages checked concurrently")
     @pytest.mark.validation
-    def test_ecu_page_complete_multiple_brands(self, catalog_ecu_page_param):
-        page = catalog_ecu_page_param.page
-
-        # Wait for page to be fully loaded
-        page.wait_for_load_state("domcontentloaded", timeout=Timeouts.BASE_PAGE_LOAD)
-        ecu_links = page.locator(locators.ecu_links)
-        expect(ecu_links.first).to_be_visible(timeout=Timeouts.ShortWaits.SHORT_PAUSE)
+    def test_ecu_pages_concurrently(self, async_loop, async_context):
 
-        # 1. ECU links presence and clickability validation
-        ecu_count = ecu_links.count()
-        assert ecu_count > 0, "ECU page should have links"
+        async def check_ecu_page(path):
+            catalog_page = AsyncCatalogPage(await async_context.new_page())
+            try:
+                return await catalog_page.check_ecu_page(path)
+            finally:
+                await catalog_page.close()
 
-        for i in range(ecu_count):
-            link = ecu_links.nth(i)
-            assert link.is_visible(), f"ECU link {i} should be visible"
-
-            # Check that link is clickable (may have href or be clickable element)
-            href = link.get_attribute("href")
-            class_attr = link.get_attribute("class") or ""
-
-            # Link should either have href starting with /catalog/ or be clickable
-            if href:
-                assert href.startswith("/catalog/"), f"ECU link {i} should start with /catalog/"
-            else:
-                # If no href, should be clickable via class
-                assert "cursor-pointer" in class_attr or "catalog-link" in class_attr, \
-                    f"ECU link {i} should be clickable"
-
-        # 2. ECU names visible and not empty
-        ecu_names = page.locator(locators.ecu_names)
-        assert ecu_names.count() > 0, "ECU page should have names"
-        for i in range(min(3, ecu_names.count())):
-            ecu = ecu_names.nth(i)
-            text = ecu.text_content()
-            assert (text is not None and len(text.strip()) > 0), f"ECU {i} should have text"
+        concurrency = int(os.getenv("ASYNC_PAGES_CONCURRENCY", "4"))
+        results = gather_checks(
+            async_loop,
+            {f"ECU page {path}": check_ecu_page(path) for path in ECU_PAGE_PATHS},
+            concurrency=concurrency,
+        )
+        assert len(results) == len(ECU_PAGE_PATHS), "All ECU pages should be checked"
 
 
 class TestCatalogStockPage:
@@ -647,146 +621,10 @@ class TestCatalogStockCardPageMultipleBrands:
 
 class TestCatalogCompleteFlow:
 
-    def _check_error_page(self, page, url):
-        """Check if page is error page"""
-        return "error" in page.title().lower() or "404" in page.title().lower()
-
-    def _process_engine_page(self, page, engine_href, brand_path, results, locators):
-        """Process a single engine page"""
-        try:
-            page.goto(f"{BASE_URL}{engine_href}")
-            page.wait_for_load_state("networkidle")
-
-            if self._check_error_page(page, engine_href):
-                results['broken_pages'].append(f"{BASE_URL}{engine_href}")
-                return
-
-            ecu_links = page.locator(locators.ecu_links)
-            ecu_count = ecu_links.count()
-            direct_stock_links = page.locator(locators.stock_link)
-            direct_stock_count = direct_stock_links.count()
-
-            if ecu_count > 0:
-                self._process_ecu_links(page, ecu_links, ecu_count, engine_href, brand_path, results, locators)
-
-            elif direct_stock_count > 0:
-                self._process_direct_stocks(page, direct_stock_links, direct_stock_count, engine_href, brand_path, results, locators)
-
-            page.goto(f"{BASE_URL}{engine_href}")
-            page.wait_for_load_state("networkidle")
-        except Exception as e:
-            logging.warning(f"Failed to process engine page {engine_href} (continuing): {e}")
-
-    def _process_stocks_from_ecu(self, page, ecu_href, brand_path, results, locators, engine_href):
-        """Process all stocks for a given ECU"""
-        stock_links = page.locator(locators.stock_link)
-        stock_count = stock_links.count()
-
-        if stock_count > 0:
-            limit = MAX_STOCKS_TO_CHECK if MAX_STOCKS_TO_CHECK else stock_count
-            for k in range(min(limit, stock_count)):
-                self._process_stock_card(page, stock_links, k, ecu_href, brand_path, results, locators)
-
-        page.goto(f"{BASE_URL}{engine_href}")
-        page.wait_for_load_state("networkidle")
-
-    def _process_ecu_links(self, page, ecu_links, ecu_count, engine_href, brand_path, results, locators):
-        """Process ECU links"""
-        for j in range(ecu_count):
-            try:
-                ecu_link = ecu_links.nth(j)
-                ecu_href = ecu_link.get_attribute('href', timeout=TIMEOUT)
-
-                if not ecu_href or not ecu_href.startswith('/catalog/'):
-                    continue
-
-                page.goto(f"{BASE_URL}{ecu_href}")
-                page.wait_for_load_state("networkidle")
-
-                if self._check_error_page(page, ecu_href):
-                    results['broken_pages'].append(f"{BASE_URL}{ecu_href}")
-                    continue
-
-                self._process_stocks_from_ecu(page, ecu_href, brand_path, results, locators, engine_href)
-            except Exception as e:
-                logging.warning(f"Failed to process ECU link {ecu_href} (continuing): {e}")
-                continue
-
-    def _process_direct_stocks(self, page, stock_links, direct_stock_count, engine_href, brand_path, results, locators):
-        """Process direct stocks"""
-        limit = MAX_STOCKS_TO_CHECK if MAX_STOCKS_TO_CHECK else direct_stock_count
-        current_url = page.url
-        for k in range(min(limit, direct_stock_count)):
-            try:
-                stock_item = stock_links.nth(k)
-
-                # Stock items are clickable li elements, not links with href
-                # Click the item and check if navigation occurred
-                stock_item.click(timeout=TIMEOUT)
-
-                # Check if we navigated to a stock card page
-                if page.url != current_url:
-                    product_card = page.locator(locators.product_card)
-                    expect(product_card).to_be_visible(timeout=Timeouts.BASE_ELEMENT_VISIBLE)
-                    results['success'].append(f"{brand_path} -> Stock {k+1}")
-
-                    # Navigate back to engine page
-                    page.goto(f"{BASE_URL}{engine_href}")
-                    page.wait_for_load_state("networkidle")
-                    current_url = page.url
-
-            except Exception as e:
-
-                # If navigation failed, log and continue
-                results['broken_pages'].append(f"{brand_path} -> Stock {k+1}: {str(e)}")
-
-                # Try to get back to engine page
-                try:
-                    page.goto(f"{BASE_URL}{engine_href}")
-                    page.wait_for_load_state("networkidle")
-                    current_url = page.url
-                except Exception as e2:
-                    logging.warning(f"Failed to navigate back to engine page {engine_href}: {e2}")
-                continue
-
-    def _process_stock_card(self, page, stock_links, k, ecu_href, brand_path, results, locators):
-        """Process a single stock card"""
-        current_url = page.url
-        try:
-            stock_item = stock_links.nth(k)
-
-            # Stock items are clickable li elements, not links with href
-            # Click the item and check if navigation occurred
-            stock_item.click(timeout=TIMEOUT)
-
-            # Check if we navigated to a stock card page
-            if page.url != current_url:
-                product_card = page.locator(locators.product_card)
-                expect(product_card).to_be_visible(timeout=Timeouts.BASE_ELEMENT_VISIBLE)
-
-                if product_card.count() > 0:
-                    results['success'].append(f"{brand_path} -> Stock {k+1}")
-                    assert product_card.is_visible()
-
-                # Navigate back to ECU page
-                page.goto(f"{BASE_URL}{ecu_href}")
-                page.wait_for_load_state("networkidle")
-
-        except Exception as e:
-            # If navigation failed, log and continue
-            results['broken_pages'].append(f"{brand_path} -> Stock {k+1}: {str(e)}")
-
-            # Try to get back to ECU page
-            try:
-                page.goto(f"{BASE_URL}{ecu_href}")
-                page.wait_for_load_state("networkidle")
-
-            except Exception as e2:
-                logging.warning(f"Failed to navigate back to ECU page {ecu_href}: {e2}")
-
     def _save_report(self, results):
         """Save test results to file"""
-        broken_urls = [item for item in results['broken_pages'] if item.startswith('https://') and ':' not in item]
+        broken_urls = results['broken_pages']
+        failed = results['failed']
         os.makedirs('reports/categories', exist_ok=True)
         report_file = f"reports/categories/catalog_404_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
 
@@ -794,7 +632,8 @@ class TestCatalogCompleteFlow:
             f.write("="*60 + "\nCATALOG FLOW TEST SUMMARY\n" + "="*60 + "\n")
             f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write(f"Successfully tested: {len(results['success'])} paths\n")
-            f.write(f"404 errors found: {len(broken_urls)}\n\n")
+            f.write(f"404 errors found: {len(broken_urls)}\n")
+            f.write(f"Failed to check: {len(failed)} paths\n\n")
 
             if broken_urls:
                 f.write("404 URLs:\n")
@@ -802,54 +641,20 @@ class TestCatalogCompleteFlow:
                 for url in broken_urls:
                     f.write(f"  - {url}\n")
 
-        return report_file, broken_urls
-
-    def _process_brand(self, page, brand_path, results, locators):
-        """Process a single brand and its engines"""
-        try:
-            print(f"\nProcessing brand: {brand_path}")
-            page.goto(f"{BASE_URL}/catalog/{brand_path}")
-            page.wait_for_load_state("networkidle")
-
-            if self._check_error_page(page, brand_path):
-                results['broken_pages'].append(f"Brand: {brand_path}")
-                return
-
-            engine_links = page.locator(locators.engine_links)
-            engine_count = engine_links.count()
-
-            if engine_count == 0:
-                results['no_content'].append(f"Brand {brand_path}: No engines")
-                return
+            if failed:
+                f.write("\nFailed paths:\n")
 
-            print(f"Found {engine_count} engine types")
+                for item in failed:
+                    f.write(f"  - {item}\n")
 
-            for i in range(engine_count):
-                try:
-                    engine_link = engine_links.nth(i)
-                    engine_href = engine_link.get_attribute('href', timeout=TIMEOUT)
-
-                    if engine_href and engine_href.startswith('/catalog/'):
-                        self._process_engine_page(page, engine_href, brand_path, results, locators)
-
-                except Exception as e:
-                    logging.warning(f"Failed to process engine link {engine_href} (continuing): {e}")
-                    continue
-
-            page.goto(f"{BASE_URL}/catalog/car")
-            page.wait_for_load_state("networkidle")
-
-        except Exception as e:
-            results['broken_pages'].append(f"Brand {brand_path}: {str(e)}")
+        return report_file, broken_urls
 
-    @pytest.mark.skip(reason="Skipping too long")
     @allure.title("Test complete flow: brand -> engine type -> ECU -> stock list -> stock card")
-    def test_brand_engine_ecu_stock_flow(self, page, get_all_brands_from_catalog):
-        all_brands = get_all_brands_from_catalog
-        results = {'success': [], 'broken_pages': [], 'no_content': []}
-
-        for brand_path in all_brands:
-            self._process_brand(page, brand_path, results, locators)
+    @pytest.mark.validation
+    def test_brand_engine_ecu_stock_flow(self, async_loop, async_context):
+        concurrency = int(os.getenv("CATALOG_CRAWL_CONCURRENCY", os.getenv("ASYNC_PAGES_CONCURRENCY", "4")))
+        crawler = CatalogCrawler(async_context, ["/catalog/car"], concurrency=concurrency, max_stocks=MAX_STOCKS_TO_CHECK)
+        results = async_loop.run(crawler.run())
 
         # Save report and print summary
         report_file, broken_urls = self._save_report(results)
@@ -859,6 +664,7 @@ class TestCatalogCompleteFlow:
         print("="*60)
         print(f"Successfully tested: {len(results['success'])} paths")
         print(f"404 errors found: {len(broken_urls)}")
+        print(f"Failed to check: {len(results['failed'])} paths")
         print(f"\nReport saved to: {report_file}")
 
         if broken_urls:
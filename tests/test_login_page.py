@@ -255,7 +255,7 @@ class TestLoginPageTests:
 
         with allure.step("Fill OTP fields with invalid code"):
             attach_screenshot(login_page.page, "OTP form before filling")
-            login_page.wait_for_network_idle()
+            login_page.wait_for_network_idle(step="otp_form")
 
             login_page.fill_pin_fields(invalid_otp, "OTP pin fields")
             attach_screenshot(login_page.page, "OTP form filled with invalid code")
@@ -298,7 +298,7 @@ class TestLoginPageTests:
             expect(resend_btn).to_be_enabled(timeout=Timeouts.BASE_ELEMENT_ENABLED)
             attach_element_screenshot(resend_btn, "Resend button")
 
-            login_page.wait_for_network_idle()
+            login_page.wait_for_network_idle(step="otp_resend")
             resend_btn.click(force=True)
             attach_screenshot(login_page.page, "After clicking resend button")
 
@@ -311,14 +311,14 @@ class TestLoginPageTests:
         with allure.step("Clear OTP fields"):
             attach_screenshot(login_page.page, "Before clearing OTP fields")
 
-            login_page.wait_for_network_idle()
+            login_page.wait_for_network_idle(step="otp_clear")
             login_page.clear_pin_fields("OTP pin fields (cleared)")
             attach_screenshot(login_page.page, "After clearing OTP fields")
 
         with allure.step("Fill OTP fields with valid code"):
             attach_screenshot(login_page.page, "Before filling valid OTP")
 
-            login_page.wait_for_network_idle()
+            login_page.wait_for_network_idle(step="otp_fill_valid")
             login_page.fill_pin_fields(valid_otp, "OTP pin fields (filled)")
             attach_screenshot(login_page.page, "OTP form filled with valid code")
 
@@ -350,7 +350,7 @@ class TestLoginPageTests:
 
         with allure.step("Verify successful login and redirect to app"):
             attach_screenshot(login_page.page, "After successful login")
-            login_page.wait_for_network_idle()
+            login_page.wait_for_network_idle(step="login_redirect")
 
             expect(login_page.page,"User should be redirected to /app",
             ).to_have_url(re.compile(r".*/app.*"), timeout=Timeouts.BASE_PAGE_LOAD)
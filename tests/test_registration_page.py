@@ -1,17 +1,32 @@
 import re
 import time
+from urllib.parse import urlparse
 
 import allure
 import pytest
-from playwright.sync_api import expect
+from playwright.sync_api import Request, expect
 
-from config.auth_config import OTP_CODE
+from auth.api_client import AuthApiClient
+from config.auth_config import AUTH_API_LOGIN_CODE, AUTH_API_REGISTER, OTP_CODE
 from config.timeouts import Timeouts
 from locators.registration_locators import RegistrationLocators
-from utils.allure_helpers import attach_element_screenshot
+from utils.allure_helpers import attach_element_screenshot, attach_json
 from utils.user_generator import generate_unique_email
 
 
+def _is_auth_request(request: Request) -> bool:
+    return "/api-v1/auth/" in request.url and request.method == "POST"
+
+
+def _check_auth_api_contract(request: Request, endpoint: str, payload: dict) -> None:
+    """Auth API client (AUTH_VIA_API) must call the same endpoint with the same fields as the UI"""
+    body = request.post_data_json or {}
+    attach_json({"url": request.url, "body": body}, f"UI request to {endpoint}")
+
+    assert urlparse(request.url).path == endpoint, f"UI sent {request.url}, auth API client uses {endpoint}"
+    assert sorted(body) == sorted(payload), f"UI sent fields {sorted(body)}, auth API client sends {sorted(payload)}"
+
+
 @allure.epic("Registration")
 @allure.feature("Registration Page")
 @allure.title("Registration Page - User Registration")
@@ -191,13 +206,25 @@ class TestRegistrationPageTests:
             expect(register_btn).to_be_visible()
 
             attach_element_screenshot(register_btn, "Register button")
-            register_btn.click()
+            with registration_page.page.expect_request(_is_auth_request) as register_request:
+                register_btn.click()
+
+        with allure.step("Verify registration request matches auth API client"):
+            _check_auth_api_contract(
+                register_request.value, AUTH_API_REGISTER, AuthApiClient.register_payload(unique_email)
+            )
 
         with allure.step("Fill OTP fields with invalid code"):
             registration_page.fill_pin_fields(invalid_otp, "OTP pin fields")
 
         with allure.step("Submit invalid OTP code"):
-            registration_page.page.locator(self.locators.otp_send_button).first.click()
+            with registration_page.page.expect_request(_is_auth_request) as code_request:
+                registration_page.page.locator(self.locators.otp_send_button).first.click()
+
+        with allure.step("Verify OTP request matches auth API client"):
+            _check_auth_api_contract(
+                code_request.value, AUTH_API_LOGIN_CODE, AuthApiClient.login_code_payload(unique_email, invalid_otp)
+            )
 
         with allure.step("Verify error alert is displayed"):
             alert = registration_page.page.get_by_role("alert")
@@ -291,6 +318,6 @@ class TestRegistrationPageTests:
             registration_page.wait_standard()
 
             registration_page.wait_long()
-            registration_page.wait_for_network_idle()
+            registration_page.wait_for_network_idle(step="send_otp")
             expect(registration_page.page,"User should be redirected to /app",).to_have_url(
                 re.compile(r".*/app.*"), timeout=Timeouts.BASE_PAGE_LOAD)
@@ -28,7 +28,7 @@ class TestTryUploadPageElements:
         try_upload_page.navigate_to_try_upload()
 
         try_upload_page.reload_page()
-        try_upload_page.wait_for_network_idle()
+        try_upload_page.wait_for_network_idle(step="try_upload_reload_mazda")
 
         with allure.step("Upload file"):
             try_upload_page.upload_file(f"{brand}.bin")
@@ -61,7 +61,7 @@ class TestTryUploadPageElements:
         ecu = "Bosch EDC16"
         try_upload_page = TryUploadPage(page)
         try_upload_page.navigate_to_try_upload()
-        try_upload_page.wait_for_network_idle()
+        try_upload_page.wait_for_network_idle(step="navigate_to_try_upload_mbsprinter")
 
         with allure.step("Upload file"):
             try_upload_page.upload_file(f"{file_name}.bin")
@@ -95,7 +95,7 @@ class TestTryUploadPageElements:
         try_upload_page.navigate_to_try_upload()
 
         try_upload_page.reload_page()
-        try_upload_page.wait_for_network_idle()
+        try_upload_page.wait_for_network_idle(step="try_upload_reload_bmw")
 
         with allure.step("Upload file"):
             try_upload_page.upload_file(f"{file_name}.bin")
@@ -128,7 +128,7 @@ class TestTryUploadPageElements:
         try_upload_page.navigate_to_try_upload()
 
         try_upload_page.reload_page()
-        try_upload_page.wait_for_network_idle()
+        try_upload_page.wait_for_network_idle(step="try_upload_reload_engine_not_found")
 
         with allure.step("Upload file"):
             try_upload_page.upload_file("BMW.bin")
@@ -187,7 +187,7 @@ class TestTryUploadPageElements:
         try_upload_page = TryUploadPage(page)
         try_upload_page.navigate_to_try_upload()
         try_upload_page.reload_page()
-        try_upload_page.wait_for_network_idle()
+        try_upload_page.wait_for_network_idle(step="try_upload_reload_header")
 
         with allure.step("Check header elements"):
             try_upload_page.check_header_elements()
@@ -200,7 +200,7 @@ class TestTryUploadPageElements:
     def test_upload_form_elements(self, page):
         try_upload_page = TryUploadPage(page)
         try_upload_page.navigate_to_try_upload()
-        try_upload_page.wait_for_network_idle()
+        try_upload_page.wait_for_network_idle(step="navigate_to_try_upload_form")
 
         with allure.step("Check upload form elements"):
             try_upload_page.check_upload_form_elements()
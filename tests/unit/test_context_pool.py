@@ -0,0 +1,114 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import allure
+import pytest
+from playwright.sync_api import sync_playwright
+
+from fixtures.context_pool import BackgroundCall, ContextPool
+
+
+class FakeContext:
+    def __init__(self, number: int):
+        self.number = number
+        self.pages = 0
+        self.closed = False
+
+    def new_page(self):
+        self.pages += 1
+
+    def close(self):
+        self.closed = True
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """GET /<seconds> answers after the given delay"""
+
+    def do_GET(self):
+        time.sleep(float(self.path.strip("/") or 0))
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def slow_server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Context Pool")
+@allure.title("Context Pool - Bookkeeping")
+class TestContextPool:
+
+    @allure.title("Test pool hands out contexts in creation order and keeps size contexts warming up")
+    def test_acquire_refills(self):
+        created = []
+        pool = ContextPool(lambda: created.append(FakeContext(len(created))) or created[-1], size=2)
+        pool.fill()
+
+        first = pool.acquire()
+        second = pool.acquire()
+
+        assert (first.number, second.number) == (0, 1), "Contexts should be taken in creation order"
+        assert first.pages == 1, "Pooled context should come with an open page"
+        assert len(pool.warming) == 2, "Pool should start warming up a replacement for every taken context"
+
+    @allure.title("Test released and never taken contexts are closed")
+    def test_release_and_close(self):
+        pool = ContextPool(lambda: FakeContext(0), size=1)
+        pool.fill()
+
+        used = pool.acquire()
+        pool.release(used)
+        pool.close()
+
+        assert used.closed, "Released context should be closed"
+        assert not pool.warming, "Pool should not keep contexts after close"
+
+    @allure.title("Test failed warm-up surfaces in acquire")
+    def test_warm_up_error(self):
+        def factory():
+            raise RuntimeError("browser is gone")
+
+        pool = ContextPool(factory, size=1)
+        pool.fill()
+
+        with pytest.raises(RuntimeError, match="browser is gone"):
+            pool.acquire()
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Context Pool")
+@allure.title("Context Pool - Background Warm-up")
+class TestBackgroundCall:
+
+    @allure.title("Test background call advances while the test thread waits for Playwright")
+    def test_overlaps_with_playwright_wait(self, slow_server_url):
+        with sync_playwright() as playwright:
+            request_context = playwright.request.new_context()
+            request_context.get(f"{slow_server_url}/0")
+
+            def warm_up():
+                background_context = playwright.request.new_context()
+                background_context.get(f"{slow_server_url}/1")
+                return background_context
+
+            started_at = time.monotonic()
+            call = BackgroundCall(warm_up)
+
+            # Test body waiting for the browser longer than the warm-up takes
+            request_context.get(f"{slow_server_url}/1.5")
+
+            assert call.done, "Warm-up should finish while the test waits for Playwright"
+            call.result().dispose()
+            assert time.monotonic() - started_at < 2.4, "Warm-up should overlap the wait instead of following it"
+
+            request_context.dispose()
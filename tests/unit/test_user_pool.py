@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+from fixtures import user_pool
+from fixtures.user_pool import is_user_pool_enabled
+
+
+def _config(numprocesses=None, workerinput=None):
+    config = SimpleNamespace(option=SimpleNamespace(numprocesses=numprocesses))
+    if workerinput is not None:
+        config.workerinput = workerinput
+
+    return config
+
+
+@allure.epic("Infrastructure")
+@allure.feature("User Pool")
+@allure.title("User Pool - Enabled Decision")
+class TestUserPoolEnabled:
+
+    @pytest.fixture(autouse=True)
+    def _auto_pool(self, monkeypatch):
+        monkeypatch.setenv("USER_POOL", "auto")
+        monkeypatch.delenv("PYTEST_XDIST_WORKER_COUNT", raising=False)
+        monkeypatch.setattr(user_pool, "AUTH_VIA_API", True)
+
+    @allure.title("Test xdist worker leases users provisioned by the controller")
+    def test_enabled_on_worker_from_workerinput(self):
+        # xdist sets numprocesses=None on workers, the worker count comes in workerinput
+        config = _config(numprocesses=None, workerinput={"workerid": "gw0", "workercount": 4})
+        assert is_user_pool_enabled(config), "Pool should be enabled on a worker of a 4-worker run"
+
+    @allure.title("Test worker count is read from PYTEST_XDIST_WORKER_COUNT")
+    def test_enabled_on_worker_from_env(self, monkeypatch):
+        monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "2")
+        assert is_user_pool_enabled(_config(numprocesses=None)), "Pool should be enabled for 2 workers"
+
+    @allure.title("Test pool stays disabled for a single worker")
+    def test_disabled_for_single_worker(self):
+        config = _config(numprocesses=None, workerinput={"workerid": "gw0", "workercount": 1})
+        assert not is_user_pool_enabled(config), "Pool should be disabled for a single worker"
+
+    @allure.title("Test controller decides from -n")
+    @pytest.mark.parametrize("numprocesses, expected", [(4, True), (1, False), (None, False)])
+    def test_controller_decision(self, numprocesses, expected):
+        assert is_user_pool_enabled(_config(numprocesses=numprocesses)) is expected
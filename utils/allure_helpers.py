@@ -14,6 +14,11 @@ import json
 import allure
 from playwright.sync_api import Locator, Page
 
+from utils.attachment_store import attach_content
+from utils.screenshot_buffer import buffer_screenshot, is_screenshot_buffer_enabled
+from utils.screenshot_policy import capture_screenshot, should_capture_step
+from utils.snapshot_manifest import get_snapshot_manifest
+
 
 def _get_device_suffix() -> str:
     """Get device suffix for snapshot naming based on DEVICE env var."""
@@ -37,18 +42,31 @@ def attach_screenshot(page: Page, name: str = "Screenshot", full_page: bool = Tr
     This function attaches screenshot to the current active Allure step.
     Should be called within 'with allure.step(...)' context to attach to that step.
 
+    Whether and how the screenshot is taken is decided by the screenshot policy
+    (SCREENSHOT_* env variables or `screenshots` marker, see utils/screenshot_policy.py).
+    With SCREENSHOT_BUFFER enabled it is attached only if the test fails.
+
     Args:
         page: Playwright Page object
         name: Name for the attachment in Allure report
         full_page: Whether to capture full page or viewport only
         timeout: Timeout for screenshot capture in milliseconds (default: 30000)
     """
+    if not should_capture_step():
+        return
+
     try:
-        screenshot_bytes = page.screenshot(full_page=full_page, timeout=timeout)
-        allure.attach(
+        screenshot_bytes, mime_type, extension = capture_screenshot(page, full_page=full_page, timeout=timeout)
+
+        if is_screenshot_buffer_enabled():
+            buffer_screenshot(screenshot_bytes, name, mime_type, extension)
+            return
+
+        attach_content(
             screenshot_bytes,
             name=name,
-            attachment_type=allure.attachment_type.PNG
+            attachment_type=mime_type,
+            extension=extension
         )
 
     except Exception as e:
@@ -62,6 +80,7 @@ def attach_element_screenshot(page_or_locator, selector_or_name=None, name="Elem
     Attach screenshot of specific element to Allure report.
     This function attaches screenshot to the current active Allure step.
     Should be called within 'with allure.step(...)' context to attach to that step.
+    With SCREENSHOT_BUFFER enabled it is attached only if the test fails.
 
     Args:
         page_or_locator: Playwright Page object or Locator object
@@ -83,7 +102,12 @@ def attach_element_screenshot(page_or_locator, selector_or_name=None, name="Elem
 
         if element.count() > 0:
             screenshot_bytes = element.screenshot()
-            allure.attach(
+
+            if is_screenshot_buffer_enabled():
+                buffer_screenshot(screenshot_bytes, name)
+                return
+
+            attach_content(
                 screenshot_bytes,
                 name=name,
                 attachment_type=allure.attachment_type.PNG
@@ -114,7 +138,7 @@ def attach_html(page: Page, name: str = "Page HTML") -> None:
     """
     try:
         html_content = page.content()
-        allure.attach(
+        attach_content(
             html_content,
             name=name,
             attachment_type=allure.attachment_type.HTML
@@ -199,7 +223,7 @@ def attach_file(file_path: Path, name: Optional[str] = None) -> None:
         elif file_path.suffix.lower() == ".xml":
             attachment_type = allure.attachment_type.XML
 
-        allure.attach(
+        attach_content(
             file_content,
             name=name or file_path.name,
             attachment_type=attachment_type
@@ -246,7 +270,7 @@ def _attach_file_to_allure(file_path: Path, attachment_name: str) -> bool:
 
     try:
         with open(file_path, "rb") as f:
-            allure.attach(
+            attach_content(
                 f.read(),
                 name=attachment_name,
                 attachment_type=allure.attachment_type.PNG
@@ -261,6 +285,13 @@ def _find_expected_snapshot(snapshots_dir: Path, module_name: str, snapshot_name
     """Find expected snapshot file in references directory."""
     clean_module = _clean_module_name(module_name)
 
+    # Manifest index: snapshot name ({browser}-{viewport}-{title}.png) or test name lookup without probing
+    browser = os.getenv("BROWSER", "chromium").strip().lower()
+    viewport = os.getenv("DEVICE", "desktop").strip().lower() or "desktop"
+    expected_file = get_snapshot_manifest(snapshots_dir).find(clean_module, snapshot_name, prefix=f"{browser}-{viewport}-")
+    if expected_file:
+        return expected_file
+
     # Remove .png extension and device suffix from snapshot_name to get directory name
     snapshot_base_name = snapshot_name.replace('.png', '')
 
@@ -366,8 +397,8 @@ def attach_visual_snapshot_comparison(
         # Find the test failure directory
         failure_dir = _find_visual_failure_directory(visual_failures_dir, test_name)
         if failure_dir:
-            # Look for diff file in the failure directory
-            diff_files = list(failure_dir.glob("diff_*.png"))
+            # Look for diff file in the failure directory, the one of this snapshot first
+            diff_files = list(failure_dir.glob(f"diff_{snapshot_name}")) or list(failure_dir.glob("diff_*.png"))
             
             if diff_files:
                 _attach_file_to_allure(diff_files[0], "Visual Diff (Pixel Differences)")
@@ -0,0 +1,115 @@
+"""
+Content-addressed Allure attachments.
+
+Attachment files are named after SHA-256 of their content ({hash}-attachment.{ext}), so the same
+screenshot, HTML dump or reference snapshot attached by many tests (and xdist workers) is written
+into allure-results once and referenced from every result. Disable with ATTACHMENT_DEDUP=false.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+import allure
+import allure_commons
+from allure_commons.logger import AllureFileLogger
+from allure_commons.reporter import AllureReporter
+
+
+def is_attachment_dedup_enabled() -> bool:
+    return os.getenv("ATTACHMENT_DEDUP", "true").lower() == "true"
+
+
+def _get_allure_reporter() -> AllureReporter | None:
+    for plugin in allure_commons.plugin_manager.get_plugins():
+        reporter = getattr(plugin, "allure_logger", None)
+        if isinstance(reporter, AllureReporter):
+            return reporter
+
+    return None
+
+
+def _get_results_dir() -> Path | None:
+    for plugin in allure_commons.plugin_manager.get_plugins():
+        if isinstance(plugin, AllureFileLogger):
+            return plugin._report_dir
+
+    return None
+
+
+class AttachmentStore:
+    """Registers attachments under content hash and writes each unique content once"""
+
+    def __init__(self):
+        self.stored = set()
+        self._reset_stats()
+
+    def _reset_stats(self) -> None:
+        self.attachments = 0
+        self.duplicates = 0
+        self.bytes_saved = 0
+
+    def _register(self, content_hash: str, name: str, attachment_type, extension: str | None) -> tuple[str, bool]:
+        """Add attachment to current step, returns its file name and whether content is already stored"""
+        reporter = _get_allure_reporter()
+        file_name = reporter._attach(content_hash, name=name, attachment_type=attachment_type, extension=extension)
+
+        results_dir = _get_results_dir()
+        is_stored = file_name in self.stored or bool(results_dir and (results_dir / file_name).exists())
+        self.stored.add(file_name)
+        self.attachments += 1
+
+        return file_name, is_stored
+
+    def attach(self, body: bytes | str, name: str, attachment_type, extension: str | None = None) -> None:
+        data = body.encode("utf-8") if isinstance(body, str) else body
+        file_name, is_stored = self._register(hashlib.sha256(data).hexdigest(), name, attachment_type, extension)
+
+        if is_stored:
+            self.duplicates += 1
+            self.bytes_saved += len(data)
+            return
+
+        allure_commons.plugin_manager.hook.report_attached_data(body=data, file_name=file_name)
+
+    def attach_file(self, source: Path, name: str, attachment_type, extension: str | None = None) -> None:
+        data = Path(source).read_bytes()
+        file_name, is_stored = self._register(hashlib.sha256(data).hexdigest(), name, attachment_type, extension)
+
+        if is_stored:
+            self.duplicates += 1
+            self.bytes_saved += len(data)
+            return
+
+        allure_commons.plugin_manager.hook.report_attached_file(source=str(source), file_name=file_name)
+
+    def pop_stats(self) -> dict:
+        stats = {"attachments": self.attachments, "duplicates": self.duplicates, "bytes_saved": self.bytes_saved}
+        self._reset_stats()
+        return stats
+
+
+_store = AttachmentStore()
+
+
+def attach_content(body: bytes | str, name: str, attachment_type, extension: str | None = None) -> None:
+    """allure.attach storing identical content once"""
+    if not is_attachment_dedup_enabled() or not _get_allure_reporter():
+        allure.attach(body, name=name, attachment_type=attachment_type, extension=extension)
+        return
+
+    _store.attach(body, name, attachment_type, extension)
+
+
+def attach_content_file(source: Path | str, name: str, attachment_type, extension: str | None = None) -> None:
+    """allure.attach.file storing identical files once"""
+    if not is_attachment_dedup_enabled() or not _get_allure_reporter():
+        allure.attach.file(str(source), name=name, attachment_type=attachment_type, extension=extension)
+        return
+
+    _store.attach_file(Path(source), name, attachment_type, extension)
+
+
+def pop_dedup_stats() -> dict:
+    """Deduplication stats since the previous call"""
+    return _store.pop_stats()
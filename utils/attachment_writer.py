@@ -0,0 +1,195 @@
+"""
+Background writer for Allure attachments and failure artifacts.
+
+allure-pytest writes every attachment into alluredir on the test thread. With ATTACHMENT_WRITER
+enabled its file logger is replaced for the session by one that hands attachment files to worker
+threads. Attachments stay in the same steps - only the disk writes move off the test thread.
+
+    ATTACHMENT_WRITER          true (default) | false
+    ATTACHMENT_WRITER_THREADS  worker threads (default 2)
+    ATTACHMENT_QUEUE_SIZE      queued files before test thread waits for workers (default 100)
+"""
+
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+import allure_commons
+from allure_commons import hookimpl
+from allure_commons.logger import AllureFileLogger
+
+
+def is_attachment_writer_enabled() -> bool:
+    return os.getenv("ATTACHMENT_WRITER", "true").lower() == "true"
+
+
+class AttachmentWriter:
+    """Bounded queue of file writes drained by worker threads"""
+
+    def __init__(self, threads: int, queue_size: int):
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.threads = [
+            threading.Thread(target=self._work, name=f"attachment-writer-{i}", daemon=True)
+            for i in range(threads)
+        ]
+        self.written = 0
+        self.written_bytes = 0
+        self.failed = 0
+        self.blocked_time = 0.0
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        for thread in self.threads:
+            thread.start()
+
+    def _submit(self, job: Callable[[], int]) -> None:
+        try:
+            self.queue.put_nowait(job)
+
+        except queue.Full:
+            # Back-pressure: test thread waits for a free slot instead of growing memory
+            started_at = time.monotonic()
+            self.queue.put(job)
+            self.blocked_time += time.monotonic() - started_at
+
+    def _work(self) -> None:
+        while True:
+            job = self.queue.get()
+
+            try:
+                if job is None:
+                    return
+
+                size = job()
+                with self._lock:
+                    self.written += 1
+                    self.written_bytes += size
+
+            except Exception as e:
+                with self._lock:
+                    self.failed += 1
+                logging.warning(f"Failed to write attachment: {e}")
+
+            finally:
+                self.queue.task_done()
+
+    def write_bytes(self, destination: Path, body: bytes | str) -> None:
+        def job():
+            data = body.encode("utf-8") if isinstance(body, str) else body
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            destination.write_bytes(data)
+            return len(data)
+
+        self._submit(job)
+
+    def copy_file(self, source: str | Path, destination: Path) -> None:
+        def job():
+            shutil.copy2(source, destination)
+            return destination.stat().st_size
+
+        self._submit(job)
+
+    def drain(self) -> None:
+        self.queue.join()
+
+    def stop(self) -> None:
+        self.drain()
+
+        for _ in self.threads:
+            self.queue.put(None)
+
+        for thread in self.threads:
+            thread.join()
+
+    def get_stats(self) -> dict:
+        return {
+            "written": self.written,
+            "written_bytes": self.written_bytes,
+            "failed": self.failed,
+            "blocked_time": self.blocked_time,
+        }
+
+
+class BackgroundAllureFileLogger(AllureFileLogger):
+    """Allure file logger writing results synchronously and attachments through AttachmentWriter"""
+
+    def __init__(self, file_logger: AllureFileLogger, writer: AttachmentWriter):
+        # Reuse directory of the replaced logger, it was already created and cleaned
+        self._report_dir = file_logger._report_dir
+        self.writer = writer
+
+    @hookimpl
+    def report_attached_file(self, source, file_name):
+        self.writer.copy_file(source, self._report_dir / file_name)
+
+    @hookimpl
+    def report_attached_data(self, body, file_name):
+        self.writer.write_bytes(self._report_dir / file_name, body)
+
+
+_writer: AttachmentWriter | None = None
+_replaced_loggers: list[tuple[AllureFileLogger, BackgroundAllureFileLogger]] = []
+
+
+def start_attachment_writer() -> AttachmentWriter | None:
+    """Replace Allure file loggers with background ones (no-op without --alluredir or when disabled)"""
+    global _writer
+
+    if not is_attachment_writer_enabled() or _writer:
+        return _writer
+
+    file_loggers = [
+        plugin for plugin in allure_commons.plugin_manager.get_plugins()
+        if type(plugin) is AllureFileLogger
+    ]
+    if not file_loggers:
+        return None
+
+    _writer = AttachmentWriter(
+        threads=int(os.getenv("ATTACHMENT_WRITER_THREADS", "2")),
+        queue_size=int(os.getenv("ATTACHMENT_QUEUE_SIZE", "100")),
+    )
+    _writer.start()
+
+    for file_logger in file_loggers:
+        background_logger = BackgroundAllureFileLogger(file_logger, _writer)
+        allure_commons.plugin_manager.unregister(plugin=file_logger)
+        allure_commons.plugin_manager.register(background_logger)
+        _replaced_loggers.append((file_logger, background_logger))
+
+    return _writer
+
+
+def stop_attachment_writer() -> dict | None:
+    """Write all queued attachments and restore original Allure file loggers, returns writer stats"""
+    global _writer
+
+    if not _writer:
+        return None
+
+    _writer.stop()
+
+    # allure-pytest unregisters its own logger on config cleanup - it must be registered again
+    for file_logger, background_logger in _replaced_loggers:
+        allure_commons.plugin_manager.unregister(plugin=background_logger)
+        allure_commons.plugin_manager.register(file_logger)
+
+    _replaced_loggers.clear()
+    stats = _writer.get_stats()
+    _writer = None
+
+    return stats
+
+
+def write_artifact(path: Path, body: bytes | str) -> None:
+    """Write artifact file in background when writer is running, otherwise synchronously"""
+    if _writer:
+        _writer.write_bytes(path, body)
+        return
+
+    path.write_bytes(body.encode("utf-8") if isinstance(body, str) else body)
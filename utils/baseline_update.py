@@ -0,0 +1,93 @@
+"""
+Reference snapshot updates (--update-snapshots with the NumPy engine).
+
+References are written to a temp file in the same directory and renamed over the old one, so xdist
+workers and browser runs updating references at the same time never leave a half-written PNG.
+Captures identical to the reference (same SHA-256) are not rewritten. Every run saves its updates
+into reports/baseline-updates-{browser}-{device}.json, combined summary of parallel runs:
+
+    python -m utils.baseline_update reports
+"""
+
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from utils.snapshot_manifest import content_hash
+
+SUMMARY_FILE_PATTERN = "baseline-updates-*.json"
+
+
+@dataclass
+class BaselineUpdate:
+    path: str
+    status: str  # created | changed | unchanged
+    old_hash: str | None
+    new_hash: str
+
+
+def write_reference(path: Path, data: bytes) -> BaselineUpdate:
+    """Atomically replace reference file unless its content is the same"""
+    new_hash = content_hash(data)
+    old_hash = content_hash(path.read_bytes()) if path.exists() else None
+
+    if old_hash == new_hash:
+        return BaselineUpdate(str(path), "unchanged", old_hash, new_hash)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_file.write_bytes(data)
+    os.replace(tmp_file, path)
+
+    return BaselineUpdate(str(path), "changed" if old_hash else "created", old_hash, new_hash)
+
+
+_updates: list[BaselineUpdate] = []
+
+
+def record_baseline_update(update: BaselineUpdate) -> None:
+    _updates.append(update)
+
+
+def pop_baseline_updates() -> list[dict]:
+    """Updates recorded since the previous call (one test)"""
+    updates = [asdict(update) for update in _updates]
+    _updates.clear()
+    return updates
+
+
+def format_summary(updates: list[dict]) -> list[str]:
+    """Counts by status and one line per created or changed reference"""
+    counts = {status: sum(1 for update in updates if update["status"] == status) for status in ("changed", "created", "unchanged")}
+    lines = [", ".join(f"{status}: {count}" for status, count in counts.items())]
+
+    for update in sorted(updates, key=lambda update: update["path"]):
+        if update["status"] == "changed":
+            lines.append(f"changed  {update['path']}  {update['old_hash'][:12]} -> {update['new_hash'][:12]}")
+        elif update["status"] == "created":
+            lines.append(f"created  {update['path']}  {update['new_hash'][:12]}")
+
+    return lines
+
+
+def save_summary(reports_dir: Path, run_name: str, updates: list[dict]) -> Path:
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    summary_file = reports_dir / SUMMARY_FILE_PATTERN.replace("*", run_name)
+    summary_file.write_text(json.dumps(updates, indent=2), encoding="utf-8")
+    return summary_file
+
+
+def print_combined_summary(reports_dir: Path) -> None:
+    """Summary of all runs that saved updates into reports dir"""
+    updates = []
+    for summary_file in sorted(reports_dir.glob(SUMMARY_FILE_PATTERN)):
+        updates.extend(json.loads(summary_file.read_text(encoding="utf-8")))
+
+    for line in format_summary(updates):
+        print(line)
+
+
+if __name__ == "__main__":
+    print_combined_summary(Path(sys.argv[1] if len(sys.argv) > 1 else "reports"))
@@ -0,0 +1,217 @@
+"""
+Breadth-first crawl of the catalog tree: brands -> engines -> ECUs -> stock lists -> stock cards.
+
+Every catalog page is read with one evaluation (AsyncCatalogPage.read_level) that returns its
+child catalog paths and stock items, so no page is queried link by link. Each path is visited
+once, pages of a level are fetched by `concurrency` pages of one async context. Progress is
+checkpointed into CATALOG_CRAWL_CHECKPOINT, an interrupted run resumes from the pending paths
+instead of starting from the catalog root again (CATALOG_CRAWL_RESUME=false starts fresh).
+Checkpoints older than CATALOG_CRAWL_CHECKPOINT_MAX_AGE_HOURS (default 6) are ignored, so a run
+crashed last night is not merged into today's results.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+from pathlib import Path
+
+from playwright.async_api import BrowserContext
+
+from config.auth_config import BASE_URL
+from pages.async_catalog_page import AsyncCatalogPage
+
+CHECKPOINT_FILE = Path(os.getenv("CATALOG_CRAWL_CHECKPOINT", "reports/categories/catalog_crawl_checkpoint.json"))
+CHECKPOINT_EVERY = 50  # fetched pages between checkpoints inside one level
+CHECKPOINT_MAX_AGE = float(os.getenv("CATALOG_CRAWL_CHECKPOINT_MAX_AGE_HOURS", "6")) * 3600
+
+
+def is_resume_enabled() -> bool:
+    return os.getenv("CATALOG_CRAWL_RESUME", "true").lower() not in ("false", "0", "no")
+
+
+class CatalogCrawler:
+    """
+    Crawls catalog from root paths, results have the shape of the old sequential flow:
+    success (stock cards with product card), broken_pages (URLs of error pages) and
+    no_content (pages without links or stocks), plus failed ("label: error" of fetches that raised).
+
+    Task is {"path": catalog path} for a page read or {"path": stock list path, "stock": index}
+    for a stock item without link, which can only be opened by clicking it.
+
+    Usage:
+        crawler = CatalogCrawler(async_context, ["/catalog/car"], concurrency=4)
+        results = async_loop.run(crawler.run())
+    """
+
+    def __init__(
+        self,
+        context: BrowserContext,
+        roots: list[str],
+        concurrency: int = 4,
+        max_stocks: int | None = None,
+        checkpoint_file: Path = CHECKPOINT_FILE,
+    ):
+        self.context = context
+        self.roots = roots
+        self.concurrency = max(concurrency, 1)
+        self.max_stocks = max_stocks
+        self.checkpoint_file = checkpoint_file
+
+        self.visited: set[str] = set()
+        self.results = {"success": [], "broken_pages": [], "no_content": [], "failed": []}
+        self._remaining: dict[str, dict] = {}  # tasks of the current level not finished yet
+        self._next_level: list[dict] = []
+        self._fetched = 0
+
+    @staticmethod
+    def _key(task: dict) -> str:
+        return task["path"] if task.get("stock") is None else f"{task['path']}#stock-{task['stock']}"
+
+    @staticmethod
+    def _label(task: dict) -> str:
+        return task["path"] if task.get("stock") is None else f"{task['path']} -> Stock {task['stock'] + 1}"
+
+    def _enqueue(self, task: dict) -> None:
+        key = self._key(task)
+        if key not in self.visited:
+            self.visited.add(key)
+            self._next_level.append(task)
+
+    def _load_checkpoint(self) -> list[dict] | None:
+        """Pending tasks of an interrupted crawl of the same site and roots"""
+        if not is_resume_enabled():
+            return None
+
+        try:
+            state = json.loads(self.checkpoint_file.read_text(encoding="utf-8"))
+
+        except (OSError, ValueError):
+            return None
+
+        if state.get("base_url") != BASE_URL or state.get("roots") != self.roots or not state.get("pending"):
+            return None
+
+        age = time.time() - state.get("saved_at", 0)
+        if age > CHECKPOINT_MAX_AGE:
+            logging.info(f"Ignoring catalog crawl checkpoint saved {age / 3600:.1f}h ago")
+            return None
+
+        self.visited = set(state["visited"])
+        self.results = state["results"]
+        # Checkpoints saved before failures had their own list
+        self.results.setdefault("failed", [])
+        logging.info(f"Resuming catalog crawl: {len(state['pending'])} pending, {len(self.visited)} visited")
+        return state["pending"]
+
+    def _save_checkpoint(self) -> None:
+        state = {
+            "saved_at": time.time(),
+            "base_url": BASE_URL,
+            "roots": self.roots,
+            "visited": sorted(self.visited),
+            "pending": list(self._remaining.values()) + self._next_level,
+            "results": self.results,
+        }
+
+        try:
+            self.checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.checkpoint_file.with_suffix(".tmp")
+            tmp_file.write_text(json.dumps(state), encoding="utf-8")
+            tmp_file.replace(self.checkpoint_file)
+
+        except OSError as e:
+            logging.warning(f"Failed to save catalog crawl checkpoint {self.checkpoint_file}: {e}")
+
+    async def _read_page(self, catalog_page: AsyncCatalogPage, path: str) -> None:
+        level = await catalog_page.read_level(path)
+
+        if catalog_page.is_error_title(level["title"]):
+            self.results["broken_pages"].append(f"{BASE_URL}{path}")
+            return
+
+        if level["hasProductCard"]:
+            self.results["success"].append(path)
+            return
+
+        stocks = level["stocks"][:self.max_stocks] if self.max_stocks else level["stocks"]
+        if not level["children"] and not stocks:
+            self.results["no_content"].append(f"{path}: no catalog links or stocks")
+            return
+
+        for index, stock_path in enumerate(stocks):
+            self._enqueue({"path": stock_path} if stock_path else {"path": path, "stock": index})
+
+        for child_path in level["children"]:
+            self._enqueue({"path": child_path})
+
+    async def _open_stock(self, catalog_page: AsyncCatalogPage, path: str, index: int) -> None:
+        card = await catalog_page.open_stock_card(path, index)
+        label = f"{path} -> Stock {index + 1}"
+        self.visited.add(card["path"])
+
+        if catalog_page.is_error_title(card["title"]):
+            self.results["broken_pages"].append(f"{BASE_URL}{card['path']}")
+
+        elif card["hasProductCard"]:
+            self.results["success"].append(label)
+
+        else:
+            self.results["no_content"].append(f"{label}: no product card")
+
+    async def _fetch(self, catalog_page: AsyncCatalogPage, task: dict) -> None:
+        try:
+            if task.get("stock") is None:
+                await self._read_page(catalog_page, task["path"])
+            else:
+                await self._open_stock(catalog_page, task["path"], task["stock"])
+
+        except Exception as e:
+            logging.warning(f"Failed to crawl {self._label(task)} (continuing): {e}")
+            self.results["failed"].append(f"{self._label(task)}: {e}")
+
+        finally:
+            self._remaining.pop(self._key(task), None)
+            self._fetched += 1
+            if self._fetched % CHECKPOINT_EVERY == 0:
+                self._save_checkpoint()
+
+    async def _fetch_level(self, pages: list[AsyncCatalogPage], level: list[dict]) -> None:
+        tasks = deque(level)
+        self._remaining = {self._key(task): task for task in level}
+
+        async def worker(catalog_page: AsyncCatalogPage):
+            while tasks:
+                await self._fetch(catalog_page, tasks.popleft())
+
+        await asyncio.gather(*(worker(catalog_page) for catalog_page in pages))
+
+    async def run(self) -> dict:
+        """Crawl level by level until no new paths are found, returns results"""
+        level = self._load_checkpoint()
+        if level is None:
+            level = [{"path": root} for root in self.roots]
+            self.visited = {self._key(task) for task in level}
+
+        pages = [AsyncCatalogPage(await self.context.new_page()) for _ in range(self.concurrency)]
+        depth = 0
+
+        try:
+            while level:
+                logging.info(f"Catalog crawl level {depth}: {len(level)} pages, {len(self.visited)} visited")
+                self._next_level = []
+                await self._fetch_level(pages, level)
+
+                level = self._next_level
+                self._save_checkpoint()
+                depth += 1
+
+        finally:
+            for catalog_page in pages:
+                await catalog_page.close()
+
+        # Finished crawl leaves nothing to resume
+        self.checkpoint_file.unlink(missing_ok=True)
+        return self.results
@@ -0,0 +1,265 @@
+"""
+HAR record-and-replay for read-only pages (catalog, home, pricing, contacts).
+
+HAR_MODE=record captures GET traffic of each page object navigation into `{HAR_DIR}/{key}.har`,
+HAR_MODE=replay serves it back with route_from_har. Mutating requests (non-GET methods and
+HAR_PASS_THROUGH URL patterns) always go to the network. Async pages use the *_async counterparts.
+"""
+
+import base64
+import json
+import logging
+import os
+import re
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from playwright.async_api import Page as AsyncPage
+from playwright.async_api import Route as AsyncRoute
+from playwright.sync_api import Page, Request, Route
+
+from utils.request_blocker import get_request_blocker
+
+HAR_MODE = os.getenv("HAR_MODE", "off").lower()
+HAR_DIR = Path(os.getenv("HAR_DIR", "har"))
+HAR_MAX_AGE_HOURS = float(os.getenv("HAR_MAX_AGE_HOURS", "168"))
+
+# What to do with missing or stale HAR in replay mode: "record" it again or use "network"
+HAR_STALE_POLICY = os.getenv("HAR_STALE_POLICY", "record").lower()
+
+# Fail requests missing in HAR instead of sending them to the network
+HAR_OFFLINE = os.getenv("HAR_OFFLINE", "false").lower() == "true"
+
+PASS_THROUGH_PATTERNS = [
+    pattern.strip()
+    for pattern in os.getenv("HAR_PASS_THROUGH", "/api-v1/auth/,/api-v1/upload,/api-v1/order").split(",")
+    if pattern.strip()
+]
+
+
+def _har_path(key: str) -> Path:
+    return HAR_DIR / f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', key).strip('_')}.har"
+
+
+def _is_pass_through(url: str, method: str) -> bool:
+    return method != "GET" or any(pattern in url for pattern in PASS_THROUGH_PATTERNS)
+
+
+def _is_blocked(request: Request) -> bool:
+    """Request the context-level blocker (BLOCK_REQUESTS=true) would abort or stub in this test"""
+    request_blocker = get_request_blocker()
+    return bool(request_blocker and request_blocker.active and request_blocker.should_block(request))
+
+
+def _is_stale(har_path: Path) -> bool:
+    if not har_path.exists():
+        return True
+
+    age_hours = (time.time() - har_path.stat().st_mtime) / 3600
+    return age_hours > HAR_MAX_AGE_HOURS
+
+
+class HarRecorder:
+    """Page route that fetches GET requests from the network and keeps them as HAR entries"""
+
+    def __init__(self, har_path: Path):
+        self.har_path = har_path
+        self.entries = []
+
+    @staticmethod
+    def _should_fall_back(request: Request) -> bool:
+        # Page routes run before context routes - blocked requests fall back to the request blocker
+        # so the recording has only what a blocked run loads
+        return _is_pass_through(request.url, request.method) or _is_blocked(request)
+
+    def _add_entry(self, request: Request, response, body: bytes, started_at: datetime) -> None:
+        elapsed_ms = (datetime.now(timezone.utc) - started_at).total_seconds() * 1000
+
+        self.entries.append({
+            "startedDateTime": started_at.isoformat(),
+            "time": elapsed_ms,
+            "request": {
+                "method": request.method,
+                "url": request.url,
+                "httpVersion": "HTTP/1.1",
+                "headers": [],
+                "queryString": [],
+                "cookies": [],
+                "headersSize": -1,
+                "bodySize": 0,
+            },
+            "response": {
+                "status": response.status,
+                "statusText": response.status_text,
+                "httpVersion": "HTTP/1.1",
+                "headers": [{"name": name, "value": value} for name, value in response.headers.items()],
+                "cookies": [],
+                "content": {
+                    "size": len(body),
+                    "mimeType": response.headers.get("content-type", "application/octet-stream"),
+                    "text": base64.b64encode(body).decode(),
+                    "encoding": "base64",
+                },
+                "redirectURL": response.headers.get("location", ""),
+                "headersSize": -1,
+                "bodySize": len(body),
+            },
+            "cache": {},
+            "timings": {"send": 0, "wait": elapsed_ms, "receive": 0},
+        })
+
+    def handle(self, route: Route) -> None:
+        if self._should_fall_back(route.request):
+            route.fallback()
+            return
+
+        started_at = datetime.now(timezone.utc)
+        response = route.fetch()
+        body = response.body()
+        self._add_entry(route.request, response, body, started_at)
+
+        route.fulfill(response=response, body=body)
+
+    async def handle_async(self, route: AsyncRoute) -> None:
+        """Same as handle for pages of the async fixtures"""
+        if self._should_fall_back(route.request):
+            await route.fallback()
+            return
+
+        started_at = datetime.now(timezone.utc)
+        response = await route.fetch()
+        body = await response.body()
+        self._add_entry(route.request, response, body, started_at)
+
+        await route.fulfill(response=response, body=body)
+
+    def save(self) -> None:
+        if not self.entries:
+            return
+
+        self.har_path.parent.mkdir(parents=True, exist_ok=True)
+        har = {"log": {"version": "1.2", "creator": {"name": "har_cache", "version": "1.0"}, "entries": self.entries}}
+
+        tmp_file = self.har_path.with_suffix(".tmp")
+        tmp_file.write_text(json.dumps(har), encoding="utf-8")
+        tmp_file.replace(self.har_path)
+        logging.info(f"Recorded {len(self.entries)} requests into {self.har_path}")
+
+
+def _plan_har(key: str) -> tuple[Path, bool] | None:
+    """HAR path and whether to record it (replay otherwise), None to use the network"""
+    if HAR_MODE not in ("record", "replay"):
+        return None
+
+    har_path = _har_path(key)
+    record = HAR_MODE == "record"
+
+    if HAR_MODE == "replay" and _is_stale(har_path):
+        if HAR_STALE_POLICY != "record":
+            logging.info(f"HAR {har_path} is missing or stale, using network")
+            return None
+
+        logging.info(f"HAR {har_path} is missing or stale, recording it again")
+        record = True
+
+    return har_path, record
+
+
+def _replay_url_filter():
+    # Everything except pass-through URLs is served from HAR
+    pass_through = "|".join(re.escape(pattern) for pattern in PASS_THROUGH_PATTERNS)
+    return re.compile(f"^(?!.*({pass_through})).*") if pass_through else "**/*"
+
+
+def use_har(page: Page, key: str) -> None:
+    """Record or replay HAR for the next navigation of the page (no-op unless HAR_MODE is set)"""
+    if HAR_MODE not in ("record", "replay"):
+        return
+
+    # One HAR per page at a time - previous recording is saved, previous replay removed
+    stop_har(page)
+
+    plan = _plan_har(key)
+    if not plan:
+        return
+
+    har_path, record = plan
+    if record:
+        recorder = HarRecorder(har_path)
+        page.route("**/*", recorder.handle)
+        page._har_recorder = recorder
+        return
+
+    url_filter = _replay_url_filter()
+    page.route_from_har(har_path, url=url_filter, not_found="abort" if HAR_OFFLINE else "fallback")
+    page._har_url_filter = url_filter
+
+
+async def use_har_async(page: AsyncPage, key: str) -> None:
+    """Same as use_har for pages of the async fixtures"""
+    if HAR_MODE not in ("record", "replay"):
+        return
+
+    await stop_har_async(page)
+
+    plan = _plan_har(key)
+    if not plan:
+        return
+
+    har_path, record = plan
+    if record:
+        recorder = HarRecorder(har_path)
+        await page.route("**/*", recorder.handle_async)
+        page._har_recorder = recorder
+        return
+
+    url_filter = _replay_url_filter()
+    await page.route_from_har(har_path, url=url_filter, not_found="abort" if HAR_OFFLINE else "fallback")
+    page._har_url_filter = url_filter
+
+
+def stop_har(page: Page) -> None:
+    """Save current recording and remove HAR routes from the page (routes set up by the test stay)"""
+    recorder = getattr(page, "_har_recorder", None)
+    url_filter = getattr(page, "_har_url_filter", None)
+    if not recorder and url_filter is None:
+        return
+
+    try:
+        if recorder:
+            page.unroute("**/*", recorder.handle)
+        else:
+            page.unroute(url_filter)
+
+    except Exception as e:
+        logging.debug(f"Failed to remove HAR routes: {e}")
+
+    if recorder:
+        recorder.save()
+
+    page._har_recorder = None
+    page._har_url_filter = None
+
+
+async def stop_har_async(page: AsyncPage) -> None:
+    """Same as stop_har for pages of the async fixtures"""
+    recorder = getattr(page, "_har_recorder", None)
+    url_filter = getattr(page, "_har_url_filter", None)
+    if not recorder and url_filter is None:
+        return
+
+    try:
+        if recorder:
+            await page.unroute("**/*", recorder.handle_async)
+        else:
+            await page.unroute(url_filter)
+
+    except Exception as e:
+        logging.debug(f"Failed to remove HAR routes: {e}")
+
+    if recorder:
+        recorder.save()
+
+    page._har_recorder = None
+    page._har_url_filter = None
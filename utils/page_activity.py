@@ -0,0 +1,190 @@
+"""In-page activity tracking: pending app requests and DOM quiescence"""
+
+import json
+import logging
+import os
+
+from playwright.async_api import Page as AsyncPage
+from playwright.sync_api import BrowserContext, Page
+
+# App requests are fetch/XHR whose URL contains one of APP_REQUEST_PATTERNS and none of
+# APP_REQUEST_IGNORE (long-polling endpoints). Third-party traffic is never counted.
+APP_REQUEST_PATTERNS = [p.strip() for p in os.getenv("APP_REQUEST_PATTERNS", "/api-v1/").split(",") if p.strip()]
+APP_REQUEST_IGNORE = [p.strip() for p in os.getenv("APP_REQUEST_IGNORE", "").split(",") if p.strip()]
+
+# Requests starting right after an action (click, file set) are caught by waiting at least this long
+APP_IDLE_QUIET_WINDOW = int(os.getenv("APP_IDLE_QUIET_WINDOW", "250"))
+
+# Counts in-flight app requests in window.__appActivity.pending
+ACTIVITY_TRACKER_SCRIPT = """
+(() => {
+    if (window.__appActivity) return;
+    const patterns = %s;
+    const ignored = %s;
+    const activity = window.__appActivity = {pending: 0, lastChangeAt: performance.now()};
+
+    const isAppRequest = url => patterns.some(p => url.includes(p)) && !ignored.some(p => url.includes(p));
+    const started = () => { activity.pending++; activity.lastChangeAt = performance.now(); };
+    const done = () => { activity.pending = Math.max(0, activity.pending - 1); activity.lastChangeAt = performance.now(); };
+
+    const originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = function (...args) {
+            const input = args[0];
+            if (!isAppRequest(String((input && input.url) || input))) return originalFetch.apply(this, args);
+            started();
+            return originalFetch.apply(this, args).finally(done);
+        };
+    }
+
+    const originalOpen = XMLHttpRequest.prototype.open;
+    XMLHttpRequest.prototype.open = function (method, url, ...rest) {
+        this.__appRequestUrl = String(url);
+        return originalOpen.call(this, method, url, ...rest);
+    };
+
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        if (isAppRequest(this.__appRequestUrl || "")) {
+            started();
+            this.addEventListener("loadend", done, {once: true});
+        }
+        return originalSend.apply(this, args);
+    };
+})();
+""" % (json.dumps(APP_REQUEST_PATTERNS), json.dumps(APP_REQUEST_IGNORE))
+
+# Resolves when no app request was in flight for quietMs (counted from the call, not from the last request)
+APP_IDLE_SCRIPT = """
+async ({quietMs, timeoutMs}) => {
+    const activity = window.__appActivity;
+    if (!activity) return {tracked: false};
+
+    const startedAt = performance.now();
+    while (true) {
+        const now = performance.now();
+        const quietSince = Math.max(activity.lastChangeAt, startedAt);
+
+        if (activity.pending === 0 && now - quietSince >= quietMs) return {tracked: true, idle: true, elapsed: now - startedAt};
+        if (now - startedAt >= timeoutMs) return {tracked: true, idle: false, elapsed: now - startedAt, pending: activity.pending};
+
+        await new Promise(resolve => setTimeout(resolve, 25));
+    }
+}
+"""
+
+# Resolves when region had no mutations, running finite animations or pending requests for quietMs
+QUIESCENCE_SCRIPT = """
+async ({selector, quietMs, timeoutMs}) => {
+    let target = document.documentElement;
+    if (selector) {
+        try {
+            target = document.querySelector(selector) || target;
+        } catch (e) {
+            // Non-CSS selector - watch the whole document
+        }
+    }
+
+    const startedAt = performance.now();
+    let lastChangeAt = startedAt;
+    const observer = new MutationObserver(() => { lastChangeAt = performance.now(); });
+    observer.observe(target, {subtree: true, childList: true, attributes: true, characterData: true});
+
+    const isAnimating = () => (document.getAnimations ? document.getAnimations() : []).some(animation => {
+        if (animation.playState !== "running") return false;
+        const timing = animation.effect && animation.effect.getTiming();
+        // Infinite animations (spinners, pulsing placeholders) never finish - ignore them
+        if (timing && timing.iterations === Infinity) return false;
+        const element = animation.effect && animation.effect.target;
+        return !element || target.contains(element);
+    });
+    const hasPendingRequests = () => window.__appActivity && window.__appActivity.pending > 0;
+
+    try {
+        while (true) {
+            const now = performance.now();
+            if (isAnimating() || hasPendingRequests()) lastChangeAt = now;
+
+            if (now - lastChangeAt >= quietMs) return {settled: true, elapsed: now - startedAt};
+            if (now - startedAt >= timeoutMs) return {settled: false, elapsed: now - startedAt};
+
+            await new Promise(resolve => setTimeout(resolve, 50));
+        }
+    } finally {
+        observer.disconnect();
+    }
+}
+"""
+
+
+def is_stability_wait_enabled() -> bool:
+    """STABILITY_WAITS=false restores fixed Animation sleeps"""
+    return os.getenv("STABILITY_WAITS", "true").lower() == "true"
+
+
+def install_activity_tracker(context: BrowserContext) -> None:
+    """Track app requests in every page of the context (applies to documents loaded afterwards)"""
+    context.add_init_script(ACTIVITY_TRACKER_SCRIPT)
+
+
+def wait_for_dom_quiescence(page: Page, selector: str | None, quiet_ms: int, timeout: int) -> dict:
+    """
+    Wait until region (whole document if selector is None) stops changing.
+
+    Returns {"settled": bool, "elapsed": ms}. Navigation during the wait ends it early -
+    the new document is then waited for with domcontentloaded.
+    """
+    try:
+        return page.evaluate(QUIESCENCE_SCRIPT, {"selector": selector, "quietMs": quiet_ms, "timeoutMs": timeout})
+
+    except Exception as e:
+        logging.debug(f"DOM quiescence wait interrupted (waiting for domcontentloaded): {e}")
+        page.wait_for_load_state("domcontentloaded", timeout=timeout)
+        return {"settled": False, "elapsed": None}
+
+
+_idle_latencies: list[dict] = []
+
+
+def wait_for_app_idle(page: Page, timeout: int, step: str) -> dict:
+    """
+    Wait until in-flight app requests drain and record how long it took for the step.
+
+    Returns {"tracked": False} if the page has no tracker (document loaded before it was installed).
+    """
+    try:
+        result = page.evaluate(APP_IDLE_SCRIPT, {"quietMs": APP_IDLE_QUIET_WINDOW, "timeoutMs": timeout})
+
+    except Exception as e:
+        # Navigation destroyed the document - let caller fall back to load states
+        logging.debug(f"App idle wait interrupted: {e}")
+        return {"tracked": False}
+
+    _record_idle_latency(result, step)
+    return result
+
+
+async def wait_for_app_idle_async(page: AsyncPage, timeout: int, step: str) -> dict:
+    """Same as wait_for_app_idle for pages of the async fixtures"""
+    try:
+        result = await page.evaluate(APP_IDLE_SCRIPT, {"quietMs": APP_IDLE_QUIET_WINDOW, "timeoutMs": timeout})
+
+    except Exception as e:
+        logging.debug(f"App idle wait interrupted: {e}")
+        return {"tracked": False}
+
+    _record_idle_latency(result, step)
+    return result
+
+
+def _record_idle_latency(result: dict, step: str) -> None:
+    if result["tracked"]:
+        _idle_latencies.append({"step": step, "elapsed_ms": round(result["elapsed"]), "idle": result["idle"]})
+        logging.info(f"App network idle after {result['elapsed']:.0f}ms ({step})")
+
+
+def pop_idle_latencies() -> list[dict]:
+    """Idle waits recorded since the previous call (one test phase)"""
+    latencies = _idle_latencies.copy()
+    _idle_latencies.clear()
+    return latencies
@@ -0,0 +1,164 @@
+"""
+Token bucket rate limiter shared between xdist workers through a lock-protected state file.
+
+Concurrent pytest runs (e.g. test-pixels-update-parallel) point RATE_LIMIT_DIR at the same directory
+and share one budget - the server limits them together. Each run registers with start_session(),
+the state is reset only when no other run is live.
+"""
+
+import json
+import logging
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+
+from utils.file_lock import file_lock
+
+RATE_LIMIT_DIR = Path(os.getenv("RATE_LIMIT_DIR", "reports/.rate_limit"))
+
+
+class TokenBucketRateLimiter:
+    """
+    Token bucket with state in `{state_dir}/{name}.json`, so all processes share one budget.
+
+    Args:
+        name: Bucket name (one bucket per server-side limiter)
+        rate: Tokens added per second
+        burst: Bucket capacity - how many calls may go without waiting
+        state_dir: Directory for bucket state and lock files
+    """
+
+    def __init__(self, name: str, rate: float, burst: int, state_dir: Path = RATE_LIMIT_DIR):
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+
+        self.name = name
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.state_file = state_dir / f"{name}.json"
+        self.lock_file = state_dir / f"{name}.lock"
+
+    def _read_state(self, now: float) -> dict:
+        state = {}
+        if self.state_file.exists():
+            try:
+                state = json.loads(self.state_file.read_text(encoding="utf-8"))
+
+            except (OSError, ValueError) as e:
+                logging.debug(f"Failed to read rate limiter state (resetting): {e}")
+
+        state.setdefault("tokens", float(self.burst))
+        state.setdefault("updated_at", now)
+        state.setdefault("metrics", {"acquired": 0, "waited": 0, "total_wait": 0.0, "max_wait": 0.0})
+
+        # Refill tokens for the time passed since last update
+        elapsed = max(now - state["updated_at"], 0.0)
+        state["tokens"] = min(float(self.burst), state["tokens"] + elapsed * self.rate)
+        state["updated_at"] = now
+
+        return state
+
+    def _write_state(self, state: dict) -> None:
+        tmp_file = self.state_file.with_suffix(".tmp")
+        tmp_file.write_text(json.dumps(state), encoding="utf-8")
+        tmp_file.replace(self.state_file)
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available. Returns wait time in seconds"""
+        started_at = time.monotonic()
+
+        while True:
+            with file_lock(self.lock_file):
+                state = self._read_state(time.time())
+
+                if state["tokens"] >= 1:
+                    state["tokens"] -= 1
+                    waited = time.monotonic() - started_at
+                    self._record_metrics(state["metrics"], waited)
+                    self._write_state(state)
+                    return waited
+
+                sleep_time = (1 - state["tokens"]) / self.rate
+                self._write_state(state)
+
+            time.sleep(sleep_time)
+
+    def _record_metrics(self, metrics: dict, waited: float) -> None:
+        metrics["acquired"] += 1
+        metrics["total_wait"] += waited
+        metrics["max_wait"] = max(metrics["max_wait"], waited)
+
+        # Ignore lock overhead, count only real waits for a token
+        if waited >= 0.01:
+            metrics["waited"] += 1
+            logging.info(f"Rate limiter '{self.name}': waited {waited:.2f}s for a token")
+
+    def get_metrics(self) -> dict:
+        """Wait-time metrics accumulated by all processes"""
+        with file_lock(self.lock_file):
+            metrics = self._read_state(time.time())["metrics"]
+
+        acquired = metrics["acquired"]
+        return {
+            **metrics,
+            "avg_wait": metrics["total_wait"] / acquired if acquired else 0.0,
+        }
+
+    def reset(self) -> None:
+        with file_lock(self.lock_file):
+            self.state_file.unlink(missing_ok=True)
+
+    def start_session(self) -> None:
+        """
+        Register this run. Tokens and metrics are reset only when no other live run uses the bucket,
+        a run starting next to a live one keeps its remaining budget.
+        """
+        with file_lock(self.lock_file):
+            state = self._read_state(time.time())
+            sessions = [pid for pid in state.get("sessions", []) if pid != os.getpid() and _is_process_alive(pid)]
+
+            if not sessions:
+                self.state_file.unlink(missing_ok=True)
+                state = self._read_state(time.time())
+
+            else:
+                logging.info(f"Rate limiter '{self.name}': sharing bucket with {len(sessions)} live runs")
+
+            state["sessions"] = sessions + [os.getpid()]
+            self._write_state(state)
+
+    def end_session(self) -> None:
+        """Unregister this run, state stays for the terminal summary and other runs"""
+        with file_lock(self.lock_file):
+            state = self._read_state(time.time())
+            state["sessions"] = [pid for pid in state.get("sessions", []) if pid != os.getpid()]
+            self._write_state(state)
+
+
+def _is_process_alive(pid: int) -> bool:
+    """Runs that crashed without end_session() don't hold the bucket"""
+    try:
+        os.kill(pid, 0)
+
+    except ProcessLookupError:
+        return False
+
+    except PermissionError:
+        # Exists, owned by another user
+        pass
+
+    return True
+
+
+@lru_cache(maxsize=None)
+def get_auth_rate_limiter() -> TokenBucketRateLimiter:
+    """
+    Limiter for /api-v1/auth/ calls: registration, login and OTP submission.
+
+    Configured with AUTH_RATE_LIMIT (tokens per second, default 1) and AUTH_RATE_BURST (default 1).
+    """
+    rate = float(os.getenv("AUTH_RATE_LIMIT", "1.0"))
+    burst = int(os.getenv("AUTH_RATE_BURST", "1"))
+
+    return TokenBucketRateLimiter("auth", rate=rate, burst=burst)
@@ -0,0 +1,171 @@
+"""Request-blocking profile for functional tests: analytics, fonts, media and third-party resources"""
+
+import json
+import logging
+import os
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlparse
+
+from playwright.async_api import BrowserContext as AsyncBrowserContext
+from playwright.async_api import Route as AsyncRoute
+from playwright.sync_api import BrowserContext, Request, Response, Route
+
+from utils.file_lock import file_lock
+
+DEFAULT_BLOCKED_RESOURCE_TYPES = "image,media,font"
+
+DEFAULT_BLOCKED_DOMAINS = (
+    "google-analytics.com,googletagmanager.com,doubleclick.net,mc.yandex.ru,mc.yandex.com,"
+    "top-fwz1.mail.ru,vk.com/rtrg,connect.facebook.net,facebook.com/tr,hotjar.com,clarity.ms,"
+    "jivosite.com,jivo.ru,fonts.googleapis.com,fonts.gstatic.com"
+)
+
+# Images are stubbed instead of aborted - broken <img> elements have zero size and fail visibility checks
+STUBBED_RESOURCE_TYPES = {"image"}
+TRANSPARENT_GIF = bytes.fromhex("47494638396101000100800000000000ffffff21f90401000000002c00000000010001000002024401003b")
+
+SIZES_FILE = Path(os.getenv("REQUEST_SIZES_FILE", "reports/.request_blocking/sizes.json"))
+
+
+def _split_env(name: str, default: str) -> list[str]:
+    return [value.strip().lower() for value in os.getenv(name, default).split(",") if value.strip()]
+
+
+class RequestBlocker:
+    """
+    Context route that aborts or stubs non-essential requests while a functional test runs.
+
+    Blocking is switched per test with start_test(), so one session context serves both
+    functional and pixel tests. Bytes saved are counted from Content-Length of the same URLs
+    seen unblocked (in pixel tests or previous runs) - sizes of never-seen URLs stay unknown.
+    """
+
+    def __init__(self, resource_types: list[str], domains: list[str], sizes_file: Path = SIZES_FILE):
+        self.resource_types = set(resource_types)
+        self.domains = domains
+        self.sizes_file = sizes_file
+        self.sizes = self._load_sizes()
+        self.active = False
+        self._reset_stats()
+
+    def _load_sizes(self) -> dict:
+        try:
+            return json.loads(self.sizes_file.read_text(encoding="utf-8"))
+
+        except (OSError, ValueError):
+            return {}
+
+    def _reset_stats(self) -> None:
+        self.blocked_requests = 0
+        self.bytes_saved = 0
+        self.unknown_sizes = 0
+        self.blocked_by_type = Counter()
+
+    def attach(self, context: BrowserContext) -> None:
+        context.route("**/*", self._handle_route)
+        context.on("response", self._remember_size)
+
+    async def attach_async(self, context: AsyncBrowserContext) -> None:
+        """Same as attach for contexts of the async fixtures"""
+        await context.route("**/*", self._handle_route_async)
+        context.on("response", self._remember_size)
+
+    def _is_blocked_domain(self, url: str) -> bool:
+        parsed = urlparse(url)
+        host_and_path = f"{parsed.hostname or ''}{parsed.path}".lower()
+        return any(domain in host_and_path for domain in self.domains)
+
+    def should_block(self, request: Request) -> bool:
+        return request.resource_type in self.resource_types or self._is_blocked_domain(request.url)
+
+    def _block_action(self, request: Request) -> str | None:
+        """Returns "stub" or "abort" for a request blocked in this test (counted in stats), None to let it through"""
+        if not self.active or not self.should_block(request):
+            return None
+
+        self._record(request)
+        return "stub" if request.resource_type in STUBBED_RESOURCE_TYPES else "abort"
+
+    def _handle_route(self, route: Route) -> None:
+        action = self._block_action(route.request)
+
+        if action == "stub":
+            route.fulfill(status=200, content_type="image/gif", body=TRANSPARENT_GIF)
+
+        elif action == "abort":
+            route.abort("blockedbyclient")
+
+        else:
+            route.fallback()
+
+    async def _handle_route_async(self, route: AsyncRoute) -> None:
+        action = self._block_action(route.request)
+
+        if action == "stub":
+            await route.fulfill(status=200, content_type="image/gif", body=TRANSPARENT_GIF)
+
+        elif action == "abort":
+            await route.abort("blockedbyclient")
+
+        else:
+            await route.fallback()
+
+    def _record(self, request: Request) -> None:
+        self.blocked_requests += 1
+        self.blocked_by_type[request.resource_type] += 1
+
+        size = self.sizes.get(request.url)
+        if size is None:
+            self.unknown_sizes += 1
+        else:
+            self.bytes_saved += size
+
+    def _remember_size(self, response: Response) -> None:
+        content_length = response.headers.get("content-length", "")
+        if content_length.isdigit() and self.should_block(response.request):
+            self.sizes[response.url] = int(content_length)
+
+    def start_test(self, active: bool) -> None:
+        self._reset_stats()
+        self.active = active
+
+    def get_stats(self) -> dict:
+        return {
+            "blocked_requests": self.blocked_requests,
+            "bytes_saved": self.bytes_saved,
+            "unknown_sizes": self.unknown_sizes,
+            "blocked_by_type": dict(self.blocked_by_type),
+        }
+
+    def save_sizes(self) -> None:
+        """Merge learned resource sizes into shared file for next runs"""
+        if not self.sizes:
+            return
+
+        with file_lock(self.sizes_file.with_suffix(".lock")):
+            sizes = self._load_sizes()
+            sizes.update(self.sizes)
+
+            tmp_file = self.sizes_file.with_suffix(".tmp")
+            tmp_file.write_text(json.dumps(sizes), encoding="utf-8")
+            tmp_file.replace(self.sizes_file)
+
+
+@lru_cache(maxsize=None)
+def get_request_blocker() -> RequestBlocker | None:
+    """
+    Process-wide blocker, None unless BLOCK_REQUESTS=true.
+
+    Profile is configured with BLOCK_RESOURCE_TYPES and BLOCK_DOMAINS (comma-separated,
+    domain entries may include a path prefix like vk.com/rtrg).
+    """
+    if os.getenv("BLOCK_REQUESTS", "false").lower() != "true":
+        return None
+
+    resource_types = _split_env("BLOCK_RESOURCE_TYPES", DEFAULT_BLOCKED_RESOURCE_TYPES)
+    domains = _split_env("BLOCK_DOMAINS", DEFAULT_BLOCKED_DOMAINS)
+    logging.info(f"Request blocking enabled: types={resource_types}, domains={domains}")
+
+    return RequestBlocker(resource_types, domains)
@@ -0,0 +1,96 @@
+"""
+Per-test ring buffer for step screenshots.
+
+attach_screenshot and attach_element_screenshot keep images in memory instead of attaching
+them right away. conftest attaches the buffer when the test fails, passing tests write nothing.
+
+    SCREENSHOT_BUFFER          true (default) | false - attach immediately as before
+    SCREENSHOT_BUFFER_SIZE     screenshots kept per test, oldest are dropped (default 20)
+    SCREENSHOT_BUFFER_MAX_MB   memory cap per test (default 50)
+"""
+
+import logging
+import os
+from collections import deque
+from dataclasses import dataclass
+
+from utils.attachment_store import attach_content
+
+
+@dataclass
+class BufferedScreenshot:
+    body: bytes
+    name: str
+    mime_type: str
+    extension: str
+
+
+class ScreenshotBuffer:
+    """Keeps the last screenshots of a test within count and bytes limits"""
+
+    def __init__(self, max_count: int, max_bytes: int):
+        self.max_count = max_count
+        self.max_bytes = max_bytes
+        self.screenshots = deque()
+        self.size = 0
+        self.dropped = 0
+        self.total = 0
+
+    def add(self, screenshot: BufferedScreenshot) -> None:
+        self.total += 1
+        self.screenshots.append(screenshot)
+        self.size += len(screenshot.body)
+
+        # Newest screenshot is kept even if it alone exceeds the bytes cap
+        while len(self.screenshots) > 1 and (len(self.screenshots) > self.max_count or self.size > self.max_bytes):
+            dropped = self.screenshots.popleft()
+            self.size -= len(dropped.body)
+            self.dropped += 1
+
+    def clear(self) -> None:
+        self.screenshots.clear()
+        self.size = 0
+        self.dropped = 0
+        self.total = 0
+
+    def flush(self) -> int:
+        """Attach buffered screenshots to the current Allure test in capture order"""
+        flushed = len(self.screenshots)
+        first_number = self.total - flushed + 1
+
+        for number, screenshot in enumerate(self.screenshots, start=first_number):
+            attach_content(
+                screenshot.body,
+                name=f"[{number}/{self.total}] {screenshot.name}",
+                attachment_type=screenshot.mime_type,
+                extension=screenshot.extension
+            )
+
+        if self.dropped:
+            logging.info(f"Screenshot buffer dropped {self.dropped} oldest screenshots")
+
+        self.clear()
+        return flushed
+
+
+def is_screenshot_buffer_enabled() -> bool:
+    return os.getenv("SCREENSHOT_BUFFER", "true").lower() == "true"
+
+
+_buffer = ScreenshotBuffer(
+    max_count=int(os.getenv("SCREENSHOT_BUFFER_SIZE", "20")),
+    max_bytes=int(float(os.getenv("SCREENSHOT_BUFFER_MAX_MB", "50")) * 1024 * 1024),
+)
+
+
+def buffer_screenshot(body: bytes, name: str, mime_type: str = "image/png", extension: str = "png") -> None:
+    _buffer.add(BufferedScreenshot(body, name, mime_type, extension))
+
+
+def flush_screenshot_buffer() -> int:
+    """Attach buffered screenshots (call on test failure), returns number attached"""
+    return _buffer.flush()
+
+
+def clear_screenshot_buffer() -> None:
+    _buffer.clear()
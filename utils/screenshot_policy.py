@@ -0,0 +1,165 @@
+"""
+Screenshot policy for attach_screenshot: whether step screenshots are taken and how.
+
+Configured per CI job with env variables and per test with the `screenshots` marker:
+
+    SCREENSHOT_MODE     full (default) | viewport | on-failure | off
+    SCREENSHOT_FORMAT   png (default) | jpeg | webp (webp needs Pillow, falls back to jpeg)
+    SCREENSHOT_QUALITY  1-100 for jpeg/webp (default 80)
+    SCREENSHOT_SCALE    device (default) | css - css captures HiDPI devices at 1x
+    SCREENSHOT_MAX_WIDTH  downscale wider images to this width, needs Pillow (default 0 - off)
+    SCREENSHOT_EVERY    capture every N-th step screenshot of a test (default 1 - all)
+
+    @pytest.mark.screenshots(mode="viewport", image_format="jpeg", every=3)
+
+Failure artifacts captured in conftest are not affected - on-failure mode relies on them.
+"""
+
+import dataclasses
+import io
+import logging
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+from playwright.sync_api import Page
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+MODES = ("full", "viewport", "on-failure", "off")
+FORMATS = ("png", "jpeg", "webp")
+SCALES = ("device", "css")
+
+MIME_TYPES = {"png": "image/png", "jpeg": "image/jpeg", "webp": "image/webp"}
+
+
+@dataclass(frozen=True)
+class ScreenshotPolicy:
+    mode: str = "full"
+    image_format: str = "png"
+    quality: int = 80
+    scale: str = "device"
+    max_width: int = 0
+    every: int = 1
+
+    def __post_init__(self):
+        if self.mode not in MODES:
+            raise ValueError(f"Unknown screenshot mode '{self.mode}', expected one of {MODES}")
+
+        if self.image_format not in FORMATS:
+            raise ValueError(f"Unknown screenshot format '{self.image_format}', expected one of {FORMATS}")
+
+        if self.scale not in SCALES:
+            raise ValueError(f"Unknown screenshot scale '{self.scale}', expected one of {SCALES}")
+
+        if not 1 <= self.quality <= 100:
+            raise ValueError(f"Screenshot quality must be 1-100, got {self.quality}")
+
+        if self.every < 1:
+            raise ValueError(f"Screenshot sampling must be >= 1, got {self.every}")
+
+    @classmethod
+    def from_env(cls) -> "ScreenshotPolicy":
+        return cls(
+            mode=os.getenv("SCREENSHOT_MODE", "full").lower(),
+            image_format=os.getenv("SCREENSHOT_FORMAT", "png").lower().replace("jpg", "jpeg"),
+            quality=int(os.getenv("SCREENSHOT_QUALITY", "80")),
+            scale=os.getenv("SCREENSHOT_SCALE", "device").lower(),
+            max_width=int(os.getenv("SCREENSHOT_MAX_WIDTH", "0")),
+            every=int(os.getenv("SCREENSHOT_EVERY", "1")),
+        )
+
+    @property
+    def captures_steps(self) -> bool:
+        return self.mode in ("full", "viewport")
+
+
+_default_policy = ScreenshotPolicy.from_env()
+_current_policy = _default_policy
+_step_counter = 0
+
+
+def start_test_policy(marker_kwargs: dict | None = None) -> ScreenshotPolicy:
+    """Reset sampling for a new test and apply its `screenshots` marker overrides on top of env policy"""
+    global _current_policy, _step_counter
+
+    _current_policy = dataclasses.replace(_default_policy, **marker_kwargs) if marker_kwargs else _default_policy
+    _step_counter = 0
+    return _current_policy
+
+
+def get_screenshot_policy() -> ScreenshotPolicy:
+    return _current_policy
+
+
+def should_capture_step() -> bool:
+    """Count the step screenshot request and tell whether the policy takes it"""
+    global _step_counter
+
+    if not _current_policy.captures_steps:
+        return False
+
+    _step_counter += 1
+    return (_step_counter - 1) % _current_policy.every == 0
+
+
+@lru_cache(maxsize=None)
+def _warn_pillow_missing() -> None:
+    logging.warning("Pillow is not installed - WebP is captured as JPEG and SCREENSHOT_MAX_WIDTH is ignored")
+
+
+def _convert(screenshot_bytes: bytes, policy: ScreenshotPolicy) -> bytes:
+    """Downscale and/or encode as WebP with Pillow"""
+    image = Image.open(io.BytesIO(screenshot_bytes))
+
+    if policy.max_width and image.width > policy.max_width:
+        height = round(image.height * policy.max_width / image.width)
+        image = image.resize((policy.max_width, height), Image.LANCZOS)
+
+    output = io.BytesIO()
+
+    if policy.image_format == "png":
+        image.save(output, format="PNG", optimize=True)
+
+    else:
+        image.convert("RGB").save(output, format=policy.image_format.upper(), quality=policy.quality)
+
+    return output.getvalue()
+
+
+def capture_screenshot(page: Page, full_page: bool, timeout: int, policy: ScreenshotPolicy | None = None) -> tuple[bytes, str, str]:
+    """
+    Take screenshot according to policy.
+
+    Returns:
+        (image bytes, MIME type, file extension)
+    """
+    policy = policy or _current_policy
+    image_format = policy.image_format
+    needs_pillow = image_format == "webp" or policy.max_width > 0
+
+    if needs_pillow and Image is None:
+        _warn_pillow_missing()
+        image_format = "jpeg" if image_format == "webp" else image_format
+        needs_pillow = False
+
+    options = {
+        "full_page": full_page and policy.mode != "viewport",
+        "timeout": timeout,
+        "scale": policy.scale,
+        # Pillow re-encodes anyway - capture lossless
+        "type": "png" if needs_pillow or image_format == "png" else "jpeg",
+    }
+
+    if options["type"] == "jpeg":
+        options["quality"] = policy.quality
+
+    screenshot_bytes = page.screenshot(**options)
+
+    if needs_pillow:
+        screenshot_bytes = _convert(screenshot_bytes, dataclasses.replace(policy, image_format=image_format))
+
+    return screenshot_bytes, MIME_TYPES[image_format], "jpg" if image_format == "jpeg" else image_format
@@ -0,0 +1,143 @@
+"""
+Manifest of reference snapshots: content hash per file, dimensions and perceptual hash
+when the pHash pre-filter asks for them (VISUAL_DIFF_PHASH_FAIL_DISTANCE).
+
+Stored in `{references}/.manifest.json` keyed by path relative to references dir
+(`test_home_page_pixels/test_header/chromium-desktop-test_header.png`). Entries are checked
+against the file content hash, so references updated or downloaded from CI are re-indexed
+on first use. Workers merge their entries under a file lock at session end.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+from utils.file_lock import file_lock
+from utils.visual_diff import decode_png, perceptual_hash
+
+MANIFEST_FILE_NAME = ".manifest.json"
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class SnapshotManifest:
+
+    def __init__(self, references_dir: Path):
+        self.references_dir = references_dir
+        self.manifest_file = references_dir / MANIFEST_FILE_NAME
+        self.entries = self._load()
+        self.updated = {}
+        self._names = None
+
+    def _load(self) -> dict:
+        try:
+            return json.loads(self.manifest_file.read_text(encoding="utf-8"))
+
+        except (OSError, ValueError):
+            return {}
+
+    def _key(self, path: Path) -> str:
+        return path.relative_to(self.references_dir).as_posix()
+
+    def _get_names(self) -> dict[str, list[Path]]:
+        """Snapshot file name -> reference paths, scanned once per process"""
+        if self._names is None:
+            self._names = {}
+            for path in sorted(self.references_dir.glob("*/*/*.png")):
+                self._names.setdefault(path.name, []).append(path)
+
+        return self._names
+
+    def find(self, module_dir: str, snapshot_name: str, prefix: str = "") -> Path | None:
+        """
+        Reference in module dir by snapshot file name ({browser}-{viewport}-{title}.png)
+        or by test name (test_header.png) - then the one starting with prefix is preferred.
+        """
+        for path in self._get_names().get(snapshot_name, []):
+            if path.parent.parent.name == module_dir:
+                return path
+
+        test_dir = self.references_dir / module_dir / snapshot_name.removesuffix(".png")
+        candidates = [
+            path for paths in self._get_names().values() for path in paths
+            if path.parent == test_dir
+        ]
+        preferred = [path for path in candidates if path.name.startswith(prefix)]
+
+        return (preferred or candidates or [None])[0]
+
+    def get_entry(self, path: Path, data: bytes | None = None, with_phash: bool = False) -> dict:
+        """
+        Entry for reference file, (re)computed when the file content changed.
+        Reference is decoded for dimensions and perceptual hash only when with_phash is set.
+        """
+        data = data if data is not None else path.read_bytes()
+        sha256 = content_hash(data)
+        key = self._key(path)
+
+        entry = self.entries.get(key)
+        if not entry or entry["sha256"] != sha256:
+            entry = {"name": path.name, "sha256": sha256}
+
+        elif not with_phash or "phash" in entry:
+            return entry
+
+        if with_phash:
+            image = decode_png(data)
+            entry = {
+                **entry,
+                "width": image.shape[1],
+                "height": image.shape[0],
+                "phash": perceptual_hash(image),
+            }
+
+        self.entries[key] = entry
+        self.updated[key] = entry
+        return entry
+
+    def record(self, path: Path, data: bytes) -> dict:
+        """Index reference written in this session (created files are not in the name index yet)"""
+        if self._names is not None and path not in self._names.get(path.name, []):
+            self._names.setdefault(path.name, []).append(path)
+
+        return self.get_entry(path, data)
+
+    def save(self) -> None:
+        """Merge entries computed by this process into manifest file"""
+        if not self.updated:
+            return
+
+        try:
+            with file_lock(self.manifest_file.with_suffix(".lock")):
+                entries = self._load()
+                entries.update(self.updated)
+
+                tmp_file = self.manifest_file.with_suffix(".tmp")
+                tmp_file.write_text(json.dumps(entries, indent=2, sort_keys=True), encoding="utf-8")
+                tmp_file.replace(self.manifest_file)
+
+            self.updated = {}
+
+        except OSError as e:
+            logging.warning(f"Failed to save snapshot manifest {self.manifest_file}: {e}")
+
+
+_manifests: dict[str, SnapshotManifest] = {}
+
+
+def get_snapshot_manifest(references_dir: Path | str = "references") -> SnapshotManifest:
+    """Process-wide manifest for references dir"""
+    key = str(references_dir)
+    if key not in _manifests:
+        _manifests[key] = SnapshotManifest(Path(references_dir))
+
+    return _manifests[key]
+
+
+def save_snapshot_manifests() -> None:
+    """Save manifests used in this process (call at session end)"""
+    for manifest in _manifests.values():
+        manifest.save()
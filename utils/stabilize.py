@@ -0,0 +1,154 @@
+"""
+Deterministic page state for pixel captures.
+
+stabilize() is called right before each pixel capture. By default it only waits, without touching
+rendering: fonts and images decoded, pending app requests drained, two frames painted. The per-test
+scrolls, pointer moves and pauses the references were captured with stay in the tests.
+
+PIXEL_STABILIZE=true (opt-in) also freezes the page: animations and transitions are finished and
+frozen, carets and scrollbars hidden, lazy images loaded eagerly, pointer parked at (0, 0) and scroll
+position normalised (top of document, or region centred in viewport). That changes capture conditions -
+regenerate references with it (`PIXEL_STABILIZE=true just test-pixels-update-parallel`) before enabling
+it for comparisons. The injected style is removed by unstabilize() right after the capture
+(assert_snapshot fixtures do it), so it never affects later steps on the same page.
+"""
+
+import logging
+import os
+
+from playwright.sync_api import Locator, Page
+
+from config.timeouts import Timeouts
+
+STABILIZE_STYLE_ID = "__stabilize_style"
+
+
+STABILIZE_CSS = """
+*, *::before, *::after {
+    animation-duration: 0s !important;
+    animation-delay: 0s !important;
+    animation-iteration-count: 1 !important;
+    transition-duration: 0s !important;
+    transition-delay: 0s !important;
+    caret-color: transparent !important;
+    scroll-behavior: auto !important;
+    scrollbar-width: none !important;
+}
+::-webkit-scrollbar {
+    display: none !important;
+}
+"""
+
+STABILIZE_SCRIPT = """
+async ({region, freeze, styleId, css, timeoutMs}) => {
+    const startedAt = performance.now();
+    const withTimeout = (promise, ms) => Promise.race([promise, new Promise(resolve => setTimeout(resolve, ms))]);
+
+    if (freeze && !document.getElementById(styleId)) {
+        const style = document.createElement("style");
+        style.id = styleId;
+        style.textContent = css;
+        (document.head || document.documentElement).appendChild(style);
+    }
+
+    // Jump running animations to their end state, infinite ones (spinners) can only be cancelled
+    for (const animation of freeze && document.getAnimations ? document.getAnimations() : []) {
+        try {
+            animation.finish();
+        } catch (e) {
+            animation.cancel();
+        }
+    }
+
+    // Lazy images outside viewport would stay empty in full page and region captures
+    const root = region || document;
+    const images = Array.from(root.querySelectorAll("img"));
+    if (freeze) {
+        images.forEach(img => { if (img.loading === "lazy") img.loading = "eager"; });
+    }
+    // Without freeze lazy images outside viewport are never requested, waiting for them would only time out
+    const decoded = images.filter(img => freeze || img.loading !== "lazy" || img.complete);
+
+    await withTimeout(Promise.all([
+        document.fonts ? document.fonts.ready : Promise.resolve(),
+        ...decoded.map(img => img.decode().catch(() => null)),
+    ]), timeoutMs);
+
+    const activity = window.__appActivity;
+    while (activity && activity.pending > 0 && performance.now() - startedAt < timeoutMs) {
+        await new Promise(resolve => setTimeout(resolve, 25));
+    }
+
+    if (freeze && region) {
+        region.scrollIntoView({block: "center", inline: "nearest"});
+    } else if (freeze) {
+        window.scrollTo(0, 0);
+    }
+
+    // Two frames: styles above are applied and painted
+    await new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+
+    return {
+        elapsed: performance.now() - startedAt,
+        images: images.length,
+        brokenImages: images.filter(img => img.complete && img.naturalWidth === 0).length,
+        pendingRequests: activity ? activity.pending : null,
+    };
+}
+"""
+
+
+def is_stabilize_enabled() -> bool:
+    """PIXEL_STABILIZE=true freezes rendering before captures (references must be captured the same way)"""
+    return os.getenv("PIXEL_STABILIZE", "false").lower() == "true"
+
+
+def stabilize(page: Page, region: Locator | str | None = None, timeout: int = Timeouts.Visual.STABILIZE) -> dict:
+    """
+    Bring page into a capture-ready state (wait only unless PIXEL_STABILIZE=true).
+
+    Args:
+        page: Playwright page
+        region: Locator or selector of the captured element, None for page captures
+        timeout: Upper bound for fonts, images and app requests (ms)
+
+    Returns:
+        {"elapsed": ms, "images": n, "brokenImages": n, "pendingRequests": n | None}
+    """
+    freeze = is_stabilize_enabled()
+    if freeze:
+        # Park pointer so no element keeps hover state
+        page.mouse.move(0, 0)
+
+    region_handle = None
+    if region is not None:
+        locator = page.locator(region).first if isinstance(region, str) else region.first
+        region_handle = locator.element_handle(timeout=timeout)
+
+    try:
+        result = page.evaluate(STABILIZE_SCRIPT, {
+            "region": region_handle,
+            "freeze": freeze,
+            "styleId": STABILIZE_STYLE_ID,
+            "css": STABILIZE_CSS,
+            "timeoutMs": timeout,
+        })
+
+    finally:
+        if region_handle:
+            region_handle.dispose()
+
+    if result["brokenImages"] or result["pendingRequests"]:
+        logging.warning(
+            f"Page not fully stable after {result['elapsed']:.0f}ms: "
+            f"{result['brokenImages']} broken images, {result['pendingRequests']} pending requests"
+        )
+    else:
+        logging.debug(f"Page stabilized in {result['elapsed']:.0f}ms ({result['images']} images)")
+
+    return result
+
+
+def unstabilize(page: Page) -> None:
+    """Remove capture-only style injected by stabilize() (animations, carets and scrollbars are back)"""
+    page.evaluate("styleId => document.getElementById(styleId)?.remove()", STABILIZE_STYLE_ID)
@@ -0,0 +1,77 @@
+"""
+Switch a loaded page between VIEWPORTS devices without a new context or navigation.
+
+Viewport size alone is not enough for responsive snapshots: references of mobile and tablet are
+captured with device scale factor, mobile meta viewport handling, touch and user agent of the device.
+Chromium applies them to a running page through DevTools emulation: navigator.userAgent and requests
+made after the switch (lazy content, API calls) carry the device user agent. Markup the server chose
+by user agent for the initial load is not rendered again.
+"""
+
+import logging
+
+from playwright.sync_api import Page, Playwright
+
+from config.devices_config import get_device_config
+from config.viewports import VIEWPORTS
+
+
+def supports_viewport_emulation(page: Page) -> bool:
+    """DevTools emulation is available in Chromium only"""
+    return page.context.browser is not None and page.context.browser.browser_type.name == "chromium"
+
+
+class ViewportEmulation:
+    """
+    Emulates VIEWPORTS devices on a page, restores the context device on exit.
+
+    Usage:
+        with ViewportEmulation(page, playwright, "desktop") as emulation:
+            for viewport in VIEWPORTS:
+                emulation.apply(viewport)
+                ...
+    """
+
+    def __init__(self, page: Page, playwright: Playwright, context_device: str):
+        self.page = page
+        self.playwright = playwright
+        self.context_device = get_device_config(playwright, context_device)
+        self.original_viewport = page.viewport_size
+        self.original_user_agent = None
+        self.session = None
+
+    def __enter__(self):
+        self.session = self.page.context.new_cdp_session(self.page)
+        self.original_user_agent = self.page.evaluate("navigator.userAgent")
+        return self
+
+    def apply(self, viewport_name: str) -> None:
+        device = get_device_config(self.playwright, viewport_name)
+        viewport = VIEWPORTS[viewport_name]
+
+        # Playwright keeps its own viewport size for screenshots and scrolling in sync
+        self.page.set_viewport_size(viewport)
+        self.session.send("Emulation.setDeviceMetricsOverride", {
+            "width": viewport["width"],
+            "height": viewport["height"],
+            "deviceScaleFactor": device.get("device_scale_factor", 1),
+            "mobile": device.get("is_mobile", False),
+        })
+        self.session.send("Emulation.setTouchEmulationEnabled", {"enabled": device.get("has_touch", False)})
+        self.session.send("Emulation.setUserAgentOverride", {
+            "userAgent": device.get("user_agent") or self.original_user_agent,
+        })
+
+    def __exit__(self, *exc_info):
+        try:
+            self.session.send("Emulation.setTouchEmulationEnabled", {"enabled": self.context_device.get("has_touch", False)})
+            self.session.send("Emulation.setUserAgentOverride", {"userAgent": self.original_user_agent})
+            self.session.send("Emulation.clearDeviceMetricsOverride")
+            self.session.detach()
+
+        except Exception as e:
+            logging.warning(f"Failed to reset viewport emulation: {e}")
+
+        # Playwright re-applies emulation of the context device
+        if self.original_viewport:
+            self.page.set_viewport_size(self.original_viewport)
@@ -0,0 +1,393 @@
+"""
+Vectorised screenshot comparison for pixel tests.
+
+Colour distance follows pixelmatch (YIQ delta, `threshold` 0-1 is the same sensitivity the
+pytest-playwright-visual-snapshot plugin uses), so existing thresholds keep their meaning.
+Only pixels that differ at all are converted to YIQ, which keeps full-page mobile screenshots cheap.
+
+Benchmark against the plugin comparison on references/:
+
+    python -m utils.visual_diff references
+"""
+
+import io
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+# pixelmatch: maximum possible YIQ delta between two colours
+MAX_YIQ_DELTA = 35215
+
+# pixelmatch visits neighbours column by column, the first of equal extremes wins
+NEIGHBOUR_OFFSETS = [(dy, dx) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dy or dx]
+
+DIFF_COLOR = (255, 0, 0, 255)
+ANTIALIASED_COLOR = (255, 255, 0, 255)
+
+
+@dataclass
+class DiffResult:
+    mismatched: int
+    antialiased: int
+    total: int
+    diff_image: np.ndarray | None = None
+
+    @property
+    def ratio(self) -> float:
+        return self.mismatched / self.total if self.total else 0.0
+
+
+def decode_png(data: bytes) -> np.ndarray:
+    """PNG bytes -> RGBA uint8 array (height, width, 4)"""
+    return np.asarray(Image.open(io.BytesIO(data)).convert("RGBA"))
+
+
+def encode_png(image: np.ndarray) -> bytes:
+    output = io.BytesIO()
+    Image.fromarray(image).save(output, format="PNG")
+    return output.getvalue()
+
+
+def _dct_matrix(size: int) -> np.ndarray:
+    """Orthonormal DCT-II matrix"""
+    n = np.arange(size)
+    matrix = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * size)) * np.sqrt(2 / size)
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+
+_DCT_32 = _dct_matrix(32)
+
+
+def perceptual_hash(image: np.ndarray) -> str:
+    """64-bit pHash (low frequencies of 32x32 grayscale DCT) as hex string"""
+    gray = Image.fromarray(image).convert("L").resize((32, 32), Image.LANCZOS)
+    dct = _DCT_32 @ np.asarray(gray, dtype=np.float64) @ _DCT_32.T
+
+    low_frequencies = dct[:8, :8].flatten()
+    bits = low_frequencies > np.median(low_frequencies[1:])
+    return f"{int(''.join('1' if bit else '0' for bit in bits), 2):016x}"
+
+
+def hash_distance(hash1: str, hash2: str) -> int:
+    """Number of differing bits between two perceptual hashes"""
+    return bin(int(hash1, 16) ^ int(hash2, 16)).count("1")
+
+
+def _to_yiq(pixels: np.ndarray) -> np.ndarray:
+    """RGBA pixels (n, 4) blended over white -> YIQ (n, 3)"""
+    pixels = pixels.astype(np.float32)
+    alpha = pixels[:, 3:4] / 255
+    rgb = 255 + (pixels[:, :3] - 255) * alpha
+
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    return np.stack([
+        r * 0.29889531 + g * 0.58662247 + b * 0.11448223,
+        r * 0.59597799 - g * 0.27417610 - b * 0.32180189,
+        r * 0.21147017 - g * 0.52261711 + b * 0.31114694,
+    ], axis=1)
+
+
+def _color_delta(pixels1: np.ndarray, pixels2: np.ndarray) -> np.ndarray:
+    """pixelmatch colour delta for pixel pairs (n, 4)"""
+    delta = _to_yiq(pixels1) - _to_yiq(pixels2)
+    return 0.5053 * delta[:, 0] ** 2 + 0.299 * delta[:, 1] ** 2 + 0.1957 * delta[:, 2] ** 2
+
+
+def _brightness(pixels: np.ndarray) -> np.ndarray:
+    """Y of RGBA pixels (n, 4) blended over white"""
+    return _to_yiq(pixels)[:, 0]
+
+
+def _neighbours(image: np.ndarray, ys: np.ndarray, xs: np.ndarray):
+    """Yields (inside image mask, neighbour pixels) for every 1px offset of the points"""
+    height, width = image.shape[:2]
+
+    for dy, dx in NEIGHBOUR_OFFSETS:
+        neighbour_ys, neighbour_xs = ys + dy, xs + dx
+        inside = (neighbour_ys >= 0) & (neighbour_ys < height) & (neighbour_xs >= 0) & (neighbour_xs < width)
+        yield (dy, dx), inside, image[neighbour_ys.clip(0, height - 1), neighbour_xs.clip(0, width - 1)]
+
+
+def _on_edge(image: np.ndarray, ys: np.ndarray, xs: np.ndarray) -> np.ndarray:
+    height, width = image.shape[:2]
+    return (xs == 0) | (xs == width - 1) | (ys == 0) | (ys == height - 1)
+
+
+def _has_many_siblings(image: np.ndarray, ys: np.ndarray, xs: np.ndarray) -> np.ndarray:
+    """pixelmatch hasManySiblings: more than 2 identical neighbours (image edge counts as one)"""
+    siblings = _on_edge(image, ys, xs).astype(np.int8)
+    pixels = image[ys, xs]
+
+    for _, inside, neighbours in _neighbours(image, ys, xs):
+        siblings += inside & np.all(neighbours == pixels, axis=1)
+
+    return siblings > 2
+
+
+def _antialiased(image: np.ndarray, other: np.ndarray, ys: np.ndarray, xs: np.ndarray) -> np.ndarray:
+    """
+    pixelmatch antialiased() for points of image.
+
+    A pixel is anti-aliasing when it has at most 2 neighbours of equal brightness and both its
+    darkest and brightest neighbours exist, and the darkest or the brightest one sits in a flat
+    area (many identical siblings) in both images.
+    """
+    zeroes = _on_edge(image, ys, xs).astype(np.int8)
+    center = _brightness(image[ys, xs])
+
+    min_delta = np.zeros(len(ys))
+    max_delta = np.zeros(len(ys))
+    min_ys, min_xs = ys.copy(), xs.copy()
+    max_ys, max_xs = ys.copy(), xs.copy()
+
+    for (dy, dx), inside, neighbours in _neighbours(image, ys, xs):
+        delta = center - _brightness(neighbours)
+        zeroes += inside & (delta == 0)
+
+        darker = inside & (delta != 0) & (delta < min_delta)
+        brighter = inside & (delta != 0) & ~darker & (delta > max_delta)
+
+        min_delta[darker] = delta[darker]
+        min_ys[darker], min_xs[darker] = ys[darker] + dy, xs[darker] + dx
+        max_delta[brighter] = delta[brighter]
+        max_ys[brighter], max_xs[brighter] = ys[brighter] + dy, xs[brighter] + dx
+
+    antialiased = (zeroes <= 2) & (min_delta != 0) & (max_delta != 0)
+    if not antialiased.any():
+        return antialiased
+
+    candidates = np.nonzero(antialiased)[0]
+    min_points = (min_ys[candidates], min_xs[candidates])
+    max_points = (max_ys[candidates], max_xs[candidates])
+
+    antialiased[candidates] = (
+        (_has_many_siblings(image, *min_points) & _has_many_siblings(other, *min_points))
+        | (_has_many_siblings(image, *max_points) & _has_many_siblings(other, *max_points))
+    )
+    return antialiased
+
+
+def _build_diff_image(expected: np.ndarray, diff_points: tuple, antialiased_points: tuple) -> np.ndarray:
+    """Faded grayscale expected image with differences in red and anti-aliasing in yellow (like pixelmatch)"""
+    height, width = expected.shape[:2]
+    gray = _to_yiq(expected.reshape(-1, 4))[:, 0]
+    faded = (255 + (gray - 255) * 0.1).clip(0, 255).astype(np.uint8).reshape(height, width)
+
+    diff_image = np.empty((height, width, 4), dtype=np.uint8)
+    diff_image[..., :3] = faded[..., None]
+    diff_image[..., 3] = 255
+    diff_image[antialiased_points] = ANTIALIASED_COLOR
+    diff_image[diff_points] = DIFF_COLOR
+
+    return diff_image
+
+
+def compare_images(
+    actual: np.ndarray,
+    expected: np.ndarray,
+    threshold: float = 0.1,
+    channel_tolerance: int = 0,
+    antialiasing: bool = True,
+    masks: list[tuple[int, int, int, int]] | None = None,
+    with_diff_image: bool = True,
+) -> DiffResult:
+    """
+    Compare two RGBA images of the same size.
+
+    Args:
+        actual: Current screenshot
+        expected: Reference screenshot
+        threshold: Colour sensitivity 0-1 (pixelmatch threshold), bigger is more tolerant
+        channel_tolerance: Pixels whose every channel differs by at most this value (0-255) are equal
+        antialiasing: Ignore anti-aliased pixels (pixelmatch detection, includeAA=false)
+        masks: Rectangles (x, y, width, height) excluded from comparison
+        with_diff_image: Build diff image when there are differences
+    """
+    if actual.shape != expected.shape:
+        raise ValueError(f"Image sizes differ: {actual.shape[1]}x{actual.shape[0]} vs {expected.shape[1]}x{expected.shape[0]}")
+
+    if channel_tolerance:
+        differs = np.any(np.abs(actual.astype(np.int16) - expected.astype(np.int16)) > channel_tolerance, axis=2)
+    else:
+        differs = np.any(actual != expected, axis=2)
+
+    for x, y, width, height in masks or []:
+        differs[max(0, y):max(0, y + height), max(0, x):max(0, x + width)] = False
+
+    ys, xs = np.nonzero(differs)
+    max_delta = MAX_YIQ_DELTA * threshold * threshold
+
+    over_threshold = _color_delta(actual[ys, xs], expected[ys, xs]) > max_delta
+    ys, xs = ys[over_threshold], xs[over_threshold]
+
+    antialiased = np.zeros(len(ys), dtype=bool)
+    if antialiasing and len(ys):
+        antialiased = _antialiased(actual, expected, ys, xs) | _antialiased(expected, actual, ys, xs)
+
+    diff_points = (ys[~antialiased], xs[~antialiased])
+    antialiased_points = (ys[antialiased], xs[antialiased])
+    mismatched = len(diff_points[0])
+
+    diff_image = None
+    if with_diff_image and mismatched:
+        diff_image = _build_diff_image(expected, diff_points, antialiased_points)
+
+    return DiffResult(
+        mismatched=mismatched,
+        antialiased=int(antialiased.sum()),
+        total=differs.size,
+        diff_image=diff_image,
+    )
+
+
+def crop_to_common_size(actual: np.ndarray, expected: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Overlapping area of images of different sizes (diff image for playwright_visual_ignore_size_diff)"""
+    height = min(actual.shape[0], expected.shape[0])
+    width = min(actual.shape[1], expected.shape[1])
+    return actual[:height, :width], expected[:height, :width]
+
+
+@dataclass
+class SnapshotJob:
+    """Everything needed to compare a capture with its reference (picklable for process pool)"""
+    name: str
+    actual_bytes: bytes
+    expected_file: Path
+    failures_dir: Path
+    threshold: float = 0.1
+    channel_tolerance: int = 0
+    antialiasing: bool = True
+    masks: list[tuple[int, int, int, int]] | None = None
+    ignore_size_diff: bool = True
+    reference_size: tuple[int, int] | None = None
+    reference_phash: str | None = None
+    phash_fail_distance: int | None = None
+
+
+@dataclass
+class SnapshotResult:
+    name: str
+    passed: bool
+    message: str = ""
+
+
+def _save_failure_images(job: SnapshotJob, result: DiffResult, actual: np.ndarray, expected: np.ndarray) -> None:
+    job.failures_dir.mkdir(parents=True, exist_ok=True)
+    if result.diff_image is not None:
+        (job.failures_dir / f"diff_{job.name}").write_bytes(encode_png(result.diff_image))
+    (job.failures_dir / f"actual_{job.name}").write_bytes(encode_png(actual))
+    (job.failures_dir / f"expected_{job.name}").write_bytes(encode_png(expected))
+
+
+def compare_snapshot(job: SnapshotJob, mismatch_message: str = "Snapshots DO NOT match!") -> SnapshotResult:
+    """Compare capture with reference file, save diff/actual/expected into failures dir on mismatch"""
+    actual = decode_png(job.actual_bytes)
+
+    # pHash is a pre-filter only: clearly different capture fails without full diff, close one is still diffed
+    if job.phash_fail_distance is not None and job.reference_phash and (actual.shape[1], actual.shape[0]) == job.reference_size:
+        distance = hash_distance(perceptual_hash(actual), job.reference_phash)
+
+        if distance >= job.phash_fail_distance:
+            job.failures_dir.mkdir(parents=True, exist_ok=True)
+            (job.failures_dir / f"actual_{job.name}").write_bytes(job.actual_bytes)
+            (job.failures_dir / f"expected_{job.name}").write_bytes(job.expected_file.read_bytes())
+
+            return SnapshotResult(job.name, passed=False, message=(
+                f"{mismatch_message} {job.name}: perceptual hash differs by {distance} bits"
+            ))
+
+    expected = decode_png(job.expected_file.read_bytes())
+
+    if actual.shape != expected.shape:
+        size_message = (
+            f"{mismatch_message} {job.name}: size {actual.shape[1]}x{actual.shape[0]}, "
+            f"expected {expected.shape[1]}x{expected.shape[0]}"
+        )
+        # Size difference always fails, ignore_size_diff only builds the diff of the overlapping area
+        if not job.ignore_size_diff:
+            raise ValueError(size_message)
+
+        result = compare_images(
+            *crop_to_common_size(actual, expected),
+            threshold=job.threshold,
+            channel_tolerance=job.channel_tolerance,
+            antialiasing=job.antialiasing,
+            masks=job.masks,
+        )
+        _save_failure_images(job, result, actual, expected)
+
+        return SnapshotResult(job.name, passed=False, message=(
+            f"{size_message}, {result.mismatched} pixels of the overlapping area differ ({result.ratio:.2%})"
+        ))
+
+    result = compare_images(
+        actual,
+        expected,
+        threshold=job.threshold,
+        channel_tolerance=job.channel_tolerance,
+        antialiasing=job.antialiasing,
+        masks=job.masks,
+    )
+
+    if result.mismatched == 0:
+        return SnapshotResult(job.name, passed=True)
+
+    _save_failure_images(job, result, actual, expected)
+
+    return SnapshotResult(job.name, passed=False, message=(
+        f"{mismatch_message} {job.name}: {result.mismatched} pixels differ ({result.ratio:.2%})"
+    ))
+
+
+def _perturb(image: np.ndarray) -> np.ndarray:
+    """Reference copy with a changed block and noise, so both engines do a full comparison"""
+    changed = image.copy()
+    height, width = changed.shape[:2]
+    changed[height // 4:height // 2, width // 4:width // 2, :3] //= 2
+    changed[::7, ::5, 0] ^= 0x10
+    return changed
+
+
+def benchmark(references_dir: Path) -> None:
+    """Time numpy and plugin (pixelmatch) comparisons of every reference with its perturbed copy"""
+    try:
+        from pixelmatch.contrib.PIL import pixelmatch
+    except ImportError:
+        pixelmatch = None
+        print("pixelmatch is not installed - timing numpy engine only")
+
+    numpy_time = 0.0
+    plugin_time = 0.0
+    files = sorted(references_dir.rglob("*.png"))
+
+    for file in files:
+        expected = decode_png(file.read_bytes())
+        actual = _perturb(expected)
+
+        started_at = time.perf_counter()
+        result = compare_images(actual, expected, threshold=0.1)
+        numpy_elapsed = time.perf_counter() - started_at
+        numpy_time += numpy_elapsed
+
+        line = f"{file}: {expected.shape[1]}x{expected.shape[0]}, numpy {numpy_elapsed * 1000:.0f}ms ({result.mismatched} px)"
+
+        if pixelmatch:
+            diff = Image.new("RGBA", (expected.shape[1], expected.shape[0]))
+            started_at = time.perf_counter()
+            mismatched = pixelmatch(Image.fromarray(actual), Image.fromarray(expected), diff, threshold=0.1)
+            plugin_elapsed = time.perf_counter() - started_at
+            plugin_time += plugin_elapsed
+            line += f", pixelmatch {plugin_elapsed * 1000:.0f}ms ({mismatched} px)"
+
+        print(line)
+
+    print(f"\n{len(files)} references: numpy {numpy_time:.2f}s" + (f", pixelmatch {plugin_time:.2f}s" if pixelmatch else ""))
+
+
+if __name__ == "__main__":
+    benchmark(Path(sys.argv[1] if len(sys.argv) > 1 else "references"))